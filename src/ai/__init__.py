@@ -5,6 +5,7 @@ from src.ai.move_gen import (
     generate_multi_tile_moves,
     generate_all_moves,
     Move,
+    MoveCache,
 )
 from src.ai.solver import (
     Solver,
@@ -15,3 +16,8 @@ from src.ai.solver import (
     get_random_move,
     get_hint,
 )
+from src.ai.mcts_parallel import (
+    MonteCarloSolver,
+    run_rollouts,
+    select_move_parallel,
+)
@@ -0,0 +1,270 @@
+"""Root-parallel Monte Carlo move selection.
+
+Each worker process runs independent rollouts from the same root
+position and reports per-move statistics; the root merges them and
+picks the move with the best average outcome.
+
+Seed discipline: worker i seeds its RNG with ``seed ^ i`` so runs are
+reproducible for a given seed and worker count, and no two workers
+share a random stream.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import pickle
+import random
+from typing import Dict, List, Optional, Tuple
+
+from src.models.bag import Bag
+from src.models.hand import Hand
+from src.engine.game import GameState, apply_move, apply_swap
+from src.ai.move_gen import Move, _move_key
+from src.ai.solver import Solver, GreedySolver
+
+
+# Canonical, order-independent identifier for a move
+MoveKey = Tuple[int, ...]
+
+# Per-move rollout statistics: (visits, total score margin)
+RolloutStats = Dict[MoveKey, Tuple[int, float]]
+
+
+def move_key(move: Move) -> MoveKey:
+    """Return a hashable key identifying a move's placements.
+
+    Args:
+        move: The move.
+
+    Returns:
+        Sorted tuple of packed placements.
+    """
+    return _move_key(move)
+
+
+def _determinize(state: GameState, viewer: int, rng: random.Random) -> None:
+    """Re-deal the tiles the viewer cannot see.
+
+    The opponent's hand and the bag are pooled, shuffled, and dealt
+    back out in the same sizes.
+
+    Args:
+        state: Cloned state to modify in place.
+        viewer: Player whose information is kept.
+        rng: Random number generator.
+    """
+    opponent = 1 - viewer
+    opponent_size = len(state.hands[opponent])
+    hidden = state.hands[opponent].tiles() + state.bag.peek()
+    rng.shuffle(hidden)
+
+    state.hands[opponent] = Hand(hidden[:opponent_size])
+    state.bag = Bag.from_tiles(hidden[opponent_size:], rng)
+
+
+def _playout(state: GameState, solver: Solver, max_turns: int) -> None:
+    """Play a state forward until the game ends or max_turns is reached.
+
+    Args:
+        state: State to play out in place.
+        solver: Solver used for both players.
+        max_turns: Maximum turns to play.
+    """
+    turns = 0
+    while not state.game_over and turns < max_turns:
+        turns += 1
+        move = solver.get_move(state)
+        if move is not None and apply_move(state, move.placements)[0]:
+            continue
+        hand = state.hands[state.current_player]
+        if not state.bag.is_empty() and len(hand) > 0:
+            apply_swap(state, [hand.first_tile()])
+        else:
+            state.game_over = True
+
+
+def run_rollouts(
+    state_pickle: bytes,
+    n: int,
+    seed: int,
+    start: int = 0,
+    max_turns: int = 100
+) -> RolloutStats:
+    """Run rollouts from a pickled root position.
+
+    Root moves are visited round-robin starting at index ``start`` so
+    workers given different offsets spread their visits evenly.
+
+    Args:
+        state_pickle: Pickled (GameState, candidate moves) tuple.
+        n: Number of rollouts to run.
+        seed: Seed for this worker's RNG.
+        start: Index of the first root move to visit.
+        max_turns: Maximum turns per playout.
+
+    Returns:
+        Dict mapping move keys to (visits, total score margin) for the
+        player to move at the root.
+    """
+    state, moves = pickle.loads(state_pickle)
+    stats: RolloutStats = {}
+    if not moves:
+        return stats
+
+    viewer = state.current_player
+    rng = random.Random(seed)
+    solver = GreedySolver()
+
+    for i in range(n):
+        move = moves[(start + i) % len(moves)]
+        sim = state.clone()
+        _determinize(sim, viewer, rng)
+        apply_move(sim, move.placements)
+        _playout(sim, solver, max_turns)
+
+        margin = sim.scores[viewer] - sim.scores[1 - viewer]
+        key = move_key(move)
+        visits, total = stats.get(key, (0, 0.0))
+        stats[key] = (visits + 1, total + margin)
+
+    return stats
+
+
+def _rollout_worker(args: Tuple) -> RolloutStats:
+    """Worker function for parallel rollouts.
+
+    Args:
+        args: Tuple of (state_pickle, n, seed, start, max_turns).
+
+    Returns:
+        Rollout statistics from run_rollouts.
+    """
+    return run_rollouts(*args)
+
+
+def _merge_stats(results: List[RolloutStats]) -> RolloutStats:
+    """Sum visit counts and score totals from several workers."""
+    merged: RolloutStats = {}
+    for stats in results:
+        for key, (visits, total) in stats.items():
+            prev_visits, prev_total = merged.get(key, (0, 0.0))
+            merged[key] = (prev_visits + visits, prev_total + total)
+    return merged
+
+
+def select_move_parallel(
+    state: GameState,
+    moves: List[Move],
+    n_rollouts: int = 200,
+    seed: Optional[int] = None,
+    parallel: bool = True,
+    max_workers: Optional[int] = None,
+    max_turns: int = 100
+) -> Optional[Move]:
+    """Pick the move with the best average rollout margin.
+
+    Args:
+        state: Current game state.
+        moves: Candidate moves for the current player.
+        n_rollouts: Total rollouts across all workers.
+        seed: Base random seed (worker i uses seed ^ i).
+        parallel: Whether to fan rollouts out to worker processes.
+        max_workers: Max parallel workers (default: CPU count).
+        max_turns: Maximum turns per playout.
+
+    Returns:
+        The selected Move, or None if there are no moves.
+    """
+    if not moves:
+        return None
+    if len(moves) == 1:
+        return moves[0]
+
+    if seed is None:
+        seed = random.randrange(2**31)
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count() if parallel else 1
+    n_workers = max(1, min(max_workers, n_rollouts))
+
+    # Pickle once; every worker unpickles the same root
+    payload = pickle.dumps((state, moves))
+    args_list = []
+    start = 0
+    for worker_id in range(n_workers):
+        n = n_rollouts // n_workers + (1 if worker_id < n_rollouts % n_workers else 0)
+        args_list.append((payload, n, seed ^ worker_id, start, max_turns))
+        start += n
+
+    if parallel and n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_rollout_worker, args_list))
+    else:
+        results = [_rollout_worker(args) for args in args_list]
+
+    stats = _merge_stats(results)
+    if not stats:
+        return moves[0]
+
+    # Moves are sorted by score, so ties go to the higher immediate score
+    def mean_margin(move: Move) -> float:
+        visits, total = stats.get(move_key(move), (0, 0.0))
+        return total / visits if visits else float("-inf")
+
+    return max(moves, key=mean_margin)
+
+
+class MonteCarloSolver(Solver):
+    """Solver that evaluates moves with root-parallel rollouts.
+
+    Slower than the greedy and random solvers, but looks past the
+    immediate score by playing each candidate out with greedy play.
+    """
+
+    def __init__(
+        self,
+        n_rollouts: int = 200,
+        seed: Optional[int] = None,
+        parallel: bool = True,
+        max_workers: Optional[int] = None,
+        max_turns: int = 100
+    ):
+        """Initialize rollout settings.
+
+        Args:
+            n_rollouts: Total rollouts per decision.
+            seed: Random seed for reproducibility.
+            parallel: Whether to run rollouts in worker processes.
+            max_workers: Max parallel workers (default: CPU count).
+            max_turns: Maximum turns per playout.
+        """
+        self._rng = random.Random(seed)
+        self._n_rollouts = n_rollouts
+        self._parallel = parallel
+        self._max_workers = max_workers
+        self._max_turns = max_turns
+
+    def select_move(
+        self,
+        state: GameState,
+        moves: Optional[List[Move]] = None
+    ) -> Optional[Move]:
+        """Select the move with the best average rollout outcome.
+
+        Args:
+            state: Current game state.
+            moves: Optional pre-computed list of valid moves.
+
+        Returns:
+            The selected Move, or None if no valid moves.
+        """
+        if moves is None:
+            moves = self._generate_moves(state)
+
+        return select_move_parallel(
+            state,
+            moves,
+            n_rollouts=self._n_rollouts,
+            seed=self._rng.randrange(2**31),
+            parallel=self._parallel,
+            max_workers=self._max_workers,
+            max_turns=self._max_turns,
+        )
@@ -3,57 +3,110 @@
 Enumerates all valid moves for a given game state.
 """
 
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+import heapq
 from dataclasses import dataclass
-from typing import List, Set, Tuple, Iterator, Optional
+from typing import Dict, FrozenSet, List, Set, Tuple, Iterator, Optional
 from itertools import combinations, permutations
+from weakref import WeakKeyDictionary
 
 from src.models.board import Board, Position
-from src.models.tile import Tile
+from src.models.tile import Tile, TILE_BY_ID
 from src.models.hand import Hand
-from src.engine.rules import validate_move
-from src.engine.scoring import score_move
+from src.engine._kernels import line_valid_from_ids
+from src.engine.scoring import validate_and_score, calculate_line_score, QWIRKLE_SIZE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, init=False)
 class Move:
     """Represents a validated move with its score.
 
+    Slotted and immutable: move lists can be large, and moves are shared
+    between the generator, solvers, and callers. Placements are stored
+    as parallel arrays rather than a list of nested tuples; the
+    placements property rebuilds the (position, tile) list on demand.
+
     Attributes:
-        placements: List of (position, tile) tuples.
+        rows: Row of each placement.
+        cols: Column of each placement.
+        tile_ids: Tile.index() of each placed tile.
         score: Points this move would earn.
         qwirkles: Number of Qwirkles this move creates.
     """
-    placements: List[Tuple[Position, Tile]]
+    rows: array
+    cols: array
+    tile_ids: bytes
     score: int
     qwirkles: int
 
+    def __init__(
+        self,
+        placements: List[Tuple[Position, Tile]],
+        score: int,
+        qwirkles: int
+    ):
+        """Create a move from (position, tile) placements.
+
+        Args:
+            placements: List of (position, tile) tuples.
+            score: Points this move would earn.
+            qwirkles: Number of Qwirkles this move creates.
+        """
+        # Frozen dataclass: fields are set through object.__setattr__
+        object.__setattr__(self, "rows", array("h", [pos[0] for pos, _ in placements]))
+        object.__setattr__(self, "cols", array("h", [pos[1] for pos, _ in placements]))
+        object.__setattr__(self, "tile_ids", bytes([tile.index() for _, tile in placements]))
+        object.__setattr__(self, "score", score)
+        object.__setattr__(self, "qwirkles", qwirkles)
+
+    @property
+    def placements(self) -> List[Tuple[Position, Tile]]:
+        """List of (position, tile) tuples, in placement order."""
+        return [
+            ((row, col), TILE_BY_ID[tile_id])
+            for row, col, tile_id in zip(self.rows, self.cols, self.tile_ids)
+        ]
+
     def __repr__(self) -> str:
         tiles = ", ".join(f"{t}@{p}" for p, t in self.placements)
         return f"Move({tiles}, score={self.score})"
 
 
-def find_valid_positions(board: Board) -> Set[Position]:
+# Candidate positions per board, keyed weakly so dead boards are dropped.
+# Each entry stores the board version it was computed for.
+_valid_positions_cache: "WeakKeyDictionary[Board, Tuple[int, FrozenSet[Position]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def find_valid_positions(board: Board) -> FrozenSet[Position]:
     """Find all positions where a tile could potentially be placed.
 
     For an empty board, returns just the origin (0, 0).
     Otherwise, returns all empty positions adjacent to existing tiles.
 
+    Results are memoized per board and reused until the board changes.
+
     Args:
         board: The current board state.
 
     Returns:
         Set of positions that are candidates for placement.
     """
-    if board.is_board_empty():
-        return {(0, 0)}
+    version = board.version()
+    cached = _valid_positions_cache.get(board)
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
-    candidates: Set[Position] = set()
-
-    for pos in board.all_positions():
-        for neighbor in board.neighbor_positions(pos):
-            if board.is_empty(neighbor):
-                candidates.add(neighbor)
+    if board.is_board_empty():
+        candidates: FrozenSet[Position] = frozenset({(0, 0)})
+    else:
+        # The board tracks empty cells next to tiles as they are placed
+        candidates = board.frontier()
 
+    _valid_positions_cache[board] = (version, candidates)
     return candidates
 
 
@@ -85,7 +138,8 @@ def _get_line_positions(
 def generate_single_tile_moves(
     board: Board,
     hand: Hand,
-    is_first_move: bool = False
+    is_first_move: bool = False,
+    valid_positions: Optional[FrozenSet[Position]] = None
 ) -> List[Move]:
     """Generate all valid single-tile moves.
 
@@ -93,31 +147,193 @@ def generate_single_tile_moves(
         board: Current board state.
         hand: Current player's hand.
         is_first_move: Whether this is the first move of the game.
+        valid_positions: Precomputed result of find_valid_positions(board).
 
     Returns:
         List of valid Move objects.
     """
-    valid_positions = find_valid_positions(board)
+    if valid_positions is None:
+        valid_positions = find_valid_positions(board)
     tiles = hand.tiles()
-    seen_tiles: Set[Tile] = set()  # Avoid duplicate moves for same tile type
+    seen_mask = 0  # Bit per tile type, to avoid duplicate moves for same tile type
     moves: List[Move] = []
 
+    if board.is_board_empty():
+        # Only the opening placement at the origin is possible
+        if not is_first_move:
+            return moves
+        for tile in tiles:
+            bit = 1 << tile.index()
+            if seen_mask & bit:
+                continue
+            seen_mask |= bit
+            moves.append(Move([((0, 0), tile)], 1, 0))
+        return moves
+
+    # The lines a tile would join depend only on its position, so gather
+    # them once per position and test every distinct tile against them
+    position_runs = [
+        (pos, _adjacent_runs(board, pos)) for pos in valid_positions
+    ]
+
+    # Local bindings for the inner loop
+    score_placement = _score_single_placement
+    append = moves.append
+    make_move = Move
+
     for tile in tiles:
-        if tile in seen_tiles:
+        tile_id = tile.index()
+        bit = 1 << tile_id
+        if seen_mask & bit:
             continue
-        seen_tiles.add(tile)
-
-        for pos in valid_positions:
-            placements = [(pos, tile)]
-            valid, _ = validate_move(board, placements, is_first_move)
+        seen_mask |= bit
 
-            if valid:
-                points, qwirkles = score_move(board, placements)
-                moves.append(Move(placements, points, qwirkles))
+        for pos, runs in position_runs:
+            result = score_placement(tile_id, runs)
+            if result is not None:
+                append(make_move([(pos, tile)], result[0], result[1]))
 
     return moves
 
 
+def _collect_run(board: Board, pos: Position, d_row: int, d_col: int) -> List[int]:
+    """Collect consecutive tiles starting at pos and stepping by (d_row, d_col).
+
+    Runs are kept as Tile.index() ids, which is what the line kernels
+    take, so no Tile objects are built while generating moves.
+
+    Args:
+        board: Current board state.
+        pos: First position to inspect.
+        d_row: Row step.
+        d_col: Column step.
+
+    Returns:
+        Tile ids in order of distance from pos (empty if pos is empty).
+    """
+    get_id = board.get_id
+    row, col = pos
+    run: List[int] = []
+    while (tile_id := get_id((row, col))) is not None:
+        run.append(tile_id)
+        row += d_row
+        col += d_col
+    return run
+
+
+def _adjacent_runs(board: Board, pos: Position) -> Tuple[List[int], List[int]]:
+    """Collect the tile ids an empty position would join horizontally and vertically.
+
+    Args:
+        board: Current board state.
+        pos: Empty position to inspect.
+
+    Returns:
+        Tuple of (horizontal_run, vertical_run), each excluding pos itself.
+    """
+    row, col = pos
+    horizontal = _collect_run(board, (row, col - 1), 0, -1)
+    horizontal.extend(_collect_run(board, (row, col + 1), 0, 1))
+    vertical = _collect_run(board, (row - 1, col), -1, 0)
+    vertical.extend(_collect_run(board, (row + 1, col), 1, 0))
+    return horizontal, vertical
+
+
+def _score_single_placement(
+    tile_id: int,
+    runs: Tuple[List[int], List[int]]
+) -> Optional[Tuple[int, int]]:
+    """Validate and score one tile against the runs it would join.
+
+    Equivalent to validate_move + score_move for a single tile placed
+    next to existing tiles, without copying the board.
+
+    Args:
+        tile_id: Tile.index() of the tile to place.
+        runs: Horizontal and vertical runs from _adjacent_runs.
+
+    Returns:
+        Tuple of (points, qwirkles), or None if the placement is invalid.
+    """
+    points = 0
+    qwirkles = 0
+    valid_line = line_valid_from_ids
+    for run in runs:
+        if not run:
+            continue
+        line = run + [tile_id]
+        if not valid_line(line):
+            return None
+        line_len = len(line)
+        points += calculate_line_score(line_len)
+        if line_len == QWIRKLE_SIZE:
+            qwirkles += 1
+    return points, qwirkles
+
+
+# Sorted occupied columns per row and occupied rows per column, keyed
+# weakly per board like the valid-position cache above.
+_occupancy_cache: "WeakKeyDictionary[Board, Tuple[int, Dict[int, List[int]], Dict[int, List[int]]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _occupancy_index(board: Board) -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+    """Index occupied cells by row and by column.
+
+    Built once per board version so every ray lookup during a turn is a
+    binary search instead of a cell-by-cell walk.
+
+    Args:
+        board: Current board state.
+
+    Returns:
+        Tuple of (row -> sorted columns, column -> sorted rows).
+    """
+    version = board.version()
+    cached = _occupancy_cache.get(board)
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+
+    by_row: Dict[int, List[int]] = {}
+    by_col: Dict[int, List[int]] = {}
+    for row, col in board.all_positions():
+        by_row.setdefault(row, []).append(col)
+        by_col.setdefault(col, []).append(row)
+    for occupied in by_row.values():
+        occupied.sort()
+    for occupied in by_col.values():
+        occupied.sort()
+
+    _occupancy_cache[board] = (version, by_row, by_col)
+    return by_row, by_col
+
+
+def _empty_run_length(occupied: List[int], start: int, step: int, limit: int) -> int:
+    """Count empty cells stepping away from start before hitting a tile.
+
+    Args:
+        occupied: Sorted occupied coordinates along the line.
+        start: Coordinate to step away from (not counted).
+        step: -1 or +1.
+        limit: Maximum length to report.
+
+    Returns:
+        Number of consecutive empty cells, capped at limit.
+    """
+    idx = bisect_left(occupied, start)
+    if step > 0:
+        # First occupied coordinate strictly after start
+        if idx < len(occupied) and occupied[idx] == start:
+            idx += 1
+        if idx == len(occupied):
+            return limit
+        return min(occupied[idx] - start - 1, limit)
+    if idx == 0:
+        return limit
+    return min(start - occupied[idx - 1] - 1, limit)
+
+
 def _find_extension_positions(
     board: Board,
     start_pos: Position,
@@ -136,31 +352,21 @@ def _find_extension_positions(
         List of empty positions in order of distance from start.
     """
     row, col = start_pos
-    positions = []
+    by_row, by_col = _occupancy_index(board)
 
-    # Limit extension to max_extend positions (lines can only be 6 tiles)
     if direction == 'left':
-        c = col - 1
-        while board.is_empty((row, c)) and len(positions) < max_extend:
-            positions.append((row, c))
-            c -= 1
-    elif direction == 'right':
-        c = col + 1
-        while board.is_empty((row, c)) and len(positions) < max_extend:
-            positions.append((row, c))
-            c += 1
-    elif direction == 'up':
-        r = row - 1
-        while board.is_empty((r, col)) and len(positions) < max_extend:
-            positions.append((r, col))
-            r -= 1
-    elif direction == 'down':
-        r = row + 1
-        while board.is_empty((r, col)) and len(positions) < max_extend:
-            positions.append((r, col))
-            r += 1
-
-    return positions
+        n = _empty_run_length(by_row.get(row, []), col, -1, max_extend)
+        return [(row, col - 1 - i) for i in range(n)]
+    if direction == 'right':
+        n = _empty_run_length(by_row.get(row, []), col, 1, max_extend)
+        return [(row, col + 1 + i) for i in range(n)]
+    if direction == 'up':
+        n = _empty_run_length(by_col.get(col, []), row, -1, max_extend)
+        return [(row - 1 - i, col) for i in range(n)]
+    if direction == 'down':
+        n = _empty_run_length(by_col.get(col, []), row, 1, max_extend)
+        return [(row + 1 + i, col) for i in range(n)]
+    return []
 
 
 def generate_multi_tile_moves(
@@ -168,19 +374,34 @@ def generate_multi_tile_moves(
     hand: Hand,
     is_first_move: bool = False,
     max_tiles: int = 6,
-    max_moves: int = 100
+    max_moves: int = 100,
+    valid_positions: Optional[FrozenSet[Position]] = None,
+    connected_positions: Optional[List[Position]] = None,
+    top_k: Optional[int] = None,
+    known_scores: Optional[List[int]] = None
 ) -> List[Move]:
     """Generate valid multi-tile moves (2+ tiles).
 
     Strategy: For each valid single-tile placement, try extending
     the line with additional tiles from hand.
 
+    Each distinct placement set counts once toward max_moves, however
+    many start positions reach it. With top_k set, placements whose best
+    possible score cannot reach the k-th best score found so far are
+    skipped without being checked.
+
     Args:
         board: Current board state.
         hand: Current player's hand.
         is_first_move: Whether this is the first move.
         max_tiles: Maximum tiles to place (default 6).
         max_moves: Maximum moves to generate (for performance).
+        valid_positions: Precomputed result of find_valid_positions(board).
+        connected_positions: Precomputed subset of valid_positions that
+            touch an existing tile.
+        top_k: Only moves that could rank in the top k are needed.
+        known_scores: Scores of moves found elsewhere (e.g. single-tile
+            moves) that seed the top_k bound.
 
     Returns:
         List of valid Move objects.
@@ -188,11 +409,19 @@ def generate_multi_tile_moves(
     moves: List[Move] = []
     tiles = hand.tiles()
 
+    # Min-heap of the best top_k scores seen so far; once full, its
+    # smallest entry is the score a new move has to reach
+    best_scores: List[int] = []
+    # The same line is often reached from several start positions, so
+    # each distinct placement set is kept and counted only once
+    counted: Set[Tuple[int, ...]] = set()
+    if top_k is not None:
+        for score in known_scores or ():
+            _push_bounded(best_scores, score, top_k)
+
     if len(tiles) < 2:
         return moves
 
-    valid_positions = find_valid_positions(board)
-
     # For first move, generate lines of tiles at origin
     if is_first_move:
         moves.extend(_generate_first_move_lines(tiles, max_tiles))
@@ -201,27 +430,46 @@ def generate_multi_tile_moves(
     # For subsequent moves, find positions that connect to existing tiles
     # and try to build lines from there
     # Limit to positions with neighbors (more likely to be valid)
-    connected_positions = [p for p in valid_positions if board.has_neighbor(p)]
+    if connected_positions is None:
+        if valid_positions is None:
+            valid_positions = find_valid_positions(board)
+        connected_positions = [p for p in valid_positions if board.has_neighbor(p)]
+
+    # Tiles in a line must share a color or a shape, so group the hand
+    # once and only combine tiles within a group
+    groups = _compatible_groups(tiles)
 
     for start_pos in connected_positions:
         if len(moves) >= max_moves:
             break
 
-        # Try horizontal lines (extending left and right)
-        moves.extend(_generate_lines_from_position(
-            board, tiles, start_pos, 'row', max_tiles, is_first_move
-        ))
+        # Try horizontal lines, then vertical lines
+        for direction in ('row', 'col'):
+            if len(moves) >= max_moves:
+                break
 
-        if len(moves) >= max_moves:
-            break
+            min_score = best_scores[0] if top_k is not None and len(best_scores) >= top_k else -1
+            batch = _generate_lines_from_position(
+                board, groups, start_pos, direction, max_tiles, is_first_move,
+                min_score=min_score,
+            )
+            for move in batch:
+                key = _move_key(move)
+                if key not in counted:
+                    counted.add(key)
+                    moves.append(move)
+                    if top_k is not None:
+                        _push_bounded(best_scores, move.score, top_k)
+
+    return moves[:max_moves]
 
-        # Try vertical lines (extending up and down)
-        moves.extend(_generate_lines_from_position(
-            board, tiles, start_pos, 'col', max_tiles, is_first_move
-        ))
 
-    # Deduplicate moves with same placements
-    return _deduplicate_moves(moves[:max_moves])
+def _push_bounded(heap: List[int], score: int, size: int) -> None:
+    """Add a score to a min-heap holding at most size of the largest scores."""
+    if len(heap) < size:
+        heapq.heappush(heap, score)
+    elif score > heap[0]:
+        heapq.heapreplace(heap, score)
 
 
 def _generate_first_move_lines(
@@ -247,9 +495,10 @@ def _generate_first_move_lines(
 
             # Try horizontal placement at origin
             placements = [((0, i), t) for i, t in enumerate(selected)]
-            valid, _ = validate_move(board, placements, is_first_move=True)
+            valid, _, points, qwirkles = validate_and_score(
+                board, placements, is_first_move=True
+            )
             if valid:
-                points, qwirkles = score_move(board, placements)
                 moves.append(Move(placements, points, qwirkles))
 
     return moves
@@ -257,23 +506,26 @@ def _generate_first_move_lines(
 
 def _generate_lines_from_position(
     board: Board,
-    tiles: List[Tile],
+    groups: List[Tuple[Tile, ...]],
     start_pos: Position,
     direction: str,
     max_tiles: int,
     is_first_move: bool,
-    max_combinations: int = 20
+    max_combinations: int = 20,
+    min_score: int = -1
 ) -> List[Move]:
     """Generate line moves starting from a position.
 
     Args:
         board: Current board state.
-        tiles: Tiles in hand.
+        groups: Hand tiles grouped by _compatible_groups.
         start_pos: Starting position (must be empty).
         direction: 'row' or 'col'.
         max_tiles: Maximum tiles to place.
         is_first_move: Whether this is the first move.
-        max_combinations: Max combinations to try per position (for speed).
+        max_combinations: Max combinations to try per position and group
+            (for speed).
+        min_score: Skip placements whose best possible score is below this.
 
     Returns:
         List of valid moves.
@@ -303,88 +555,311 @@ def _generate_lines_from_position(
         right_take = min(len(all_positions) - start_idx - 1, max_tiles - left_take - 1)
         all_positions = all_positions[start_idx - left_take:start_idx + right_take + 1]
 
-    # Track combinations tried
-    combo_count = 0
+    n_positions = len(all_positions)
+
+    # Per-position data shared by every combination tried below
+    touches_board = [board.has_neighbor(p) for p in all_positions]
+    if direction == 'row':
+        d_row, d_col = 0, 1
+        crossing_runs = [_adjacent_runs(board, p)[1] for p in all_positions]
+    else:
+        d_row, d_col = 1, 0
+        crossing_runs = [_adjacent_runs(board, p)[0] for p in all_positions]
+
+    # Existing tiles the main line picks up when a placement reaches
+    # either end of the empty stretch
+    first_row, first_col = all_positions[0]
+    last_row, last_col = all_positions[-1]
+    lead_run = _collect_run(board, (first_row - d_row, first_col - d_col), -d_row, -d_col)
+    lead_run.reverse()
+    tail_run = _collect_run(board, (last_row + d_row, last_col + d_col), d_row, d_col)
+
+    # Best case score of the crossing line at each position, used to
+    # bound a placement's score before checking any tiles
+    crossing_bound = [
+        calculate_line_score(min(len(run) + 1, QWIRKLE_SIZE)) if run else 0
+        for run in crossing_runs
+    ]
+
+    # (position index, tile index) -> (points, qwirkles) of the crossing
+    # line, or None if the tile cannot go there
+    crossing_cache: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+
+    # Combinations tried per group. Each group gets its own
+    # max_combinations budget, so the color groups (listed first) cannot
+    # use it all up before the shape groups are reached
+    spent = [0] * len(groups)
+
+    # Local bindings for the combination loop below
+    append = moves.append
+    make_move = Move
+    valid_line = line_valid_from_ids
+    line_score = calculate_line_score
+    score_crossing = _score_crossing_line
 
     # Try placing 2 to max_tiles tiles in contiguous subsets
-    for size in range(2, min(len(tiles), len(all_positions), max_tiles) + 1):
-        for tile_combo in combinations(range(len(tiles)), size):
-            if combo_count >= max_combinations:
-                return moves
+    largest_group = max((len(group) for group in groups), default=0)
+    for size in range(2, min(largest_group, n_positions, max_tiles) + 1):
+        for g, group in enumerate(groups):
+            if len(group) < size or spent[g] >= max_combinations:
+                continue
+            combo_count = spent[g]
+            for selected in combinations(group, size):
+                if combo_count >= max_combinations:
+                    break
 
-            selected = [tiles[i] for i in tile_combo]
+                # Find contiguous position subsets that include start_pos
+                for pos_start in range(n_positions):
+                    pos_end = pos_start + size
+                    if pos_end > n_positions:
+                        break
+
+                    # Must include at least one position adjacent to existing tile
+                    if not any(touches_board[pos_start:pos_end]):
+                        continue
+
+                    combo_count += 1
+                    if combo_count > max_combinations:
+                        break
+
+                    if min_score >= 0:
+                        main_len = size
+                        if pos_start == 0:
+                            main_len += len(lead_run)
+                        if pos_end == n_positions:
+                            main_len += len(tail_run)
+                        upper_bound = line_score(min(main_len, QWIRKLE_SIZE)) + sum(
+                            crossing_bound[pos_start:pos_end]
+                        )
+                        if upper_bound < min_score:
+                            continue
+
+                    # Check each tile's crossing line, stopping at the first misfit
+                    points = 0
+                    qwirkles = 0
+                    selected_ids = [tile.index() for tile in selected]
+                    for offset, tile_id in enumerate(selected_ids):
+                        key = (pos_start + offset, tile_id)
+                        if key in crossing_cache:
+                            crossing = crossing_cache[key]
+                        else:
+                            crossing = score_crossing(tile_id, crossing_runs[pos_start + offset])
+                            crossing_cache[key] = crossing
+                        if crossing is None:
+                            break
+                        points += crossing[0]
+                        qwirkles += crossing[1]
+                    else:
+                        # Then the main line through all placed tiles
+                        main_line = selected_ids
+                        if pos_start == 0 and lead_run:
+                            main_line = lead_run + main_line
+                        if pos_end == n_positions and tail_run:
+                            main_line = main_line + tail_run
+                        if not valid_line(main_line):
+                            continue
+
+                        line_len = len(main_line)
+                        points += line_score(line_len)
+                        if line_len == QWIRKLE_SIZE:
+                            qwirkles += 1
+
+                        placements = list(zip(all_positions[pos_start:pos_end], selected))
+                        append(make_move(placements, points, qwirkles))
+            spent[g] = combo_count
 
-            # Find contiguous position subsets that include start_pos
-            for pos_start in range(len(all_positions)):
-                if pos_start + size > len(all_positions):
-                    break
-                pos_subset = all_positions[pos_start:pos_start + size]
+    return moves
 
-                # Must include at least one position adjacent to existing tile
-                if not any(board.has_neighbor(p) for p in pos_subset):
-                    continue
 
-                combo_count += 1
-                if combo_count > max_combinations:
-                    return moves
+def _compatible_groups(tiles: List[Tile]) -> List[Tuple[Tile, ...]]:
+    """Group hand tiles that could share a line.
 
-                # Try this placement
-                placements = list(zip(pos_subset, selected))
-                valid, _ = validate_move(board, placements, is_first_move)
-                if valid:
-                    points, qwirkles = score_move(board, placements)
-                    moves.append(Move(placements, points, qwirkles))
+    Returns tiles grouped by color and by shape, in hand order. Duplicate
+    copies are kept: combinations only come out in hand order, so a
+    later copy can give an ordering the first copy cannot. Groups with
+    fewer than two tiles are dropped.
 
-    return moves
+    Args:
+        tiles: Tiles in hand.
+
+    Returns:
+        List of tile groups, color groups first.
+    """
+    by_color: Dict[int, List[Tile]] = {}
+    by_shape: Dict[int, List[Tile]] = {}
+
+    for tile in tiles:
+        by_color.setdefault(tile.color_idx, []).append(tile)
+        by_shape.setdefault(tile.shape_idx, []).append(tile)
 
+    return [
+        tuple(group)
+        for group in list(by_color.values()) + list(by_shape.values())
+        if len(group) >= 2
+    ]
 
-def _deduplicate_moves(moves: List[Move]) -> List[Move]:
-    """Remove duplicate moves (same placements, different order).
+
+def _score_crossing_line(tile_id: int, run: List[int]) -> Optional[Tuple[int, int]]:
+    """Validate and score the perpendicular line a placed tile would form.
 
     Args:
-        moves: List of moves.
+        tile_id: Tile.index() of the tile being placed.
+        run: Ids of the existing tiles on the perpendicular line
+            (excluding the tile).
 
     Returns:
-        Deduplicated list.
+        Tuple of (points, qwirkles), (0, 0) if the tile forms no line,
+        or None if the resulting line is invalid.
     """
-    seen: Set[frozenset] = set()
-    unique: List[Move] = []
+    if not run:
+        return 0, 0
+    line = run + [tile_id]
+    if not line_valid_from_ids(line):
+        return None
+    line_len = len(line)
+    return calculate_line_score(line_len), int(line_len == QWIRKLE_SIZE)
+
 
-    for move in moves:
-        key = frozenset(move.placements)
-        if key not in seen:
-            seen.add(key)
-            unique.append(move)
+# Coordinate offset for packing placements into ints. The bag holds 108
+# tiles, so rows and columns stay well inside 16 bits.
+_PACK_OFFSET = 1 << 15
 
-    return unique
+
+def _move_key(move: Move) -> Tuple[int, ...]:
+    """Canonical key for a move's placements, independent of their order.
+
+    Each placement is packed as (row, col, tile index) into one integer;
+    the sorted tuple of those identifies the move.
+    """
+    return tuple(sorted(
+        ((row + _PACK_OFFSET) << 24) | ((col + _PACK_OFFSET) << 8) | tile_id
+        for row, col, tile_id in zip(move.rows, move.cols, move.tile_ids)
+    ))
 
 
 def generate_all_moves(
     board: Board,
     hand: Hand,
-    is_first_move: bool = False
+    is_first_move: bool = False,
+    top_k: Optional[int] = None
 ) -> List[Move]:
     """Generate all valid moves for the current state.
 
     Combines single and multi-tile moves.
 
+    With top_k set, only the k highest-scoring moves are returned and
+    multi-tile placements that cannot reach them are pruned. The search
+    covers at least as much as the full enumeration, so the best move
+    scores no lower than the first of the full list.
+
     Args:
         board: Current board state.
         hand: Current player's hand.
         is_first_move: Whether this is the first move.
+        top_k: Return only this many of the best moves.
 
     Returns:
         List of all valid Move objects, sorted by score (descending).
     """
     moves = []
 
+    # Enumerate candidate positions once and share them with both generators
+    valid_positions = find_valid_positions(board)
+    connected_positions = [p for p in valid_positions if board.has_neighbor(p)]
+
     # Single tile moves
-    moves.extend(generate_single_tile_moves(board, hand, is_first_move))
+    moves.extend(generate_single_tile_moves(
+        board, hand, is_first_move, valid_positions=valid_positions
+    ))
 
     # Multi-tile moves
-    moves.extend(generate_multi_tile_moves(board, hand, is_first_move))
+    moves.extend(generate_multi_tile_moves(
+        board, hand, is_first_move,
+        valid_positions=valid_positions,
+        connected_positions=connected_positions,
+        top_k=top_k,
+        known_scores=[m.score for m in moves] if top_k is not None else None,
+    ))
+
+    if top_k is not None:
+        # nlargest keeps generation order among equal keys, like the
+        # stable sort below
+        return heapq.nlargest(top_k, moves, key=_move_rank)
 
     # Sort by score (highest first)
-    moves.sort(key=lambda m: (m.score, m.qwirkles), reverse=True)
+    moves.sort(key=_move_rank, reverse=True)
 
     return moves
+
+
+def _move_rank(move: Move) -> Tuple[int, int]:
+    """Sort key for moves: score, then Qwirkles made."""
+    return move.score, move.qwirkles
+
+
+class MoveCache:
+    """Bounded LRU transposition table for generate_all_moves.
+
+    Entries are keyed by the board's zobrist hash, the hand's tile
+    types, the first-move flag, and top_k, so revisiting a position (hint then
+    play, repeated rollouts) reuses the enumerated moves.
+
+    Cached lists are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of positions to keep.
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[int, bytes, bool, Optional[int]], List[Move]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get_moves(
+        self,
+        board: Board,
+        hand: Hand,
+        is_first_move: bool = False,
+        top_k: Optional[int] = None
+    ) -> List[Move]:
+        """Return generate_all_moves(board, hand, is_first_move, top_k), cached.
+
+        Args:
+            board: Current board state.
+            hand: Current player's hand.
+            is_first_move: Whether this is the first move.
+            top_k: Return only this many of the best moves.
+
+        Returns:
+            List of all valid Move objects, sorted by score (descending).
+        """
+        key = (
+            board.zobrist(),
+            hand.counts(),
+            is_first_move,
+            top_k,
+        )
+        moves = self._entries.get(key)
+        if moves is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return moves
+
+        self.misses += 1
+        moves = generate_all_moves(board, hand, is_first_move, top_k)
+        self._entries[key] = moves
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return moves
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
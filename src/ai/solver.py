@@ -5,17 +5,26 @@ Provides different strategies for selecting moves.
 
 import random
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Optional, List
 
 from src.models.board import Board
 from src.models.hand import Hand
 from src.engine.game import GameState
-from src.ai.move_gen import Move, generate_all_moves
+from src.ai.move_gen import Move, MoveCache, generate_all_moves
 
 
 class Solver(ABC):
     """Abstract base class for Qwirkle solvers."""
 
+    # Optional transposition table; rollout solvers that revisit
+    # positions set one up in __init__
+    _move_cache: Optional[MoveCache] = None
+
+    # Number of best moves select_move needs (None = all of them)
+    _top_k: Optional[int] = None
+
     @abstractmethod
     def select_move(
         self,
@@ -42,15 +51,29 @@ class Solver(ABC):
         Returns:
             The selected Move, or None if no valid moves.
         """
-        hand = state.hands[state.current_player]
-        is_first = state.board.is_board_empty()
-        moves = generate_all_moves(state.board, hand, is_first)
+        moves = self._generate_moves(state)
 
         if not moves:
             return None
 
         return self.select_move(state, moves)
 
+    def _generate_moves(self, state: GameState) -> List[Move]:
+        """Generate all moves for the current player, using the cache if set.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Valid moves sorted by score (descending), limited to the
+            solver's top_k if set.
+        """
+        hand = state.hands[state.current_player]
+        is_first = state.board.is_board_empty()
+        if self._move_cache is not None:
+            return self._move_cache.get_moves(state.board, hand, is_first, self._top_k)
+        return generate_all_moves(state.board, hand, is_first, self._top_k)
+
 
 class GreedySolver(Solver):
     """Greedy solver that picks the highest-scoring move.
@@ -58,6 +81,9 @@ class GreedySolver(Solver):
     Simple but effective strategy: always maximize immediate points.
     """
 
+    # Only the best move is needed, so generation can prune the rest
+    _top_k = 1
+
     def select_move(
         self,
         state: GameState,
@@ -73,15 +99,9 @@ class GreedySolver(Solver):
             The highest-scoring Move, or None if no valid moves.
         """
         if moves is None:
-            hand = state.hands[state.current_player]
-            is_first = state.board.is_board_empty()
-            moves = generate_all_moves(state.board, hand, is_first)
+            moves = self._generate_moves(state)
 
-        if not moves:
-            return None
-
-        # Moves are already sorted by score, return the first
-        return moves[0]
+        return _select_greedy(moves)
 
 
 class RandomSolver(Solver):
@@ -90,13 +110,16 @@ class RandomSolver(Solver):
     Useful for Monte Carlo simulations and as a baseline.
     """
 
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, cache_size: int = 4096):
         """Initialize with optional random seed.
 
         Args:
             seed: Random seed for reproducibility.
+            cache_size: Positions to keep in the move cache (0 disables it).
         """
         self._rng = random.Random(seed)
+        if cache_size > 0:
+            self._move_cache = MoveCache(cache_size)
 
     def select_move(
         self,
@@ -113,14 +136,9 @@ class RandomSolver(Solver):
             A random Move, or None if no valid moves.
         """
         if moves is None:
-            hand = state.hands[state.current_player]
-            is_first = state.board.is_board_empty()
-            moves = generate_all_moves(state.board, hand, is_first)
+            moves = self._generate_moves(state)
 
-        if not moves:
-            return None
-
-        return self._rng.choice(moves)
+        return _select_random(moves, self._rng)
 
 
 class WeightedRandomSolver(Solver):
@@ -131,15 +149,27 @@ class WeightedRandomSolver(Solver):
     still favor reasonable moves.
     """
 
-    def __init__(self, seed: Optional[int] = None, temperature: float = 1.0):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        temperature: float = 1.0,
+        cache_size: int = 4096,
+        top_k: Optional[int] = None
+    ):
         """Initialize with optional random seed and temperature.
 
         Args:
             seed: Random seed for reproducibility.
             temperature: Higher = more random, lower = more greedy.
+            cache_size: Positions to keep in the move cache (0 disables it).
+            top_k: Sample only among this many of the best moves, letting
+                generation skip the rest (None samples from all moves).
         """
         self._rng = random.Random(seed)
         self._temperature = temperature
+        self._top_k = top_k
+        if cache_size > 0:
+            self._move_cache = MoveCache(cache_size)
 
     def select_move(
         self,
@@ -156,31 +186,104 @@ class WeightedRandomSolver(Solver):
             A weighted-random Move, or None if no valid moves.
         """
         if moves is None:
-            hand = state.hands[state.current_player]
-            is_first = state.board.is_board_empty()
-            moves = generate_all_moves(state.board, hand, is_first)
+            moves = self._generate_moves(state)
 
-        if not moves:
-            return None
+        return _select_weighted(moves, self._rng, self._temperature)
+
+    def select_moves_batch(
+        self,
+        state: GameState,
+        moves: Optional[List[Move]],
+        n: int
+    ) -> List[Move]:
+        """Draw n weighted-random moves (with replacement) in one call.
+
+        Uses a vectorized numpy draw when numpy is installed, seeded from
+        this solver's RNG so batches stay reproducible.
+
+        Args:
+            state: Current game state.
+            moves: Optional pre-computed list of valid moves.
+            n: Number of moves to draw.
+
+        Returns:
+            List of n selected moves, or an empty list if no valid moves.
+        """
+        if moves is None:
+            moves = self._generate_moves(state)
+
+        if not moves or n <= 0:
+            return []
+
+        cumulative = _cumulative_weights(moves, self._temperature)
+
+        try:
+            import numpy as np
+        except ImportError:
+            return self._rng.choices(moves, cum_weights=cumulative, k=n)
+
+        weights = np.diff(np.asarray(cumulative), prepend=0.0)
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+        picks = rng.choice(len(moves), size=n, p=weights / weights.sum())
+        return [moves[i] for i in picks.tolist()]
+
+
+# Selection strategies. Plain functions so rollout loops can call them
+# directly without going through a solver instance.
+
+def _select_greedy(moves: List[Move]) -> Optional[Move]:
+    """Pick the highest-scoring move from a list sorted by score."""
+    if not moves:
+        return None
+
+    # Moves are already sorted by score, return the first
+    return moves[0]
+
+
+def _select_random(moves: List[Move], rng: random.Random) -> Optional[Move]:
+    """Pick a uniformly random move."""
+    if not moves:
+        return None
+
+    return rng.choice(moves)
+
+
+def _select_weighted(
+    moves: List[Move],
+    rng: random.Random,
+    temperature: float
+) -> Optional[Move]:
+    """Pick a move with probability proportional to (score + 1) ** (1 / temperature).
+
+    Args:
+        moves: Candidate moves.
+        rng: Random number generator.
+        temperature: Higher = more random, lower = more greedy.
+
+    Returns:
+        The selected Move, or None if there are no moves.
+    """
+    if not moves:
+        return None
+
+    if len(moves) == 1:
+        return moves[0]
 
-        if len(moves) == 1:
-            return moves[0]
+    cumulative = _cumulative_weights(moves, temperature)
 
-        # Calculate weights based on score
-        # Add 1 to avoid zero weights
-        weights = [(m.score + 1) ** (1 / self._temperature) for m in moves]
-        total = sum(weights)
-        probabilities = [w / total for w in weights]
+    # Weighted random choice: first move whose cumulative weight reaches r
+    r = rng.random() * cumulative[-1]
+    idx = bisect_left(cumulative, r)
+    return moves[min(idx, len(moves) - 1)]
 
-        # Weighted random choice
-        r = self._rng.random()
-        cumulative = 0.0
-        for move, prob in zip(moves, probabilities):
-            cumulative += prob
-            if r <= cumulative:
-                return move
 
-        return moves[-1]  # Fallback
+def _cumulative_weights(moves: List[Move], temperature: float) -> List[float]:
+    """Running totals of (score + 1) ** (1 / temperature) over moves."""
+    # Add 1 to avoid zero weights
+    if temperature == 1.0:
+        return list(accumulate(m.score + 1 for m in moves))
+    exponent = 1 / temperature
+    return list(accumulate((m.score + 1) ** exponent for m in moves))
 
 
 # Convenience functions
@@ -12,6 +12,7 @@ from src.engine.scoring import (
     calculate_line_score,
     calculate_move_score,
     score_move,
+    validate_and_score,
     calculate_end_game_bonus,
     QWIRKLE_SIZE,
     QWIRKLE_BONUS,
@@ -22,6 +23,9 @@ from src.engine.game import (
     new_game,
     apply_move,
     apply_swap,
+    check_move,
+    commit_move,
+    check_swap,
     get_current_hand,
     get_current_score,
     can_play,
@@ -0,0 +1,73 @@
+"""Small integer kernels shared by the rules and scoring engines.
+
+These work on plain ints (tile ids and line lengths) rather than Tile
+objects, so the validator and scorer hot paths avoid per-tile attribute
+access and per-line function calls.
+"""
+
+from typing import List, Sequence, Tuple
+
+# Qwirkle = 6 tiles in a line
+QWIRKLE_SIZE = 6
+QWIRKLE_BONUS = 6
+
+
+def _distinct_tiles(colors: int, shapes: int) -> int:
+    """Tiles in a valid line with these color and shape masks, else 0."""
+    if colors & (colors - 1) == 0:
+        # One shared color (or none); shapes must be the varying attribute
+        return 0 if shapes & (shapes - 1) == 0 else shapes.bit_count()
+    if shapes & (shapes - 1) == 0:
+        return colors.bit_count()
+    return 0
+
+
+# Indexed by (color_mask << 6) | shape_mask over the tiles in a line: the
+# line length at which those masks form a valid line, or 0 if they never
+# do. Exactly one attribute must be shared, so the other one varies and
+# the line has no duplicates iff every tile adds a new bit to its mask.
+LINE_SIZE = bytes(
+    _distinct_tiles(colors, shapes)
+    for colors in range(64)
+    for shapes in range(64)
+)
+
+
+def line_valid_from_ids(ids: Sequence[int]) -> bool:
+    """Check if a line of tile ids is valid.
+
+    Args:
+        ids: Tile.index() ids of the tiles in the line.
+
+    Returns:
+        True if the line has at most 6 tiles, no duplicates, and shares
+        exactly one attribute.
+    """
+    if len(ids) <= 1:
+        return True
+    if len(ids) > QWIRKLE_SIZE:
+        return False
+
+    # Fold compact ids (shape_index * 6 + color_index) into bitmasks
+    color_mask = 0
+    shape_mask = 0
+    for tile_id in ids:
+        color_mask |= 1 << (tile_id % 6)
+        shape_mask |= 1 << (tile_id // 6)
+
+    # A duplicate leaves the varying mask with fewer bits than tiles
+    return LINE_SIZE[(color_mask << 6) | shape_mask] == len(ids)
+
+
+def score_lines(lengths: List[int]) -> Tuple[int, int]:
+    """Score a move from the lengths of the lines it formed.
+
+    Args:
+        lengths: Length of each affected line (all 2 or more).
+
+    Returns:
+        Tuple of (total_score, qwirkle_count).
+    """
+    # Every line scores its length; each Qwirkle adds the bonus on top
+    qwirkles = lengths.count(QWIRKLE_SIZE)
+    return sum(lengths) + QWIRKLE_BONUS * qwirkles, qwirkles
@@ -5,17 +5,18 @@ Handles game state, move application, swapping, and end-game detection.
 
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
-from copy import deepcopy
 
 from src.models.board import Board, Position
 from src.models.bag import Bag
 from src.models.hand import Hand
 from src.models.tile import Tile
-from src.engine.rules import validate_move
-from src.engine.scoring import score_move, calculate_end_game_bonus
+from src.engine.scoring import validate_and_score, calculate_end_game_bonus
 
+# XORed into GameState.zobrist() when it is player 1's turn
+PLAYER_ZOBRIST = 0x6A09E667F3BCC908
 
-@dataclass
+
+@dataclass(slots=True)
 class GameState:
     """Complete state of a Qwirkle game.
 
@@ -41,10 +42,22 @@ class GameState:
     # Track stats for simulation/analysis
     qwirkle_counts: List[int] = field(default_factory=lambda: [0, 0])
 
+    def zobrist(self) -> int:
+        """Return a 64-bit hash of the board and the player to move.
+
+        Hands and the bag are not included; combine with a hand signature
+        when keying caches on what a player can do.
+        """
+        board_hash = self.board.zobrist()
+        if self.current_player == 1:
+            return board_hash ^ PLAYER_ZOBRIST
+        return board_hash
+
     def clone(self) -> "GameState":
-        """Create a deep copy of the game state.
+        """Create an independent copy of the game state.
 
-        Used for simulations and AI lookahead.
+        Used for simulations and AI lookahead. Each component copies its
+        own containers directly; tiles are immutable and shared.
         """
         return GameState(
             board=self.board.copy(),
@@ -58,6 +71,27 @@ class GameState:
             qwirkle_counts=self.qwirkle_counts.copy(),
         )
 
+    def reset_from(self, other: "GameState") -> None:
+        """Overwrite this state with another, in place.
+
+        Rollout loops clone once, then reset the scratch state before
+        each playout instead of cloning again. Both states must have the
+        same number of hands.
+
+        Args:
+            other: State to copy from.
+        """
+        self.board.reset_from(other.board)
+        self.bag.reset_from(other.bag)
+        for hand, other_hand in zip(self.hands, other.hands):
+            hand.reset_from(other_hand)
+        self.scores[:] = other.scores
+        self.current_player = other.current_player
+        self.turn_number = other.turn_number
+        self.game_over = other.game_over
+        self.winner = other.winner
+        self.qwirkle_counts[:] = other.qwirkle_counts
+
 
 def new_game(seed: Optional[int] = None) -> GameState:
     """Create a new game with shuffled bag and dealt hands.
@@ -88,52 +122,65 @@ def new_game(seed: Optional[int] = None) -> GameState:
     )
 
 
-def apply_move(
+def check_move(
     state: GameState,
     placements: List[Tuple[Position, Tile]]
-) -> Tuple[bool, str, int]:
-    """Apply a move to the game state.
+) -> Tuple[bool, str, int, int]:
+    """Check a move for the current player without changing the state.
 
-    Validates the move, updates the board, calculates score,
-    refills hand, and advances to next turn.
+    Lets callers do work that is only needed for a legal move (such as
+    saving an undo snapshot) before committing it with commit_move.
 
     Args:
-        state: Current game state (will be modified).
+        state: Current game state.
         placements: List of (position, tile) to place.
 
     Returns:
-        Tuple of (success, error_message, points_scored).
-        If success is False, state is unchanged.
+        Tuple of (valid, error_message, points, qwirkle_count).
     """
     if state.game_over:
-        return False, "Game is already over", 0
+        return False, "Game is already over", 0, 0
 
     if not placements:
-        return False, "Must place at least one tile", 0
+        return False, "Must place at least one tile", 0, 0
 
     hand = state.hands[state.current_player]
-    tiles = [t for _, t in placements]
 
     # Verify player has these tiles
-    for tile in tiles:
+    for _, tile in placements:
         if tile not in hand:
-            return False, f"Player does not have tile: {tile}", 0
+            return False, f"Player does not have tile: {tile}", 0, 0
 
     # Validate the move
     is_first_move = state.board.is_board_empty()
-    valid, error = validate_move(state.board, placements, is_first_move)
-    if not valid:
-        return False, error, 0
+    return validate_and_score(state.board, placements, is_first_move)
+
+
+def commit_move(
+    state: GameState,
+    placements: List[Tuple[Position, Tile]],
+    points: int,
+    qwirkles: int
+) -> None:
+    """Apply a move that check_move has accepted.
+
+    Updates the board, score and hand, refills the hand, and advances
+    to the next turn. The move is not validated again.
 
-    # Calculate score before modifying board
-    points, qwirkles = score_move(state.board, placements)
+    Args:
+        state: Current game state (will be modified).
+        placements: List of (position, tile) to place.
+        points: Points from check_move.
+        qwirkles: Qwirkle count from check_move.
+    """
+    hand = state.hands[state.current_player]
 
     # Apply the move
     for pos, tile in placements:
         state.board.place(pos, tile)
 
     # Remove tiles from hand
-    hand.remove(tiles)
+    hand.remove([t for _, t in placements])
 
     # Update score and stats
     state.scores[state.current_player] += points
@@ -149,24 +196,44 @@ def apply_move(
         hand.refill(state.bag)
         _advance_turn(state)
 
+
+def apply_move(
+    state: GameState,
+    placements: List[Tuple[Position, Tile]]
+) -> Tuple[bool, str, int]:
+    """Apply a move to the game state.
+
+    Validates the move, updates the board, calculates score,
+    refills hand, and advances to next turn.
+
+    Args:
+        state: Current game state (will be modified).
+        placements: List of (position, tile) to place.
+
+    Returns:
+        Tuple of (success, error_message, points_scored).
+        If success is False, state is unchanged.
+    """
+    valid, error, points, qwirkles = check_move(state, placements)
+    if not valid:
+        return False, error, 0
+
+    commit_move(state, placements, points, qwirkles)
     return True, "", points
 
 
-def apply_swap(
+def check_swap(
     state: GameState,
     tiles_to_swap: List[Tile]
 ) -> Tuple[bool, str]:
-    """Swap tiles from hand with bag.
-
-    Player returns tiles to bag and draws same number of new tiles.
-    This counts as the player's turn.
+    """Check a swap for the current player without changing the state.
 
     Args:
-        state: Current game state (will be modified).
+        state: Current game state.
         tiles_to_swap: Tiles to return to bag.
 
     Returns:
-        Tuple of (success, error_message).
+        Tuple of (valid, error_message).
     """
     if state.game_over:
         return False, "Game is already over"
@@ -189,6 +256,32 @@ def apply_swap(
     if state.bag.remaining() < swap_count:
         return False, f"Bag only has {state.bag.remaining()} tiles, cannot swap {swap_count}"
 
+    return True, ""
+
+
+def apply_swap(
+    state: GameState,
+    tiles_to_swap: List[Tile]
+) -> Tuple[bool, str]:
+    """Swap tiles from hand with bag.
+
+    Player returns tiles to bag and draws same number of new tiles.
+    This counts as the player's turn.
+
+    Args:
+        state: Current game state (will be modified).
+        tiles_to_swap: Tiles to return to bag.
+
+    Returns:
+        Tuple of (success, error_message).
+    """
+    valid, error = check_swap(state, tiles_to_swap)
+    if not valid:
+        return False, error
+
+    hand = state.hands[state.current_player]
+    swap_count = len(tiles_to_swap)
+
     # Remove tiles from hand
     hand.remove(tiles_to_swap)
 
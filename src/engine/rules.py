@@ -11,6 +11,7 @@ A valid move must:
 from typing import List, Tuple, Set, Optional
 from src.models.board import Board, Position
 from src.models.tile import Tile, Color, Shape
+from src.engine._kernels import line_valid_from_ids
 
 
 def get_line_horizontal(board: Board, pos: Position) -> List[Tuple[Position, Tile]]:
@@ -26,24 +27,7 @@ def get_line_horizontal(board: Board, pos: Position) -> List[Tuple[Position, Til
     Returns:
         List of (position, tile) tuples in left-to-right order.
     """
-    row, col = pos
-    tiles = []
-
-    # Find leftmost tile in this line
-    left = col
-    while board.get((row, left - 1)) is not None:
-        left -= 1
-
-    # Collect all tiles from left to right
-    current = left
-    while True:
-        tile = board.get((row, current))
-        if tile is None:
-            break
-        tiles.append(((row, current), tile))
-        current += 1
-
-    return tiles
+    return board.line_tiles(pos, horizontal=True)
 
 
 def get_line_vertical(board: Board, pos: Position) -> List[Tuple[Position, Tile]]:
@@ -59,24 +43,7 @@ def get_line_vertical(board: Board, pos: Position) -> List[Tuple[Position, Tile]
     Returns:
         List of (position, tile) tuples in top-to-bottom order.
     """
-    row, col = pos
-    tiles = []
-
-    # Find topmost tile in this line
-    top = row
-    while board.get((top - 1, col)) is not None:
-        top -= 1
-
-    # Collect all tiles from top to bottom
-    current = top
-    while True:
-        tile = board.get((current, col))
-        if tile is None:
-            break
-        tiles.append(((current, col), tile))
-        current += 1
-
-    return tiles
+    return board.line_tiles(pos, horizontal=False)
 
 
 def is_valid_line(tiles: List[Tile]) -> bool:
@@ -93,34 +60,7 @@ def is_valid_line(tiles: List[Tile]) -> bool:
     Returns:
         True if the line is valid.
     """
-    if len(tiles) == 0:
-        return True  # Empty line is trivially valid
-
-    if len(tiles) == 1:
-        return True  # Single tile is always valid
-
-    if len(tiles) > 6:
-        return False  # Line too long
-
-    # Check for duplicates
-    if len(tiles) != len(set(tiles)):
-        return False
-
-    # Check shared attribute: all same color OR all same shape (not both, not neither)
-    colors = {t.color for t in tiles}
-    shapes = {t.shape for t in tiles}
-
-    same_color = len(colors) == 1
-    same_shape = len(shapes) == 1
-
-    # Valid if exactly one attribute is shared
-    # (same_color XOR same_shape, but also accept both for single tile which we already handled)
-    if same_color and not same_shape:
-        return True  # All same color, different shapes
-    if same_shape and not same_color:
-        return True  # All same shape, different colors
-
-    return False
+    return line_valid_from_ids([tile.index() for tile in tiles])
 
 
 def are_positions_collinear(positions: List[Position]) -> Optional[str]:
@@ -159,20 +99,13 @@ def are_positions_contiguous(positions: List[Position], direction: str) -> bool:
     if len(positions) <= 1:
         return True
 
-    if direction == 'row':
-        # Same row, check columns are consecutive
-        cols = sorted(p[1] for p in positions)
-        for i in range(1, len(cols)):
-            if cols[i] - cols[i-1] != 1:
-                return False
-    else:
-        # Same column, check rows are consecutive
-        rows = sorted(p[0] for p in positions)
-        for i in range(1, len(rows)):
-            if rows[i] - rows[i-1] != 1:
-                return False
+    # Coordinates along the line: columns for a row, rows for a column
+    axis = 1 if direction == 'row' else 0
+    coords = [p[axis] for p in positions]
 
-    return True
+    # n distinct integers are consecutive exactly when they span n cells
+    return (max(coords) - min(coords) == len(coords) - 1
+            and len(set(coords)) == len(coords))
 
 
 def get_affected_lines(board: Board, positions: List[Position]) -> List[List[Tuple[Position, Tile]]]:
@@ -188,71 +121,53 @@ def get_affected_lines(board: Board, positions: List[Position]) -> List[List[Tup
     Returns:
         List of lines, each line is a list of (position, tile) tuples.
     """
-    seen_lines: Set[Tuple[Tuple[Position, Tile], ...]] = set()
+    # A line is identified by its axis (0 = row, 1 = column), fixed
+    # coordinate, and first cell
+    seen_lines: Set[Tuple[int, int, int]] = set()
     lines = []
+    get = board.get
 
-    for pos in positions:
+    for row, col in positions:
         # Check horizontal line
-        h_line = get_line_horizontal(board, pos)
-        if len(h_line) >= 2:
-            key = tuple(h_line)
-            if key not in seen_lines:
-                seen_lines.add(key)
-                lines.append(h_line)
+        first, last = board.line_extent((row, col), horizontal=True)
+        if last > first and (0, row, first) not in seen_lines:
+            seen_lines.add((0, row, first))
+            lines.append([((row, c), get((row, c))) for c in range(first, last + 1)])
 
         # Check vertical line
-        v_line = get_line_vertical(board, pos)
-        if len(v_line) >= 2:
-            key = tuple(v_line)
-            if key not in seen_lines:
-                seen_lines.add(key)
-                lines.append(v_line)
+        first, last = board.line_extent((row, col), horizontal=False)
+        if last > first and (1, col, first) not in seen_lines:
+            seen_lines.add((1, col, first))
+            lines.append([((r, col), get((r, col))) for r in range(first, last + 1)])
 
     return lines
 
 
-def validate_move(
+def _check_placed_move(
     board: Board,
-    placements: List[Tuple[Position, Tile]],
-    is_first_move: bool = False
-) -> Tuple[bool, str]:
-    """Validate a move before applying it.
+    positions: List[Position],
+    direction: str,
+    is_first_move: bool
+) -> Tuple[str, List[int]]:
+    """Check contiguity, connection, and line validity after placing tiles.
 
     Args:
-        board: Current board state (before placing tiles).
-        placements: List of (position, tile) to place.
+        board: Board with the move's tiles already placed.
+        positions: Positions of the placed tiles.
+        direction: 'row' or 'col' from are_positions_collinear.
         is_first_move: True if this is the first move of the game.
 
     Returns:
-        Tuple of (is_valid, error_message). If valid, error_message is empty.
+        Tuple of (error_message, line_lengths). The error message is empty
+        if the placement is valid; line_lengths then holds the length of
+        every affected 2+ tile line, ready for scoring.
     """
-    if not placements:
-        return False, "Must place at least one tile"
-
-    positions = [p[0] for p in placements]
-    tiles = [p[1] for p in placements]
-
-    # Check all positions are empty
-    for pos in positions:
-        if board.get(pos) is not None:
-            return False, f"Position {pos} is already occupied"
-
-    # Check positions are collinear
-    direction = are_positions_collinear(positions)
-    if direction is None:
-        return False, "All tiles must be placed in the same row or column"
-
-    # Create a temporary board to check the result
-    temp_board = board.copy()
-    for pos, tile in placements:
-        temp_board.place(pos, tile)
-
     # Check tiles are contiguous (including existing tiles in the line)
     # Get the full line after placement - starting from any placed position
     if direction == 'row':
-        full_line = get_line_horizontal(temp_board, positions[0])
+        full_line = get_line_horizontal(board, positions[0])
     else:
-        full_line = get_line_vertical(temp_board, positions[0])
+        full_line = get_line_vertical(board, positions[0])
 
     line_positions = [p[0] for p in full_line]
 
@@ -260,45 +175,89 @@ def validate_move(
     # If any placement position is not in the line, there's a gap
     for pos in positions:
         if pos not in line_positions:
-            return False, "Tiles must be placed in a contiguous line"
+            return "Tiles must be placed in a contiguous line", []
 
     if not are_positions_contiguous(line_positions, direction):
-        return False, "Tiles must be placed in a contiguous line"
+        return "Tiles must be placed in a contiguous line", []
 
     # Check connection to existing tiles (except first move)
-    if not is_first_move:
-        has_connection = False
-        for pos in positions:
-            # Check if any neighbor was on the original board
-            for neighbor in temp_board.neighbor_positions(pos):
-                if neighbor not in positions and board.get(neighbor) is not None:
-                    has_connection = True
-                    break
-            if has_connection:
-                break
-
-        if not has_connection:
-            return False, "Tiles must connect to existing tiles on the board"
-
-    # Check all affected lines are valid
-    affected = get_affected_lines(temp_board, positions)
-
-    # For single tile placements that don't form lines with existing tiles,
-    # we still need to validate the tile itself connects properly
-    if not affected and len(placements) == 1 and not is_first_move:
-        # This case means a single tile was placed but doesn't form a 2+ tile line
-        # This is actually valid - the tile just doesn't score
-        pass
-
-    for line in affected:
-        line_tiles = [t for _, t in line]
-        if not is_valid_line(line_tiles):
-            return False, f"Invalid line: tiles must share exactly one attribute with no duplicates"
+    if not is_first_move and not board.touches_other_tiles(positions):
+        return "Tiles must connect to existing tiles on the board", []
+
+    # Check all affected lines are valid. A single tile that forms no
+    # 2+ tile line is fine - it just doesn't score.
+    lengths = []
+    for line in get_affected_lines(board, positions):
+        if not line_valid_from_ids([t.index() for _, t in line]):
+            return "Invalid line: tiles must share exactly one attribute with no duplicates", []
+        lengths.append(len(line))
+
+    return "", lengths
+
+
+def _validate_placements(
+    board: Board,
+    placements: List[Tuple[Position, Tile]],
+    is_first_move: bool
+) -> Tuple[str, List[int]]:
+    """Validate a move, also returning the affected line lengths.
+
+    Shared by validate_move and scoring.validate_and_score so a move's
+    lines are only extracted once when it is both checked and scored.
+
+    Args:
+        board: Current board state (before placing tiles).
+        placements: List of (position, tile) to place.
+        is_first_move: True if this is the first move of the game.
+
+    Returns:
+        Tuple of (error_message, line_lengths), as from _check_placed_move.
+    """
+    if not placements:
+        return "Must place at least one tile", []
+
+    positions = [p[0] for p in placements]
+    tiles = [p[1] for p in placements]
+
+    # Check all positions are empty
+    for pos in positions:
+        if board.is_occupied(pos):
+            return f"Position {pos} is already occupied", []
+
+    # Check positions are collinear
+    direction = are_positions_collinear(positions)
+    if direction is None:
+        return "All tiles must be placed in the same row or column", []
+
+    # Place the tiles temporarily to check the result
+    with board.temporarily_placed(placements):
+        error, lengths = _check_placed_move(board, positions, direction, is_first_move)
+    if error:
+        return error, []
 
     # Also check the main placement line even if it's not in affected
     # (in case it's a single-tile first move)
     if is_first_move and len(placements) > 1:
         if not is_valid_line(tiles):
-            return False, "Invalid line: tiles must share exactly one attribute with no duplicates"
+            return "Invalid line: tiles must share exactly one attribute with no duplicates", []
+
+    return "", lengths
+
+
+def validate_move(
+    board: Board,
+    placements: List[Tuple[Position, Tile]],
+    is_first_move: bool = False
+) -> Tuple[bool, str]:
+    """Validate a move before applying it.
+
+    Args:
+        board: Current board state (before placing tiles).
+        placements: List of (position, tile) to place.
+        is_first_move: True if this is the first move of the game.
 
-    return True, ""
+    Returns:
+        Tuple of (is_valid, error_message). If valid, error_message is empty.
+    """
+    error, _ = _validate_placements(board, placements, is_first_move)
+    return not error, error
@@ -9,13 +9,15 @@ Scoring rules:
 from typing import List, Tuple
 from src.models.board import Board, Position
 from src.models.tile import Tile
-from src.engine.rules import get_affected_lines
+from src.engine.rules import get_affected_lines, _validate_placements
+from src.engine._kernels import QWIRKLE_SIZE, QWIRKLE_BONUS, score_lines
 
-# Qwirkle = 6 tiles in a line
-QWIRKLE_SIZE = 6
-QWIRKLE_BONUS = 6
 END_GAME_BONUS = 6
 
+# Score of a line by length, 0 through QWIRKLE_SIZE: single tiles don't
+# score and a full line earns the Qwirkle bonus
+_LINE_SCORE = (0, 0) + tuple(range(2, QWIRKLE_SIZE)) + (QWIRKLE_SIZE + QWIRKLE_BONUS,)
+
 
 def calculate_line_score(line_length: int) -> int:
     """Calculate score for a single line.
@@ -26,14 +28,10 @@ def calculate_line_score(line_length: int) -> int:
     Returns:
         Score for the line (includes Qwirkle bonus if applicable).
     """
-    if line_length < 2:
-        return 0  # Lines of 1 don't score
-
-    score = line_length
-    if line_length == QWIRKLE_SIZE:
-        score += QWIRKLE_BONUS  # Qwirkle bonus
-
-    return score
+    if 0 <= line_length <= QWIRKLE_SIZE:
+        return _LINE_SCORE[line_length]
+    # Over-long lines are invalid anyway; score them by length, no bonus
+    return line_length if line_length > QWIRKLE_SIZE else 0
 
 
 def calculate_move_score(
@@ -57,14 +55,8 @@ def calculate_move_score(
     positions = [p[0] for p in placements]
     affected = get_affected_lines(board, positions)
 
-    total_score = 0
-    qwirkle_count = 0
-
-    for line in affected:
-        line_len = len(line)
-        total_score += calculate_line_score(line_len)
-        if line_len == QWIRKLE_SIZE:
-            qwirkle_count += 1
+    # get_affected_lines only returns lines of 2+ tiles, which all score
+    total_score, qwirkle_count = score_lines([len(line) for line in affected])
 
     # Special case: single tile placed with no 2+ tile lines
     # This can happen on first move with single tile - scores 1 point
@@ -89,7 +81,8 @@ def score_move(
 ) -> Tuple[int, int]:
     """Calculate score for a move given the board state before the move.
 
-    Creates a temporary board with the move applied to calculate scoring.
+    Places the tiles on the board temporarily and removes them again
+    before returning.
 
     Args:
         board_before: Board state before tiles are placed.
@@ -101,9 +94,35 @@ def score_move(
     if not placements:
         return 0, 0
 
-    # Create temp board with tiles placed
-    temp_board = board_before.copy()
-    for pos, tile in placements:
-        temp_board.place(pos, tile)
+    with board_before.temporarily_placed(placements):
+        return calculate_move_score(board_before, placements)
+
+
+def validate_and_score(
+    board: Board,
+    placements: List[Tuple[Position, Tile]],
+    is_first_move: bool = False
+) -> Tuple[bool, str, int, int]:
+    """Validate and score a move in one pass.
 
-    return calculate_move_score(temp_board, placements)
+    Equivalent to validate_move followed by score_move, but the tiles
+    are placed and the affected lines extracted only once.
+
+    Args:
+        board: Board state before tiles are placed (left unchanged).
+        placements: List of (position, tile) to place.
+        is_first_move: True if this is the first move of the game.
+
+    Returns:
+        Tuple of (is_valid, error_message, total_score, qwirkle_count).
+        The score is (0, 0) for an invalid move.
+    """
+    error, lengths = _validate_placements(board, placements, is_first_move)
+    if error:
+        return False, error, 0, 0
+
+    # Single tile placed with no 2+ tile lines scores 1 point
+    if not lengths and len(placements) == 1:
+        return True, "", 1, 0
+    total_score, qwirkle_count = score_lines(lengths)
+    return True, "", total_score, qwirkle_count
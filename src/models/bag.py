@@ -5,15 +5,21 @@ Players draw from the bag to fill their hands.
 """
 
 import random
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from src.models.tile import Color, Shape, Tile
+from src.models.tile import Tile, TILE_BY_ID
 
 
 class Bag:
     """The tile bag containing all undrawn tiles.
 
     Starts with 108 tiles: 3 copies of each shape/color combination.
+    Tiles are held as one-byte Tile.index() ids and decoded on draw.
+
+    Copies share the RNG state copy-on-write: a copied bag holds the
+    immutable state tuple and only builds its own Random when it first
+    needs to shuffle. Most cloned states never swap, so they skip the
+    625-word state restore entirely.
     """
 
     COPIES_PER_TILE = 3
@@ -24,16 +30,48 @@ class Bag:
         Args:
             seed: Optional random seed for reproducible shuffling.
         """
-        self._tiles: List[Tile] = []
-        self._rng = random.Random(seed)
+        self._rng: Optional[random.Random] = random.Random(seed)
+        # Shared RNG state, authoritative only while _rng is None
+        self._rng_state: Optional[tuple] = None
+        # False when the RNG came from the caller and may be used elsewhere
+        self._owns_rng = True
+        # True when _ids is unordered and each draw picks at random
+        self._draw_random = False
+        # Index of the next tile to draw; tiles before it are consumed
+        self._head = 0
+
+        # Create 3 copies of each unique tile (6 shapes x 6 colors x 3 = 108),
+        # in the same order as iterating Shape, then Color
+        self._ids = bytearray(
+            tile_id
+            for tile_id in range(len(TILE_BY_ID))
+            for _ in range(self.COPIES_PER_TILE)
+        )
+
+        # Same shuffle calls as on a list of Tiles, so seeded games match
+        self._rng.shuffle(self._ids)
+
+    @classmethod
+    def from_tiles(cls, tiles: List[Tile], rng: random.Random) -> "Bag":
+        """Create a bag holding the given tiles in order.
+
+        Used by simulations that re-deal hidden tiles.
 
-        # Create 3 copies of each unique tile (6 shapes x 6 colors x 3 = 108)
-        for shape in Shape:
-            for color in Color:
-                for _ in range(self.COPIES_PER_TILE):
-                    self._tiles.append(Tile(shape, color))
+        Args:
+            tiles: Tiles in draw order.
+            rng: Random number generator used for later reshuffles.
 
-        self._rng.shuffle(self._tiles)
+        Returns:
+            A new Bag.
+        """
+        bag = cls.__new__(cls)
+        bag._ids = bytearray(t.index() for t in tiles)
+        bag._head = 0
+        bag._rng = rng
+        bag._rng_state = None
+        bag._owns_rng = False
+        bag._draw_random = False
+        return bag
 
     def draw(self, n: int = 1) -> List[Tile]:
         """Draw n tiles from the bag.
@@ -44,9 +82,18 @@ class Bag:
         Returns:
             List of drawn tiles (may be shorter than n if bag is low).
         """
-        n = min(n, len(self._tiles))
-        drawn = self._tiles[:n]
-        self._tiles = self._tiles[n:]
+        head = self._head
+        ids = self._ids
+        end = len(ids)
+        n = min(n, end - head)
+        if self._draw_random:
+            # Lazy Fisher-Yates: only the drawn positions get shuffled
+            randrange = self._get_rng().randrange
+            for i in range(head, head + n):
+                j = randrange(i, end)
+                ids[i], ids[j] = ids[j], ids[i]
+        drawn = [TILE_BY_ID[i] for i in self._ids[head:head + n]]
+        self._head = head + n
         return drawn
 
     def return_tiles(self, tiles: List[Tile]) -> None:
@@ -57,29 +104,101 @@ class Bag:
         Args:
             tiles: Tiles to return to the bag.
         """
-        self._tiles.extend(tiles)
-        self._rng.shuffle(self._tiles)
+        # Drop the drawn prefix so the shuffle only sees tiles in the bag
+        if self._head:
+            del self._ids[:self._head]
+            self._head = 0
+        self._ids.extend(t.index() for t in tiles)
+        self._get_rng().shuffle(self._ids)
+        self._draw_random = False
 
     def remaining(self) -> int:
         """Return the number of tiles left in the bag."""
-        return len(self._tiles)
+        return len(self._ids) - self._head
 
     def is_empty(self) -> bool:
         """Check if the bag is empty."""
-        return len(self._tiles) == 0
+        return self._head == len(self._ids)
 
     def peek(self) -> List[Tile]:
         """Return a copy of all tiles in the bag (for debugging/testing)."""
-        return self._tiles.copy()
+        return [TILE_BY_ID[i] for i in self._ids[self._head:]]
 
     def copy(self) -> "Bag":
         """Create an independent copy of this bag.
 
-        The copy has the same tiles in the same order but independent RNG.
+        The copy has the same tiles in the same order but independent RNG,
+        starting in sync with this one.
         """
         new_bag = Bag.__new__(Bag)
-        new_bag._tiles = self._tiles.copy()
-        new_bag._rng = random.Random()
-        # Sync RNG state for reproducibility
-        new_bag._rng.setstate(self._rng.getstate())
+        new_bag._ids = self._ids[self._head:]
+        new_bag._head = 0
+        new_bag._rng = None
+        new_bag._rng_state = self._share_rng_state()
+        new_bag._owns_rng = True
+        new_bag._draw_random = self._draw_random
         return new_bag
+
+    def _get_rng(self) -> random.Random:
+        """Return this bag's RNG, building it from the shared state if needed."""
+        rng = self._rng
+        if rng is None:
+            # Skip Random.__init__ (which seeds from os.urandom); the state
+            # is overwritten right away
+            rng = random.Random.__new__(random.Random)
+            rng.setstate(self._rng_state)
+            self._rng = rng
+            self._rng_state = None
+        return rng
+
+    def _share_rng_state(self) -> tuple:
+        """Return the current RNG state for a copy to share.
+
+        A bag that owns its RNG switches to the shared state as well, so
+        repeated copies of one bag snapshot the RNG only once.
+        """
+        if self._rng is None:
+            return self._rng_state
+        state = self._rng.getstate()
+        if self._owns_rng:
+            self._rng = None
+            self._rng_state = state
+        return state
+
+    def replace_ids(
+        self,
+        ids: Iterable[int],
+        rng: random.Random,
+        shuffled: bool = True
+    ) -> None:
+        """Refill the bag in place, like from_tiles but reusing this bag.
+
+        Args:
+            ids: Tile.index() ids in draw order.
+            rng: Random number generator used for later reshuffles.
+            shuffled: If False, ids are taken as unordered and each draw
+                picks uniformly from what is left, so tiles that are
+                never drawn are never shuffled.
+        """
+        self._ids[:] = ids
+        self._head = 0
+        self._rng = rng
+        self._rng_state = None
+        self._owns_rng = False
+        self._draw_random = not shuffled
+
+    def reset_from(self, other: "Bag") -> None:
+        """Overwrite this bag with the tiles and RNG state of another.
+
+        Reuses this bag's buffer; like copy(), the RNG stays independent
+        but starts in sync.
+
+        Args:
+            other: Bag to copy from.
+        """
+        self._ids[:] = other._ids[other._head:]
+        self._head = 0
+        self._rng = None
+        self._rng_state = other._share_rng_state()
+        self._owns_rng = True
+        self._draw_random = other._draw_random
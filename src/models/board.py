@@ -4,25 +4,69 @@ Uses a sparse dictionary representation for an infinite grid.
 Positions are (row, col) tuples where (0, 0) is the center.
 """
 
-from typing import Dict, List, Tuple, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import count
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple, Optional
 
-from src.models.tile import Tile
+from src.models.tile import Tile, TILE_BY_ID
 
 
 # Type alias for board positions
 Position = Tuple[int, int]
 
+_MASK64 = (1 << 64) - 1
+
+# Board versions come from one shared counter so a number is never
+# reused, even after undo_many restores an earlier version
+_next_version = count(1).__next__
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(row: int, col: int, tile_index: int) -> int:
+    """Pseudo-random 64-bit key for a tile type at a board position.
+
+    Derived with the splitmix64 finalizer rather than a random table so
+    the board can stay unbounded and keys agree across processes.
+
+    Args:
+        row: Board row.
+        col: Board column.
+        tile_index: Tile.index() of the placed tile (0-35).
+
+    Returns:
+        64-bit integer key.
+    """
+    z = (((row & 0xFFFF) << 24) | ((col & 0xFFFF) << 8) | tile_index) + 0x9E3779B97F4A7C15
+    z &= _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
 
 class Board:
     """The game board using sparse representation.
 
-    Tiles are stored in a dict mapping (row, col) -> Tile.
-    The grid has no fixed bounds and grows as tiles are placed.
+    Tiles are stored in a dict mapping (row, col) -> Tile.index() id and
+    converted back to Tile on lookup. The grid has no fixed bounds and
+    grows as tiles are placed.
     """
 
     def __init__(self):
         """Create an empty board."""
-        self._grid: Dict[Position, Tile] = {}
+        self._grid: Dict[Position, int] = {}
+        # Empty positions orthogonally adjacent to at least one tile,
+        # maintained incrementally by place/remove
+        self._frontier: Set[Position] = set()
+        # Bumped on every mutation so derived data can be cached per state
+        self._version = 0
+        # XOR of zobrist_key over all placed tiles
+        self._zobrist = 0
+        # Occupancy bitmasks per row (bit col + bias) and per column
+        # (bit row + bias); the bias grows if tiles go further negative
+        self._row_occ: Dict[int, int] = {}
+        self._col_occ: Dict[int, int] = {}
+        self._occ_bias = 64
 
     def place(self, pos: Position, tile: Tile) -> None:
         """Place a tile at a position.
@@ -34,9 +78,94 @@ class Board:
         Raises:
             ValueError: If the position is already occupied.
         """
-        if pos in self._grid:
+        grid = self._grid
+        if pos in grid:
             raise ValueError(f"Position {pos} is already occupied")
-        self._grid[pos] = tile
+        tile_id = tile.index()
+        frontier = self._frontier
+        grid[pos] = tile_id
+        frontier.discard(pos)
+        row, col = pos
+        for neighbor in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if neighbor not in grid:
+                frontier.add(neighbor)
+        self._zobrist ^= zobrist_key(row, col, tile_id)
+        self._version = _next_version()
+
+        if min(row, col) + self._occ_bias < 0:
+            self._grow_bias(-min(row, col))
+        bias = self._occ_bias
+        self._row_occ[row] = self._row_occ.get(row, 0) | (1 << (col + bias))
+        self._col_occ[col] = self._col_occ.get(col, 0) | (1 << (row + bias))
+
+    def _grow_bias(self, needed: int) -> None:
+        """Widen the occupancy bias to at least needed, shifting all masks."""
+        new_bias = self._occ_bias
+        while new_bias < needed:
+            new_bias *= 2
+        shift = new_bias - self._occ_bias
+        self._row_occ = {r: mask << shift for r, mask in self._row_occ.items()}
+        self._col_occ = {c: mask << shift for c, mask in self._col_occ.items()}
+        self._occ_bias = new_bias
+
+    def place_many(self, placements: List[Tuple[Position, Tile]]) -> Tuple[int, List[Position]]:
+        """Place several tiles, returning a token for undo_many.
+
+        If any position is occupied, tiles placed so far are removed
+        again before the error propagates.
+
+        Args:
+            placements: List of (position, tile) to place.
+
+        Returns:
+            Opaque token to pass to undo_many.
+
+        Raises:
+            ValueError: If a position is already occupied.
+        """
+        version = self._version
+        placed: List[Position] = []
+        try:
+            for pos, tile in placements:
+                self.place(pos, tile)
+                placed.append(pos)
+        except ValueError:
+            self.undo_many((version, placed))
+            raise
+        return version, placed
+
+    def undo_many(self, token: Tuple[int, List[Position]]) -> None:
+        """Remove tiles placed by place_many and restore the prior state.
+
+        Args:
+            token: Value returned by place_many.
+        """
+        version, placed = token
+        for pos in reversed(placed):
+            self.remove(pos)
+        # The board is exactly as it was, so cached data for the old
+        # version is valid again
+        self._version = version
+
+    @contextmanager
+    def temporarily_placed(self, placements: List[Tuple[Position, Tile]]) -> Iterator["Board"]:
+        """Context manager that places tiles and undoes them on exit.
+
+        Lets validation and scoring inspect the board after a move
+        without copying it. Not safe to share the board across threads
+        while inside the block.
+
+        Args:
+            placements: List of (position, tile) to place.
+
+        Yields:
+            This board, with the placements applied.
+        """
+        token = self.place_many(placements)
+        try:
+            yield self
+        finally:
+            self.undo_many(token)
 
     def get(self, pos: Position) -> Optional[Tile]:
         """Get the tile at a position, or None if empty.
@@ -47,6 +176,11 @@ class Board:
         Returns:
             The tile at that position, or None.
         """
+        tile_id = self._grid.get(pos)
+        return None if tile_id is None else TILE_BY_ID[tile_id]
+
+    def get_id(self, pos: Position) -> Optional[int]:
+        """Get the Tile.index() id at a position, or None if empty."""
         return self._grid.get(pos)
 
     def is_empty(self, pos: Position) -> bool:
@@ -66,7 +200,24 @@ class Board:
         Returns:
             The removed tile, or None if position was empty.
         """
-        return self._grid.pop(pos, None)
+        tile_id = self._grid.pop(pos, None)
+        if tile_id is not None:
+            # Neighbors may no longer touch any tile; pos itself may now
+            # be a frontier cell
+            row, col = pos
+            grid = self._grid
+            for neighbor in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if neighbor not in grid and not self._touches_tile(neighbor):
+                    self._frontier.discard(neighbor)
+            if self._touches_tile(pos):
+                self._frontier.add(pos)
+            self._zobrist ^= zobrist_key(row, col, tile_id)
+            self._version = _next_version()
+            bias = self._occ_bias
+            self._row_occ[row] &= ~(1 << (col + bias))
+            self._col_occ[col] &= ~(1 << (row + bias))
+            return TILE_BY_ID[tile_id]
+        return None
 
     def neighbors(self, pos: Position) -> Dict[str, Optional[Tile]]:
         """Get the four orthogonal neighbors of a position.
@@ -79,12 +230,15 @@ class Board:
             tiles (or None if that neighbor is empty).
         """
         row, col = pos
-        return {
-            "up": self.get((row - 1, col)),
-            "down": self.get((row + 1, col)),
-            "left": self.get((row, col - 1)),
-            "right": self.get((row, col + 1)),
-        }
+        get = self._grid.get
+        ids = (
+            get((row - 1, col)),
+            get((row + 1, col)),
+            get((row, col - 1)),
+            get((row, col + 1)),
+        )
+        up, down, left, right = (None if i is None else TILE_BY_ID[i] for i in ids)
+        return {"up": up, "down": down, "left": left, "right": right}
 
     def neighbor_positions(self, pos: Position) -> List[Position]:
         """Get the four orthogonal neighbor positions.
@@ -105,7 +259,112 @@ class Board:
 
     def has_neighbor(self, pos: Position) -> bool:
         """Check if a position has at least one adjacent tile."""
-        return any(self.is_occupied(n) for n in self.neighbor_positions(pos))
+        if pos in self._frontier:
+            return True
+        if pos not in self._grid:
+            return False
+        return self._touches_tile(pos)
+
+    def _touches_tile(self, pos: Position) -> bool:
+        """Check adjacency by scanning the grid, ignoring the frontier."""
+        grid = self._grid
+        row, col = pos
+        return ((row - 1, col) in grid or (row + 1, col) in grid
+                or (row, col - 1) in grid or (row, col + 1) in grid)
+
+    def touches_other_tiles(self, positions: List[Position]) -> bool:
+        """Check if any of a group of placed tiles has a neighbor outside it.
+
+        Used to check that a move connects to tiles already on the board.
+        The group's own bits are masked out of the row/column occupancy
+        masks, then each position tests both neighbors on an axis at once.
+
+        Args:
+            positions: Occupied positions forming the group.
+
+        Returns:
+            True if any position is adjacent to a tile not in positions.
+        """
+        bias = self._occ_bias
+        group_rows: Dict[int, int] = {}
+        group_cols: Dict[int, int] = {}
+        for row, col in positions:
+            group_rows[row] = group_rows.get(row, 0) | (1 << (col + bias))
+            group_cols[col] = group_cols.get(col, 0) | (1 << (row + bias))
+
+        row_occ = self._row_occ
+        col_occ = self._col_occ
+        for row, col in positions:
+            # Shift up one so the lower neighbor never needs a negative shift;
+            # bits 0 and 2 are then the two neighbors along the axis
+            others = row_occ.get(row, 0) & ~group_rows[row]
+            if (others << 1 >> (col + bias)) & 0b101:
+                return True
+            others = col_occ.get(col, 0) & ~group_cols[col]
+            if (others << 1 >> (row + bias)) & 0b101:
+                return True
+        return False
+
+    def line_extent(self, pos: Position, horizontal: bool) -> Tuple[int, int]:
+        """Find the contiguous run of tiles through a position.
+
+        Uses the row/column occupancy bitmasks, so the run ends are found
+        with a couple of integer operations rather than cell-by-cell.
+        If pos is empty, the run is the one ending just before it
+        (possibly empty, in which case first > last).
+
+        Args:
+            pos: The (row, col) position.
+            horizontal: Scan along the row if True, else along the column.
+
+        Returns:
+            Tuple of (first, last) column (or row) of the run, inclusive.
+        """
+        row, col = pos
+        if horizontal:
+            mask = self._row_occ.get(row, 0)
+            coord = col
+        else:
+            mask = self._col_occ.get(col, 0)
+            coord = row
+        bias = self._occ_bias
+        bit = coord + bias
+        if bit < 0:
+            # Further out than any tile
+            return coord, coord - 1
+
+        # First cell of the run: just above the highest empty cell below bit
+        empty_below = ~mask & ((1 << bit) - 1)
+        first = empty_below.bit_length()
+
+        # Last cell: just below the lowest empty cell at or above bit
+        empty_above = ~mask >> bit
+        last = bit + (empty_above & -empty_above).bit_length() - 2
+
+        return first - bias, last - bias
+
+    def line_tiles(self, pos: Position, horizontal: bool) -> List[Tuple[Position, Tile]]:
+        """Get the contiguous run of tiles through a position.
+
+        Args:
+            pos: The (row, col) position.
+            horizontal: Read along the row if True, else along the column.
+
+        Returns:
+            List of (position, tile) tuples in increasing coordinate order
+            (empty if pos is empty and has no run ending just before it).
+        """
+        first, last = self.line_extent(pos, horizontal)
+        # Every cell in the extent is occupied, so index the grid directly
+        grid = self._grid
+        row, col = pos
+        if horizontal:
+            return [((row, c), TILE_BY_ID[grid[(row, c)]]) for c in range(first, last + 1)]
+        return [((r, col), TILE_BY_ID[grid[(r, col)]]) for r in range(first, last + 1)]
+
+    def frontier(self) -> FrozenSet[Position]:
+        """Return all empty positions adjacent to at least one tile."""
+        return frozenset(self._frontier)
 
     def bounds(self) -> Tuple[int, int, int, int]:
         """Get the bounding box of all placed tiles.
@@ -117,8 +376,10 @@ class Board:
         if not self._grid:
             return (0, 0, 0, 0)
 
-        rows = [pos[0] for pos in self._grid]
-        cols = [pos[1] for pos in self._grid]
+        # Read the extent off the occupancy masks: one entry per line
+        # instead of one per tile
+        rows = [r for r, mask in self._row_occ.items() if mask]
+        cols = [c for c, mask in self._col_occ.items() if mask]
         return (min(rows), max(rows), min(cols), max(cols))
 
     def get_row(self, row: int, col_start: int, col_end: int) -> List[Tuple[Position, Tile]]:
@@ -132,12 +393,10 @@ class Board:
         Returns:
             List of (position, tile) tuples, sorted by column.
         """
-        result = []
-        for col in range(col_start, col_end + 1):
-            tile = self.get((row, col))
-            if tile:
-                result.append(((row, col), tile))
-        return result
+        return [
+            ((row, col), TILE_BY_ID[self._grid[(row, col)]])
+            for col in self._occupied_in(self._row_occ.get(row, 0), col_start, col_end)
+        ]
 
     def get_col(self, col: int, row_start: int, row_end: int) -> List[Tuple[Position, Tile]]:
         """Get all tiles in a column within a row range.
@@ -150,12 +409,35 @@ class Board:
         Returns:
             List of (position, tile) tuples, sorted by row.
         """
-        result = []
-        for row in range(row_start, row_end + 1):
-            tile = self.get((row, col))
-            if tile:
-                result.append(((row, col), tile))
-        return result
+        return [
+            ((row, col), TILE_BY_ID[self._grid[(row, col)]])
+            for row in self._occupied_in(self._col_occ.get(col, 0), row_start, row_end)
+        ]
+
+    def _occupied_in(self, mask: int, start: int, end: int) -> List[int]:
+        """List the occupied coordinates of a line mask within a range.
+
+        Args:
+            mask: Row or column occupancy mask.
+            start: First coordinate (inclusive).
+            end: Last coordinate (inclusive).
+
+        Returns:
+            Occupied coordinates in increasing order.
+        """
+        bias = self._occ_bias
+        lo = max(start + bias, 0)
+        hi = end + bias
+        if hi < lo:
+            return []
+        # Keep bits lo..hi, then peel off the lowest set bit each step
+        mask = (mask >> lo) & ((1 << (hi - lo + 1)) - 1)
+        coords = []
+        while mask:
+            low = mask & -mask
+            coords.append(low.bit_length() - 1 + lo - bias)
+            mask ^= low
+        return coords
 
     def tile_count(self) -> int:
         """Return the number of tiles on the board."""
@@ -165,16 +447,63 @@ class Board:
         """Check if the board has no tiles."""
         return len(self._grid) == 0
 
+    def version(self) -> int:
+        """Return a number that changes whenever the board is modified.
+
+        Numbers come from a shared counter and are never reused for a
+        different board state.
+        """
+        return self._version
+
+    def zobrist(self) -> int:
+        """Return a 64-bit hash of the tiles on the board.
+
+        Updated incrementally on place/remove, so boards with the same
+        tiles in the same positions hash equal regardless of move order.
+        """
+        return self._zobrist
+
     def all_positions(self) -> List[Position]:
         """Return all occupied positions."""
         return list(self._grid.keys())
 
     def all_tiles(self) -> List[Tuple[Position, Tile]]:
         """Return all (position, tile) pairs."""
-        return list(self._grid.items())
+        return [(pos, TILE_BY_ID[tile_id]) for pos, tile_id in self._grid.items()]
+
+    def tile_ids(self) -> List[int]:
+        """Return the Tile.index() ids of all placed tiles."""
+        return list(self._grid.values())
 
     def copy(self) -> "Board":
         """Create a deep copy of the board."""
-        new_board = Board()
+        # Skip __init__: every container it would allocate is replaced
+        new_board = Board.__new__(Board)
         new_board._grid = self._grid.copy()
+        new_board._frontier = self._frontier.copy()
+        new_board._version = self._version
+        new_board._zobrist = self._zobrist
+        new_board._row_occ = self._row_occ.copy()
+        new_board._col_occ = self._col_occ.copy()
+        new_board._occ_bias = self._occ_bias
         return new_board
+
+    def reset_from(self, other: "Board") -> None:
+        """Overwrite this board with the contents of another, in place.
+
+        Reuses this board's containers instead of allocating new ones.
+
+        Args:
+            other: Board to copy from.
+        """
+        self._grid.clear()
+        self._grid.update(other._grid)
+        self._frontier.clear()
+        self._frontier.update(other._frontier)
+        self._version = other._version
+        self._zobrist = other._zobrist
+        self._row_occ.clear()
+        self._row_occ.update(other._row_occ)
+        self._col_occ.clear()
+        self._col_occ.update(other._col_occ)
+        self._occ_bias = other._occ_bias
@@ -3,16 +3,18 @@
 Each player holds up to 6 tiles in their hand.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from src.models.tile import Tile
+from src.models.tile import Tile, TILE_BY_ID
 from src.models.bag import Bag
 
 
 class Hand:
     """A player's hand of tiles.
 
-    Holds up to MAX_SIZE tiles (default 6).
+    Holds up to MAX_SIZE tiles (default 6). Tiles are stored as their
+    one-byte Tile.index() ids and converted back to Tile on the way out,
+    alongside a per-id count vector for membership and multiset checks.
     """
 
     MAX_SIZE = 6
@@ -26,11 +28,20 @@ class Hand:
         Raises:
             ValueError: If initial tiles exceed MAX_SIZE.
         """
-        self._tiles: List[Tile] = []
+        self._ids = bytearray()
+        # Copies of each tile id held, indexed by Tile.index()
+        self._counts = bytearray(len(TILE_BY_ID))
         if tiles:
             if len(tiles) > self.MAX_SIZE:
                 raise ValueError(f"Hand cannot exceed {self.MAX_SIZE} tiles")
-            self._tiles = list(tiles)
+            self._extend(t.index() for t in tiles)
+
+    def _extend(self, ids: Iterable[int]) -> None:
+        """Append tile ids, keeping the count vector in sync."""
+        counts = self._counts
+        for tile_id in ids:
+            self._ids.append(tile_id)
+            counts[tile_id] += 1
 
     def add(self, tiles: List[Tile]) -> None:
         """Add tiles to the hand.
@@ -41,9 +52,9 @@ class Hand:
         Raises:
             ValueError: If adding would exceed MAX_SIZE.
         """
-        if len(self._tiles) + len(tiles) > self.MAX_SIZE:
+        if len(self._ids) + len(tiles) > self.MAX_SIZE:
             raise ValueError(f"Cannot exceed {self.MAX_SIZE} tiles in hand")
-        self._tiles.extend(tiles)
+        self._extend(t.index() for t in tiles)
 
     def remove(self, tiles: List[Tile]) -> None:
         """Remove specific tiles from the hand.
@@ -54,14 +65,18 @@ class Hand:
         Raises:
             ValueError: If any tile is not in the hand.
         """
-        # Work with a copy to validate all tiles exist first
-        remaining = self._tiles.copy()
-        for tile in tiles:
-            try:
-                remaining.remove(tile)
-            except ValueError:
+        # Check every tile is held (counting repeats) before changing anything
+        ids = [tile.index() for tile in tiles]
+        counts = self._counts
+        needed = {}
+        for tile, tile_id in zip(tiles, ids):
+            needed[tile_id] = needed.get(tile_id, 0) + 1
+            if needed[tile_id] > counts[tile_id]:
                 raise ValueError(f"Tile {tile} not in hand")
-        self._tiles = remaining
+
+        for tile_id in ids:
+            self._ids.remove(tile_id)
+            counts[tile_id] -= 1
 
     def refill(self, bag: Bag) -> int:
         """Refill hand to MAX_SIZE from the bag.
@@ -72,42 +87,89 @@ class Hand:
         Returns:
             Number of tiles drawn.
         """
-        needed = self.MAX_SIZE - len(self._tiles)
+        needed = self.MAX_SIZE - len(self._ids)
         if needed <= 0:
             return 0
         drawn = bag.draw(needed)
-        self._tiles.extend(drawn)
+        self._extend(t.index() for t in drawn)
         return len(drawn)
 
     def tiles(self) -> List[Tile]:
         """Return a copy of the tiles in hand."""
-        return self._tiles.copy()
+        return [TILE_BY_ID[i] for i in self._ids]
+
+    def first_tile(self) -> Tile:
+        """Return the first tile in hand without copying the hand.
+
+        Raises:
+            IndexError: If the hand is empty.
+        """
+        return TILE_BY_ID[self._ids[0]]
+
+    def tile_ids(self) -> bytes:
+        """Return the Tile.index() ids of the tiles in hand."""
+        return bytes(self._ids)
+
+    def counts(self) -> bytes:
+        """Return the number of copies held of each Tile.index() id.
+
+        Independent of tile order, so it can key caches directly.
+        """
+        return bytes(self._counts)
 
     def size(self) -> int:
         """Return the number of tiles in hand."""
-        return len(self._tiles)
+        return len(self._ids)
 
     def is_empty(self) -> bool:
         """Check if the hand is empty."""
-        return len(self._tiles) == 0
+        return len(self._ids) == 0
 
     def contains(self, tile: Tile) -> bool:
         """Check if a specific tile is in the hand."""
-        return tile in self._tiles
+        return self._counts[tile.index()] > 0
 
     def count(self, tile: Tile) -> int:
         """Count how many copies of a tile are in the hand."""
-        return self._tiles.count(tile)
+        return self._counts[tile.index()]
 
     def __len__(self) -> int:
-        return len(self._tiles)
+        return len(self._ids)
 
     def __contains__(self, tile: Tile) -> bool:
-        return tile in self._tiles
+        return isinstance(tile, Tile) and self._counts[tile.index()] > 0
 
     def __iter__(self):
-        return iter(self._tiles)
+        return iter(self.tiles())
 
     def copy(self) -> "Hand":
         """Create an independent copy of this hand."""
-        return Hand(self._tiles.copy())
+        new_hand = Hand.__new__(Hand)
+        new_hand._ids = self._ids.copy()
+        new_hand._counts = self._counts.copy()
+        return new_hand
+
+    def replace_ids(self, ids: Iterable[int]) -> None:
+        """Replace the hand's tiles with the given ids, in place.
+
+        Args:
+            ids: Tile.index() ids of the new tiles (at most MAX_SIZE).
+
+        Raises:
+            ValueError: If ids exceed MAX_SIZE.
+        """
+        ids = bytes(ids)
+        if len(ids) > self.MAX_SIZE:
+            raise ValueError(f"Hand cannot exceed {self.MAX_SIZE} tiles")
+        self._ids.clear()
+        self._counts[:] = bytes(len(TILE_BY_ID))
+        self._extend(ids)
+
+    def reset_from(self, other: "Hand") -> None:
+        """Overwrite this hand with the tiles of another, in place.
+
+        Args:
+            other: Hand to copy from.
+        """
+        self._ids[:] = other._ids
+        self._counts[:] = other._counts
@@ -6,6 +6,7 @@ giving 36 unique tile types. The game has 3 copies of each = 108 tiles total.
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Dict, Tuple
 
 
 class Color(Enum):
@@ -28,18 +29,86 @@ class Shape(Enum):
     CROSS = "cross"
 
 
-@dataclass(frozen=True)
+# Position of each enum member in declaration order (0-5)
+_SHAPE_INDEX = {shape: i for i, shape in enumerate(Shape)}
+_COLOR_INDEX = {color: i for i, color in enumerate(Color)}
+
+
+@dataclass(frozen=True, eq=False, init=False)
 class Tile:
     """A single Qwirkle tile with a shape and color.
 
     Frozen (immutable) so it can be used in sets and as dict keys.
+    Interned: Tile(shape, color) always returns the one shared instance
+    for that tile type, so equal tiles are identical objects. Equality
+    and hashing use the cached compact index, so they are single
+    integer operations rather than enum comparisons.
+
+    Attributes:
+        shape: The tile's shape.
+        color: The tile's color.
+        shape_idx: Position of shape in Shape (0-5), for int-only loops.
+        color_idx: Position of color in Color (0-5), for int-only loops.
     """
     shape: Shape
     color: Color
 
+    def __new__(cls, shape: Shape, color: Color) -> "Tile":
+        tile = _POOL.get((shape, color))
+        if tile is not None:
+            return tile
+
+        # Only reached while the pool is built at import (or for invalid
+        # arguments, which raise KeyError on the index lookup)
+        shape_idx = _SHAPE_INDEX[shape]
+        color_idx = _COLOR_INDEX[color]
+        tile = super().__new__(cls)
+        # Frozen dataclasses need object.__setattr__
+        object.__setattr__(tile, "shape", shape)
+        object.__setattr__(tile, "color", color)
+        object.__setattr__(tile, "shape_idx", shape_idx)
+        object.__setattr__(tile, "color_idx", color_idx)
+        object.__setattr__(tile, "_index", shape_idx * 6 + color_idx)
+        return tile
+
+    def __reduce__(self):
+        # Unpickle and copy through Tile() so the shared instance is reused
+        return (Tile, (self.shape, self.color))
+
+    def index(self) -> int:
+        """Compact integer id for this tile type (0-35).
+
+        Computed as shape_index * 6 + color_index, so each of the 36
+        unique tiles maps to a distinct bit in a 64-bit mask.
+        """
+        return self._index
+
+    @staticmethod
+    def from_index(index: int) -> "Tile":
+        """Return the shared Tile for a compact index (inverse of index())."""
+        return TILE_BY_ID[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Tile):
+            return self._index == other._index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._index
+
     def __str__(self) -> str:
         """Human-readable representation, e.g., 'red circle'."""
         return f"{self.color.value} {self.shape.value}"
 
     def __repr__(self) -> str:
         return f"Tile({self.shape.name}, {self.color.name})"
+
+
+# Interned instances by (shape, color); filled once below
+_POOL: Dict[Tuple[Shape, Color], Tile] = {}
+
+# One shared instance per tile type, ordered by Tile.index()
+TILE_BY_ID: Tuple[Tile, ...] = tuple(
+    Tile(shape, color) for shape in Shape for color in Color
+)
+_POOL.update(((tile.shape, tile.color), tile) for tile in TILE_BY_ID)
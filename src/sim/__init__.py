@@ -25,5 +25,6 @@ from src.sim.recorder import (
     record_batch,
     save_trajectories,
     load_trajectories,
+    iter_trajectories,
     trajectories_to_numpy,
 )
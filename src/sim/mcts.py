@@ -0,0 +1,178 @@
+"""UCB-guided search for win probability estimation.
+
+Flat Monte Carlo plays every simulation out from the root with the
+playout solver's choice of first move. Here each simulation instead
+picks the mover's first move with UCB1, so rollouts concentrate on the
+moves the mover would actually consider and fewer are spent on
+obviously losing ones.
+
+Hidden tiles are re-dealt before every simulation, so which root moves
+are legal can change between simulations (when the opponent of the
+viewer is to move). Following information-set MCTS, UCB then counts
+how often each child was available in place of the parent's visits.
+"""
+
+import math
+import pickle
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.engine.game import GameState, commit_move
+from src.ai.move_gen import Move, _move_key, generate_all_moves
+from src.sim.win_prob import TIE, _deal_hidden, _make_solver, _outcome, _play_out
+
+# UCB1 exploration constant
+EXPLORATION = math.sqrt(2)
+
+# Root moves considered, best immediate score first
+TREE_WIDTH = 8
+
+
+class Node:
+    """Search statistics for the root or one of its moves.
+
+    Attributes:
+        visits: Simulations played through this node.
+        wins: Simulations won by each player, ties counting half.
+        available: Simulations in which this node's move was legal.
+        children: Child nodes keyed by move key.
+    """
+
+    __slots__ = ("visits", "wins", "available", "children")
+
+    def __init__(self):
+        self.visits = 0
+        self.wins = [0.0, 0.0]
+        self.available = 0
+        self.children: Dict[Tuple[int, ...], "Node"] = {}
+
+    def ucb(self, player: int) -> float:
+        """UCB1 score of this node for the given player.
+
+        Args:
+            player: Player choosing among this node's siblings.
+
+        Returns:
+            Mean win share plus the exploration bonus
+            C * sqrt(ln(available) / visits).
+        """
+        return (
+            self.wins[player] / self.visits
+            + EXPLORATION * math.sqrt(math.log(self.available) / self.visits)
+        )
+
+
+def _select(root: Node, moves: List[Move], player: int) -> Optional[Move]:
+    """Pick the move to play this simulation.
+
+    The first unvisited move (in score order) is expanded; once every
+    available move has been visited, the one with the best UCB1 score
+    is chosen.
+
+    Args:
+        root: Root node, updated with availability counts.
+        moves: Moves legal under this simulation's deal.
+        player: Player to move at the root.
+
+    Returns:
+        The selected Move, or None if there are no moves.
+    """
+    children = root.children
+    best = None
+    best_score = -math.inf
+    unvisited = None
+    for move in moves:
+        key = _move_key(move)
+        child = children.get(key)
+        if child is None:
+            child = children[key] = Node()
+        child.available += 1
+        if child.visits == 0:
+            if unvisited is None:
+                unvisited = move
+        elif unvisited is None:
+            score = child.ucb(player)
+            if score > best_score:
+                best = move
+                best_score = score
+    return unvisited if unvisited is not None else best
+
+
+def search_batch(
+    state_pickle: bytes,
+    viewer: int,
+    solver_type: str,
+    seed: int,
+    n: Optional[int],
+    time_budget: Optional[float] = None,
+    max_turns: int = 100
+) -> Tuple[float, float, float, float, int]:
+    """Run UCB-guided simulations from a pickled root position.
+
+    Takes and returns the same values as win_prob.simulate_batch, so
+    the two are interchangeable as worker bodies.
+
+    Args:
+        state_pickle: Pickled (GameState, unseen tile ids) tuple.
+        viewer: Index of the viewing player.
+        solver_type: "greedy" or "random" for playouts after the root.
+        seed: Seed for this worker's RNG.
+        n: Number of simulations to run, or None for no limit.
+        time_budget: If given, stop starting new simulations once this
+            many seconds have passed (at least one is always run).
+        max_turns: Maximum turns per playout.
+
+    Returns:
+        Tuple of (player 0 wins, player 1 wins, ties, sum of squared
+        weights, simulations run), counted over every simulation at
+        the root. All weights are 1.
+    """
+    state, unseen_ids = pickle.loads(state_pickle)
+    rng = random.Random(seed)
+    scratch = bytearray(len(unseen_ids))
+    solver = _make_solver(solver_type, seed)
+
+    root = Node()
+    player = state.current_player
+    # Summed outcomes at the root: player 0, player 1, tie
+    totals = [0.0, 0.0, 0.0]
+
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    done = 0
+
+    # One scratch state, reset to the root before each simulation
+    sim_state = state.clone()
+    while n is None or done < n:
+        if deadline is not None and done and time.monotonic() >= deadline:
+            break
+        done += 1
+        sim_state.reset_from(state)
+        sim_rng = random.Random(rng.randint(0, 2**31))
+        _deal_hidden(sim_state, unseen_ids, viewer, sim_rng, scratch)
+
+        moves = generate_all_moves(
+            sim_state.board,
+            sim_state.hands[player],
+            sim_state.board.is_board_empty(),
+            top_k=TREE_WIDTH,
+        )
+        move = _select(root, moves, player)
+        if move is not None:
+            commit_move(sim_state, move.placements, move.score, move.qwirkles)
+        _play_out(sim_state, solver, max_turns)
+
+        outcome = _outcome(sim_state)
+        totals[outcome] += 1.0
+
+        # Backpropagate to the root and the chosen child
+        nodes = [root] if move is None else [root, root.children[_move_key(move)]]
+        for node in nodes:
+            node.visits += 1
+            if outcome == TIE:
+                node.wins[0] += 0.5
+                node.wins[1] += 0.5
+            else:
+                node.wins[outcome] += 1.0
+
+    return totals[0], totals[1], totals[2], float(done), done
@@ -5,17 +5,32 @@ Records complete game trajectories with state/action/reward for training.
 
 import json
 import pickle
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Tuple, Dict, Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Dict
 from pathlib import Path
 
-from src.models.tile import Tile, Color, Shape
+from src.models.tile import Tile
 from src.models.board import Board, Position
 from src.models.hand import Hand
 from src.engine.game import GameState, new_game, apply_move, apply_swap
 from src.ai.solver import GreedySolver, RandomSolver, Solver
 import random as stdlib_random
 from src.ai.move_gen import Move, generate_all_moves
+from src.sim.runner import _GREEDY, _chunksize
+
+# Snapshot boards are a BOARD_SIZE x BOARD_SIZE window centered on the
+# origin, stored as int8 (shape, color) channels with 0 = empty
+BOARD_SIZE = 21
+_BOARD_OFFSET = BOARD_SIZE // 2
+
+# JSON "row,col" key for each grid cell, and back; built once so export
+# and import don't format or parse strings per tile
+_CELL_KEYS = tuple(
+    f"{r - _BOARD_OFFSET},{c - _BOARD_OFFSET}"
+    for r in range(BOARD_SIZE)
+    for c in range(BOARD_SIZE)
+)
+_KEY_CELLS = {key: cell for cell, key in enumerate(_CELL_KEYS)}
 
 
 class EpsilonGreedySolver(Solver):
@@ -24,10 +39,23 @@ class EpsilonGreedySolver(Solver):
     With probability epsilon, picks a random move instead of the base solver's choice.
     """
 
+    # Explore/exploit decisions drawn per refill of the coin buffer
+    COIN_BATCH = 256
+
     def __init__(self, base_solver: Solver, epsilon: float, seed: Optional[int] = None):
         self.base = base_solver
         self.epsilon = epsilon
         self._rng = stdlib_random.Random(seed)
+        self._coins: List[bool] = []
+
+    def _explore(self) -> bool:
+        """Pop the next explore decision, refilling the buffer in one batch."""
+        coins = self._coins
+        if not coins:
+            rand = self._rng.random
+            epsilon = self.epsilon
+            coins.extend([rand() < epsilon for _ in range(self.COIN_BATCH)])
+        return coins.pop()
 
     def select_move(self, state: GameState, moves: Optional[List[Move]] = None) -> Optional[Move]:
         if moves is None:
@@ -39,39 +67,55 @@ class EpsilonGreedySolver(Solver):
             return None
 
         # Epsilon chance of random move
-        if self._rng.random() < self.epsilon:
+        if self._explore():
             return self._rng.choice(moves)
 
         return self.base.select_move(state, moves)
 
     def get_move(self, state: GameState) -> Optional[Move]:
+        # Exploit turns go straight to the base solver, which generates only
+        # what it needs (top-k pruning, its move cache); only exploring needs
+        # the full move list
+        if not self._explore():
+            return self.base.get_move(state)
+
         hand = state.hands[state.current_player]
         is_first = state.board.is_board_empty()
         moves = generate_all_moves(state.board, hand, is_first)
-        return self.select_move(state, moves)
+        if not moves:
+            return None
+        return self._rng.choice(moves)
 
 
-@dataclass
+@dataclass(slots=True)
 class StateSnapshot:
     """Snapshot of game state for ML training.
 
     Attributes:
         turn: Turn number.
         player: Current player (0 or 1).
-        board: Board as dict of {(row,col): (shape_idx, color_idx)}.
-        hand: Current player's hand as list of (shape_idx, color_idx).
-        scores: [player0_score, player1_score].
+        board: Board as a dense (21, 21, 2) int8 grid in row-major bytes,
+            centered at (10, 10); channels are shape_idx + 1 and
+            color_idx + 1, with 0 for empty.
+        hand: Current player's hand packed into one int, 6 bits per tile
+            in hand order: slot i holds Tile.index() + 1 (0 = empty) at
+            bits 6*i..6*i+5.
+        scores: (player0_score, player1_score).
         bag_remaining: Number of tiles left in bag.
+        overflow: Tiles outside the board window, as (row, col,
+            Tile.index()). Kept so saved trajectories hold the whole
+            board; trajectories_to_numpy crops them.
     """
     turn: int
     player: int
-    board: Dict[str, Tuple[int, int]]  # "(row,col)" -> (shape, color)
-    hand: List[Tuple[int, int]]  # [(shape, color), ...]
-    scores: List[int]
+    board: bytes  # (21, 21, 2) int8 grid
+    hand: int  # 6 x 6-bit slots
+    scores: Tuple[int, int]
     bag_remaining: int
+    overflow: Tuple[Tuple[int, int, int], ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionRecord:
     """Record of action taken.
 
@@ -89,7 +133,7 @@ class ActionRecord:
     qwirkles: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     """Single state transition for training."""
     state: StateSnapshot
@@ -97,7 +141,7 @@ class Transition:
     reward: float  # Normalized score or win signal
 
 
-@dataclass
+@dataclass(slots=True)
 class GameTrajectory:
     """Complete game trajectory for training.
 
@@ -105,48 +149,142 @@ class GameTrajectory:
         seed: Random seed used.
         transitions: List of state transitions.
         winner: Winning player (0, 1, or None for tie).
-        final_scores: Final scores [p0, p1].
+        final_scores: Final scores (p0, p1).
         p0_strategy: Strategy used by player 0.
         p1_strategy: Strategy used by player 1.
     """
     seed: int
     transitions: List[Transition]
     winner: Optional[int]
-    final_scores: List[int]
+    final_scores: Tuple[int, int]
     p0_strategy: str
     p1_strategy: str
 
 
 def _tile_to_indices(tile: Tile) -> Tuple[int, int]:
     """Convert tile to (shape_index, color_index)."""
-    shapes = list(Shape)
-    colors = list(Color)
-    return (shapes.index(tile.shape), colors.index(tile.color))
+    return (tile.shape_idx, tile.color_idx)
+
+
+def _board_to_grid(board: Board) -> Tuple[bytes, Tuple[Tuple[int, int, int], ...]]:
+    """Convert board to the dense snapshot grid plus off-window tiles.
+
+    Returns:
+        (grid, overflow) as in StateSnapshot.board and StateSnapshot.overflow.
+    """
+    grid = bytearray(BOARD_SIZE * BOARD_SIZE * 2)
+    overflow = []
+    for (row, col), tile in board.all_tiles():
+        r, c = row + _BOARD_OFFSET, col + _BOARD_OFFSET
+        if 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
+            i = (r * BOARD_SIZE + c) * 2
+            grid[i] = tile.shape_idx + 1  # +1 so 0 = empty
+            grid[i + 1] = tile.color_idx + 1
+        else:
+            overflow.append((row, col, tile.index()))
+    return bytes(grid), tuple(overflow)
+
 
+def _grid_to_dict(
+    grid: bytes,
+    overflow: Iterable[Tuple[int, int, int]] = ()
+) -> Dict[str, Tuple[int, int]]:
+    """Convert a snapshot board to {"row,col": (shape_idx, color_idx)}.
 
-def _board_to_dict(board: Board) -> Dict[str, Tuple[int, int]]:
-    """Convert board to serializable dict."""
-    result = {}
-    for pos, tile in board.all_tiles():
-        key = f"{pos[0]},{pos[1]}"
-        result[key] = _tile_to_indices(tile)
-    return result
+    Args:
+        grid: Dense snapshot grid.
+        overflow: Tiles outside the grid, as (row, col, Tile.index()).
+
+    Returns:
+        Every tile on the board, in and out of the window.
+    """
+    board = {
+        _CELL_KEYS[i // 2]: (grid[i] - 1, grid[i + 1] - 1)
+        for i in range(0, len(grid), 2)
+        if grid[i]
+    }
+    for row, col, tile_id in overflow:
+        # Tile.index() is shape_index * 6 + color_index
+        board[f"{row},{col}"] = divmod(tile_id, 6)
+    return board
+
+
+def _dict_to_grid(
+    board: Dict[str, Tuple[int, int]]
+) -> Tuple[bytes, Tuple[Tuple[int, int, int], ...]]:
+    """Inverse of _grid_to_dict: returns (grid, overflow)."""
+    grid = bytearray(BOARD_SIZE * BOARD_SIZE * 2)
+    overflow = []
+    for pos_str, (shape_idx, color_idx) in board.items():
+        cell = _KEY_CELLS.get(pos_str)
+        if cell is None:
+            row, col = pos_str.split(',')
+            overflow.append((int(row), int(col), shape_idx * 6 + color_idx))
+            continue
+        i = cell * 2
+        grid[i] = shape_idx + 1
+        grid[i + 1] = color_idx + 1
+    return bytes(grid), tuple(overflow)
+
+
+def _state_to_json(state: StateSnapshot) -> Dict[str, Any]:
+    """Convert a snapshot to JSON-ready form ("row,col" board keys)."""
+    # Built field by field: asdict() deep-copies recursively
+    return {
+        'turn': state.turn,
+        'player': state.player,
+        'board': _grid_to_dict(state.board, state.overflow),
+        'hand': _unpack_hand(state.hand),
+        'scores': state.scores,
+        'bag_remaining': state.bag_remaining,
+    }
 
 
-def _hand_to_list(hand: Hand) -> List[Tuple[int, int]]:
-    """Convert hand to list of tile indices."""
-    return [_tile_to_indices(t) for t in hand.tiles()]
+def _state_from_json(data: Dict[str, Any]) -> StateSnapshot:
+    """Rebuild a snapshot written by _state_to_json."""
+    grid, overflow = _dict_to_grid(data['board'])
+    return StateSnapshot(**{
+        **data,
+        'board': grid,
+        'overflow': overflow,
+        'hand': _pack_hand(
+            shape_idx * 6 + color_idx for shape_idx, color_idx in data['hand']
+        ),
+        'scores': tuple(data['scores']),
+    })
+
+
+def _pack_hand(tile_ids: Iterable[int]) -> int:
+    """Pack up to 6 Tile.index() ids into an int (see StateSnapshot.hand)."""
+    packed = 0
+    shift = 0
+    for tile_id in tile_ids:
+        packed |= (tile_id + 1) << shift
+        shift += 6
+    return packed
+
+
+def _unpack_hand(packed: int) -> List[Tuple[int, int]]:
+    """Unpack a hand into a list of (shape_idx, color_idx)."""
+    tiles = []
+    while packed:
+        # Tile.index() is shape_index * 6 + color_index
+        tiles.append(divmod((packed & 63) - 1, 6))
+        packed >>= 6
+    return tiles
 
 
 def _snapshot_state(state: GameState) -> StateSnapshot:
     """Create a snapshot of current game state."""
+    grid, overflow = _board_to_grid(state.board)
     return StateSnapshot(
         turn=state.turn_number,
         player=state.current_player,
-        board=_board_to_dict(state.board),
-        hand=_hand_to_list(state.hands[state.current_player]),
-        scores=state.scores.copy(),
-        bag_remaining=state.bag.remaining()
+        board=grid,
+        hand=_pack_hand(state.hands[state.current_player].tile_ids()),
+        scores=tuple(state.scores),
+        bag_remaining=state.bag.remaining(),
+        overflow=overflow
     )
 
 
@@ -163,7 +301,8 @@ def record_game(
     seed: int,
     solver0: Optional[Solver] = None,
     solver1: Optional[Solver] = None,
-    max_turns: int = 200
+    max_turns: int = 200,
+    snapshot_every: int = 1
 ) -> GameTrajectory:
     """Play and record a complete game.
 
@@ -172,18 +311,28 @@ def record_game(
         solver0: Solver for player 0 (default: GreedySolver).
         solver1: Solver for player 1 (default: GreedySolver).
         max_turns: Maximum turns before forcing end.
+        snapshot_every: Record only turns whose number is a multiple of
+            this (1 records every turn). The win/loss adjustment goes to
+            the last 10 recorded transitions, so with thinning it
+            reaches further back into the game.
 
     Returns:
-        GameTrajectory with all state transitions.
+        GameTrajectory with the recorded state transitions.
     """
+    if snapshot_every < 1:
+        raise ValueError(f"snapshot_every must be at least 1, got {snapshot_every}")
     if solver0 is None:
-        solver0 = GreedySolver()
+        solver0 = _GREEDY
     if solver1 is None:
-        solver1 = GreedySolver()
+        solver1 = _GREEDY
 
-    solvers = [solver0, solver1]
+    # Bound methods and globals as locals for the turn loop
+    get_moves = (solver0.get_move, solver1.get_move)
+    play = apply_move
+    snapshot_state = _snapshot_state
     state = new_game(seed)
     transitions: List[Transition] = []
+    add_transition = transitions.append
 
     # Determine strategy names
     p0_strategy = _get_strategy_name(solver0)
@@ -191,15 +340,21 @@ def record_game(
 
     while not state.game_over and state.turn_number <= max_turns:
         current = state.current_player
-        solver = solvers[current]
+        record = state.turn_number % snapshot_every == 0
 
         # Snapshot state before action
-        snapshot = _snapshot_state(state)
+        if record:
+            snapshot = snapshot_state(state)
 
         # Get and apply move
-        move = solver.get_move(state)
+        move = get_moves[current](state)
 
         if move is not None:
+            # Apply move
+            success, _, points = play(state, move.placements)
+            if not record:
+                continue
+
             # Record action
             placements = [
                 ((pos[0], pos[1]), _tile_to_indices(tile))
@@ -211,24 +366,23 @@ def record_game(
                 score=move.score,
                 qwirkles=move.qwirkles
             )
-
-            # Apply move
-            success, _, points = apply_move(state, move.placements)
             reward = points / 12.0  # Normalize by max single-tile score (qwirkle)
 
         else:
             # No valid moves - swap
             hand = state.hands[current]
             if not state.bag.is_empty() and len(hand) > 0:
-                apply_swap(state, [hand.tiles()[0]])
+                apply_swap(state, [hand.first_tile()])
                 action = ActionRecord(action_type="swap", tiles_swapped=1)
                 reward = -0.1  # Small penalty for swapping
             else:
                 state.game_over = True
                 action = ActionRecord(action_type="pass")
                 reward = 0.0
+            if not record:
+                continue
 
-        transitions.append(Transition(
+        add_transition(Transition(
             state=snapshot,
             action=action,
             reward=reward
@@ -251,7 +405,7 @@ def record_game(
         seed=seed,
         transitions=transitions,
         winner=state.winner,
-        final_scores=state.scores.copy(),
+        final_scores=tuple(state.scores),
         p0_strategy=p0_strategy,
         p1_strategy=p1_strategy
     )
@@ -260,7 +414,7 @@ def record_game(
 def _make_solver(solver_type: str, seed: int, epsilon: float = 0.0) -> Solver:
     """Create a solver with optional exploration noise."""
     if solver_type == "greedy":
-        base = GreedySolver()
+        base = _GREEDY  # Stateless, shared per process
     else:
         base = RandomSolver(seed)
 
@@ -271,10 +425,10 @@ def _make_solver(solver_type: str, seed: int, epsilon: float = 0.0) -> Solver:
 
 def _record_single_worker(args: Tuple) -> GameTrajectory:
     """Worker function for parallel recording."""
-    seed, s0_type, s1_type, epsilon = args
+    seed, s0_type, s1_type, epsilon, snapshot_every = args
     s0 = _make_solver(s0_type, seed, epsilon)
     s1 = _make_solver(s1_type, seed + 1, epsilon)
-    return record_game(seed, s0, s1)
+    return record_game(seed, s0, s1, snapshot_every=snapshot_every)
 
 
 def record_batch(
@@ -285,7 +439,9 @@ def record_batch(
     parallel: bool = True,
     max_workers: Optional[int] = None,
     epsilon: float = 0.0,
-    mix_strategies: bool = False
+    mix_strategies: bool = False,
+    snapshot_every: int = 1,
+    sink: Optional[Callable[[GameTrajectory], None]] = None
 ) -> List[GameTrajectory]:
     """Record multiple games.
 
@@ -302,9 +458,15 @@ def record_batch(
             - 25% greedy vs random
             - 25% random vs greedy
             - 25% random vs random
+        snapshot_every: Record only every Nth turn of each game
+            (see record_game).
+        sink: If given, called with each trajectory in game order as soon
+            as it is recorded, instead of collecting them all in memory.
+            For example, pickle each one to an open file and read them
+            back with iter_trajectories.
 
     Returns:
-        List of GameTrajectory objects.
+        List of GameTrajectory objects (empty when sink is given).
     """
     from concurrent.futures import ProcessPoolExecutor
     import multiprocessing
@@ -327,17 +489,80 @@ def record_batch(
             s0_type = solver0_type
             s1_type = solver1_type
 
-        args_list.append((seed, s0_type, s1_type, epsilon))
+        args_list.append((seed, s0_type, s1_type, epsilon, snapshot_every))
 
     if parallel and n_games > 1:
         if max_workers is None:
             max_workers = min(multiprocessing.cpu_count(), n_games)
 
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            results = list(executor.map(_record_single_worker, args_list))
-        return results
+            return _collect(executor.map(
+                _record_single_worker, args_list,
+                chunksize=_chunksize(n_games, max_workers),
+            ), n_games, sink)
     else:
-        return [_record_single_worker(args) for args in args_list]
+        return _collect(map(_record_single_worker, args_list), n_games, sink)
+
+
+def _collect(
+    trajectories: Iterable[GameTrajectory],
+    n_games: int,
+    sink: Optional[Callable[[GameTrajectory], None]]
+) -> List[GameTrajectory]:
+    """Gather trajectories in game order, or pass each one to sink."""
+    if sink is not None:
+        for trajectory in trajectories:
+            sink(trajectory)
+        return []
+
+    # Preallocate and fill by index; trajectories arrive in game order
+    results: List[GameTrajectory] = [None] * n_games  # type: ignore[list-item]
+    for i, trajectory in enumerate(trajectories):
+        results[i] = trajectory
+    return results
+
+
+def _trajectory_to_json(traj: GameTrajectory) -> Dict[str, Any]:
+    """Convert a trajectory to a JSON-serializable dict."""
+    return {
+        'seed': traj.seed,
+        'winner': traj.winner,
+        'final_scores': traj.final_scores,
+        'p0_strategy': traj.p0_strategy,
+        'p1_strategy': traj.p1_strategy,
+        'transitions': [
+            {
+                'state': _state_to_json(trans.state),
+                'action': _action_to_json(trans.action),
+                'reward': trans.reward
+            }
+            for trans in traj.transitions
+        ]
+    }
+
+
+def _action_to_json(action: ActionRecord) -> Dict[str, Any]:
+    """Convert an action to a JSON-serializable dict."""
+    return {
+        'action_type': action.action_type,
+        'placements': action.placements,
+        'tiles_swapped': action.tiles_swapped,
+        'score': action.score,
+        'qwirkles': action.qwirkles,
+    }
+
+
+def _json_dumps() -> Callable[[Any], bytes]:
+    """Return a function encoding an object as JSON bytes.
+
+    Uses orjson when installed (a much faster C encoder), else the
+    standard library.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(obj).encode()
+    return orjson.dumps
 
 
 def save_trajectories(
@@ -356,29 +581,20 @@ def save_trajectories(
 
     if format == "pickle":
         with open(path, 'wb') as f:
-            pickle.dump(trajectories, f)
+            # Snapshot boards are flat bytes, so no out-of-band buffers
+            # are needed; just use the newest (fastest) protocol
+            pickle.dump(trajectories, f, protocol=pickle.HIGHEST_PROTOCOL)
     elif format == "json":
-        # Convert to JSON-serializable format
-        data = []
-        for traj in trajectories:
-            traj_dict = {
-                'seed': traj.seed,
-                'winner': traj.winner,
-                'final_scores': traj.final_scores,
-                'p0_strategy': traj.p0_strategy,
-                'p1_strategy': traj.p1_strategy,
-                'transitions': []
-            }
-            for trans in traj.transitions:
-                traj_dict['transitions'].append({
-                    'state': asdict(trans.state),
-                    'action': asdict(trans.action),
-                    'reward': trans.reward
-                })
-            data.append(traj_dict)
-
-        with open(path, 'w') as f:
-            json.dump(data, f)
+        dumps = _json_dumps()
+        # Stream one trajectory at a time rather than building the whole
+        # document in memory
+        with open(path, 'wb') as f:
+            f.write(b"[")
+            for i, traj in enumerate(trajectories):
+                if i:
+                    f.write(b",")
+                f.write(dumps(_trajectory_to_json(traj)))
+            f.write(b"]")
     else:
         raise ValueError(f"Unknown format: {format}")
 
@@ -406,7 +622,7 @@ def load_trajectories(filepath: str, format: str = "pickle") -> List[GameTraject
         for traj_dict in data:
             transitions = []
             for trans_dict in traj_dict['transitions']:
-                state = StateSnapshot(**trans_dict['state'])
+                state = _state_from_json(trans_dict['state'])
                 action = ActionRecord(**trans_dict['action'])
                 transitions.append(Transition(
                     state=state,
@@ -417,7 +633,7 @@ def load_trajectories(filepath: str, format: str = "pickle") -> List[GameTraject
                 seed=traj_dict['seed'],
                 transitions=transitions,
                 winner=traj_dict['winner'],
-                final_scores=traj_dict['final_scores'],
+                final_scores=tuple(traj_dict['final_scores']),
                 p0_strategy=traj_dict['p0_strategy'],
                 p1_strategy=traj_dict['p1_strategy']
             ))
@@ -426,12 +642,34 @@ def load_trajectories(filepath: str, format: str = "pickle") -> List[GameTraject
         raise ValueError(f"Unknown format: {format}")
 
 
+def iter_trajectories(filepath: str) -> Iterator[GameTrajectory]:
+    """Lazily read trajectories pickled one after another into a file.
+
+    This reads the stream written by a record_batch sink such as
+    ``lambda t: pickle.dump(t, f, protocol=pickle.HIGHEST_PROTOCOL)``.
+    Only one trajectory is held in memory at a time.
+
+    Args:
+        filepath: Input file path.
+
+    Yields:
+        GameTrajectory objects in the order they were written.
+    """
+    with open(Path(filepath), 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
 def trajectories_to_numpy(trajectories: List[GameTrajectory]):
     """Convert trajectories to numpy arrays for training.
 
     Returns:
         Dict with:
-        - 'boards': (N, 21, 21, 2) - board states (shape, color channels)
+        - 'boards': (N, 21, 21, 2) - board states (shape, color channels),
+          cropped to the window around the origin
         - 'hands': (N, 6, 2) - hand tiles
         - 'meta': (N, 4) - [turn, player, score0, score1]
         - 'actions': (N,) - action indices or embeddings
@@ -443,49 +681,39 @@ def trajectories_to_numpy(trajectories: List[GameTrajectory]):
     except ImportError:
         raise ImportError("numpy required for trajectories_to_numpy")
 
-    all_boards = []
-    all_hands = []
-    all_meta = []
-    all_rewards = []
-    all_players = []
-
-    for traj in trajectories:
-        for trans in traj.transitions:
-            # Board: 21x21 grid centered at origin, 2 channels (shape, color)
-            # Using -10 to 10 range
-            board = np.zeros((21, 21, 2), dtype=np.int8)
-            for pos_str, (shape_idx, color_idx) in trans.state.board.items():
-                row, col = map(int, pos_str.split(','))
-                # Offset to center at (10, 10)
-                r, c = row + 10, col + 10
-                if 0 <= r < 21 and 0 <= c < 21:
-                    board[r, c, 0] = shape_idx + 1  # +1 so 0 = empty
-                    board[r, c, 1] = color_idx + 1
-            all_boards.append(board)
-
-            # Hand: up to 6 tiles, each with (shape, color)
-            hand = np.zeros((6, 2), dtype=np.int8)
-            for i, (shape_idx, color_idx) in enumerate(trans.state.hand[:6]):
-                hand[i, 0] = shape_idx + 1
-                hand[i, 1] = color_idx + 1
-            all_hands.append(hand)
-
-            # Meta: turn, player, scores
-            meta = np.array([
-                trans.state.turn,
-                trans.state.player,
-                trans.state.scores[0],
-                trans.state.scores[1]
-            ], dtype=np.int16)
-            all_meta.append(meta)
-
-            all_rewards.append(trans.reward)
-            all_players.append(trans.state.player)
+    transitions = [trans for traj in trajectories for trans in traj.transitions]
+    states = [trans.state for trans in transitions]
+    n = len(states)
+
+    # Snapshot boards are already dense int8 grids: one join, one copy.
+    # Off-window tiles (StateSnapshot.overflow) are cropped here
+    boards = np.frombuffer(
+        bytearray(b"".join(state.board for state in states)),
+        dtype=np.int8,
+    ).reshape(n, BOARD_SIZE, BOARD_SIZE, 2)
+
+    # Meta: turn, player, scores
+    meta = np.array(
+        [(state.turn, state.player, state.scores[0], state.scores[1]) for state in states],
+        dtype=np.int16,
+    ).reshape(n, 4)
+    rewards = np.fromiter((trans.reward for trans in transitions), dtype=np.float32, count=n)
+    players = meta[:, 1].astype(np.int8)
+
+    # Hand: up to 6 tiles, each with (shape, color). Unpack the 6-bit
+    # slots (Tile.index() + 1, 0 = empty) for every snapshot at once
+    packed = np.fromiter((state.hand for state in states), dtype=np.int64, count=n)
+    slots = ((packed[:, None] >> (6 * np.arange(6))) & 63).astype(np.int8)
+    tile_ids = slots - 1
+    hands = np.zeros((n, 6, 2), dtype=np.int8)
+    hands[..., 0] = tile_ids // 6 + 1
+    hands[..., 1] = tile_ids % 6 + 1
+    hands[slots == 0] = 0
 
     return {
-        'boards': np.array(all_boards),
-        'hands': np.array(all_hands),
-        'meta': np.array(all_meta),
-        'rewards': np.array(all_rewards, dtype=np.float32),
-        'players': np.array(all_players, dtype=np.int8)
+        'boards': boards,
+        'hands': hands,
+        'meta': meta,
+        'rewards': rewards,
+        'players': players
     }
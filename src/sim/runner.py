@@ -5,29 +5,35 @@ Runs games between AI players and collects results.
 
 from dataclasses import dataclass, field
 from typing import Optional, List, Tuple
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import multiprocessing
 
 from src.engine.game import GameState, new_game, apply_move, apply_swap
 from src.ai.solver import Solver, GreedySolver, RandomSolver
 
+# GreedySolver keeps no per-game state, so each process shares one.
+# RandomSolvers are still built per game: their RNG is seeded per game
+# and their move cache must not carry over, or results would depend on
+# which games a worker ran before.
+_GREEDY = GreedySolver()
 
-@dataclass
+
+@dataclass(slots=True)
 class GameResult:
     """Result of a single game.
 
     Attributes:
         winner: Winning player index (0 or 1), or None for tie.
-        scores: Final scores [player0, player1].
+        scores: Final scores (player0, player1).
         turns: Total number of turns played.
-        qwirkles: Qwirkle counts [player0, player1].
+        qwirkles: Qwirkle counts (player0, player1).
         max_turn_score: Highest single-turn score achieved.
         max_turn_player: Player who achieved max turn score.
     """
     winner: Optional[int]
-    scores: List[int]
+    scores: Tuple[int, int]
     turns: int
-    qwirkles: List[int]
+    qwirkles: Tuple[int, int]
     max_turn_score: int = 0
     max_turn_player: int = 0
 
@@ -50,11 +56,13 @@ def run_game(
         GameResult with final stats.
     """
     if solver0 is None:
-        solver0 = GreedySolver()
+        solver0 = _GREEDY
     if solver1 is None:
-        solver1 = GreedySolver()
+        solver1 = _GREEDY
 
-    solvers = [solver0, solver1]
+    # Bound methods and globals as locals for the turn loop
+    get_moves = (solver0.get_move, solver1.get_move)
+    play = apply_move
     state = new_game(seed)
 
     max_turn_score = 0
@@ -62,12 +70,10 @@ def run_game(
 
     while not state.game_over and state.turn_number <= max_turns:
         current = state.current_player
-        solver = solvers[current]
-
-        move = solver.get_move(state)
+        move = get_moves[current](state)
 
         if move is not None:
-            success, _, points = apply_move(state, move.placements)
+            success, _, points = play(state, move.placements)
             if success and points > max_turn_score:
                 max_turn_score = points
                 max_turn_player = current
@@ -75,7 +81,7 @@ def run_game(
             # No valid moves - try to swap
             hand = state.hands[current]
             if not state.bag.is_empty() and len(hand) > 0:
-                apply_swap(state, [hand.tiles()[0]])
+                apply_swap(state, [hand.first_tile()])
             else:
                 # Can't move or swap - force game end
                 state.game_over = True
@@ -83,9 +89,9 @@ def run_game(
 
     return GameResult(
         winner=state.winner,
-        scores=state.scores.copy(),
+        scores=tuple(state.scores),
         turns=state.turn_number,
-        qwirkles=state.qwirkle_counts.copy(),
+        qwirkles=tuple(state.qwirkle_counts),
         max_turn_score=max_turn_score,
         max_turn_player=max_turn_player,
     )
@@ -102,20 +108,29 @@ def _run_game_worker(args: Tuple) -> GameResult:
     """
     solver0_type, solver1_type, seed = args
 
-    # Recreate solvers in worker process
+    # Build (or reuse) solvers in the worker process
     if solver0_type == "greedy":
-        solver0 = GreedySolver()
+        solver0 = _GREEDY
     else:
         solver0 = RandomSolver(seed)
 
     if solver1_type == "greedy":
-        solver1 = GreedySolver()
+        solver1 = _GREEDY
     else:
         solver1 = RandomSolver(seed + 1 if seed else None)
 
     return run_game(solver0, solver1, seed)
 
 
+def _chunksize(n_tasks: int, max_workers: int) -> int:
+    """Tasks per executor.map chunk: about four chunks per worker.
+
+    Batches the pickling and IPC for short games while leaving enough
+    chunks to balance load across workers.
+    """
+    return max(1, n_tasks // (max_workers * 4))
+
+
 def run_batch(
     n_games: int,
     solver0_type: str = "greedy",
@@ -135,7 +150,7 @@ def run_batch(
         max_workers: Max parallel workers (default: CPU count).
 
     Returns:
-        List of GameResult objects.
+        List of GameResult objects, in game order.
     """
     # Prepare arguments for each game
     args_list = []
@@ -147,15 +162,15 @@ def run_batch(
         if max_workers is None:
             max_workers = min(multiprocessing.cpu_count(), n_games)
 
-        results = []
+        # Preallocate and fill by index; map yields results in game order
+        results: List[GameResult] = [None] * n_games  # type: ignore[list-item]
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(_run_game_worker, args) for args in args_list]
-            for future in as_completed(futures):
-                results.append(future.result())
+            for i, result in enumerate(executor.map(
+                _run_game_worker, args_list,
+                chunksize=_chunksize(n_games, max_workers),
+            )):
+                results[i] = result
         return results
     else:
         # Sequential execution
-        results = []
-        for args in args_list:
-            results.append(_run_game_worker(args))
-        return results
+        return [_run_game_worker(args) for args in args_list]
@@ -3,15 +3,20 @@
 Collects game results and computes aggregate statistics.
 """
 
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
-from statistics import mean, stdev, median
+from math import sqrt
+from statistics import median
 from collections import Counter
 
 from src.sim.runner import GameResult
 
+# From this many results up, compute_stats uses numpy when installed
+NUMPY_MIN_RESULTS = 256
 
-@dataclass
+
+@dataclass(slots=True)
 class AggregateStats:
     """Aggregated statistics from multiple games.
 
@@ -63,27 +68,45 @@ def compute_stats(results: List[GameResult]) -> AggregateStats:
     if not results:
         return AggregateStats()
 
-    n = len(results)
+    if len(results) >= NUMPY_MIN_RESULTS:
+        try:
+            return _compute_stats_numpy(results)
+        except ImportError:
+            pass  # numpy not installed; use the pure-Python pass
 
-    # Win counts
-    p0_wins = sum(1 for r in results if r.winner == 0)
-    p1_wins = sum(1 for r in results if r.winner == 1)
-    ties = sum(1 for r in results if r.winner is None)
+    n = len(results)
 
-    # Scores
-    scores_p0 = [r.scores[0] for r in results]
-    scores_p1 = [r.scores[1] for r in results]
+    # One pass with running totals; only the scores are kept (unboxed, in
+    # int64 arrays) for medians. Scores are ints, so the sums of squares
+    # are exact.
+    p0_wins = p1_wins = ties = 0
+    sum_p0 = sum_p1 = sumsq_p0 = sumsq_p1 = 0
+    total_turns = total_qwirkles_p0 = total_qwirkles_p1 = 0
+    max_score = max_turn = 0
+    scores_p0 = array('q')
+    scores_p1 = array('q')
 
-    # Turns
-    turns = [r.turns for r in results]
+    for r in results:
+        if r.winner == 0:
+            p0_wins += 1
+        elif r.winner == 1:
+            p1_wins += 1
+        elif r.winner is None:
+            ties += 1
 
-    # Qwirkles
-    qwirkles_p0 = [r.qwirkles[0] for r in results]
-    qwirkles_p1 = [r.qwirkles[1] for r in results]
+        score_p0, score_p1 = r.scores
+        scores_p0.append(score_p0)
+        scores_p1.append(score_p1)
+        sum_p0 += score_p0
+        sum_p1 += score_p1
+        sumsq_p0 += score_p0 * score_p0
+        sumsq_p1 += score_p1 * score_p1
 
-    # Max scores
-    max_score = max(max(r.scores) for r in results)
-    max_turn = max(r.max_turn_score for r in results)
+        total_turns += r.turns
+        total_qwirkles_p0 += r.qwirkles[0]
+        total_qwirkles_p1 += r.qwirkles[1]
+        max_score = max(max_score, score_p0, score_p1)
+        max_turn = max(max_turn, r.max_turn_score)
 
     return AggregateStats(
         n_games=n,
@@ -92,20 +115,97 @@ def compute_stats(results: List[GameResult]) -> AggregateStats:
         ties=ties,
         p0_win_rate=p0_wins / n * 100,
         p1_win_rate=p1_wins / n * 100,
-        avg_score_p0=mean(scores_p0),
-        avg_score_p1=mean(scores_p1),
-        avg_turns=mean(turns),
-        avg_qwirkles_p0=mean(qwirkles_p0),
-        avg_qwirkles_p1=mean(qwirkles_p1),
+        avg_score_p0=sum_p0 / n,
+        avg_score_p1=sum_p1 / n,
+        avg_turns=total_turns / n,
+        avg_qwirkles_p0=total_qwirkles_p0 / n,
+        avg_qwirkles_p1=total_qwirkles_p1 / n,
         max_score=max_score,
         max_turn_score=max_turn,
-        score_std_p0=stdev(scores_p0) if n > 1 else 0.0,
-        score_std_p1=stdev(scores_p1) if n > 1 else 0.0,
+        score_std_p0=_sample_std(n, sum_p0, sumsq_p0),
+        score_std_p1=_sample_std(n, sum_p1, sumsq_p1),
         median_score_p0=median(scores_p0),
         median_score_p1=median(scores_p1),
     )
 
 
+def _compute_stats_numpy(results: List[GameResult]) -> AggregateStats:
+    """Vectorized compute_stats for large result lists.
+
+    Args:
+        results: Non-empty list of GameResult objects.
+
+    Returns:
+        AggregateStats with the same values as the pure-Python path.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    import numpy as np
+
+    n = len(results)
+    # Columns: score0, score1, turns, qwirkles0, qwirkles1, max_turn_score
+    data = np.fromiter(
+        (
+            value
+            for r in results
+            for value in (r.scores[0], r.scores[1], r.turns,
+                          r.qwirkles[0], r.qwirkles[1], r.max_turn_score)
+        ),
+        dtype=np.int64,
+        count=6 * n,
+    ).reshape(n, 6)
+    winners = np.fromiter(
+        (-1 if r.winner is None else r.winner for r in results),
+        dtype=np.int8,
+        count=n,
+    )
+
+    p0_wins = int((winners == 0).sum())
+    p1_wins = int((winners == 1).sum())
+    means = data.mean(axis=0)
+    scores = data[:, :2]
+    stds = scores.std(axis=0, ddof=1)
+    medians = np.median(scores, axis=0)
+
+    return AggregateStats(
+        n_games=n,
+        p0_wins=p0_wins,
+        p1_wins=p1_wins,
+        ties=int((winners == -1).sum()),
+        p0_win_rate=p0_wins / n * 100,
+        p1_win_rate=p1_wins / n * 100,
+        avg_score_p0=float(means[0]),
+        avg_score_p1=float(means[1]),
+        avg_turns=float(means[2]),
+        avg_qwirkles_p0=float(means[3]),
+        avg_qwirkles_p1=float(means[4]),
+        max_score=int(scores.max()),
+        max_turn_score=int(data[:, 5].max()),
+        score_std_p0=float(stds[0]),
+        score_std_p1=float(stds[1]),
+        median_score_p0=float(medians[0]),
+        median_score_p1=float(medians[1]),
+    )
+
+
+def _sample_std(n: int, total: int, total_sq: int) -> float:
+    """Sample standard deviation from integer running sums.
+
+    Args:
+        n: Number of values.
+        total: Sum of the values.
+        total_sq: Sum of the squared values.
+
+    Returns:
+        The standard deviation, or 0.0 for fewer than two values.
+    """
+    if n < 2:
+        return 0.0
+    # n * sum(x^2) - sum(x)^2 is exact in integers, so no cancellation
+    return sqrt((n * total_sq - total * total) / (n * (n - 1)))
+
+
 def format_stats(stats: AggregateStats) -> str:
     """Format statistics for display.
 
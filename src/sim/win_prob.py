@@ -1,19 +1,34 @@
 """Win probability estimation using Monte Carlo simulation.
 
 Estimates the probability of each player winning from a given game state.
+Simulations are independent, so they are split across worker processes;
+worker i seeds its RNG with ``seed ^ i``, as in src.ai.mcts_parallel.
 """
 
 from dataclasses import dataclass
-from typing import List, Set, Optional, Tuple
+from typing import List, Set, Optional, Sequence, Tuple
 from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import pickle
 import random
+import time
 
-from src.models.tile import Tile, Color, Shape
-from src.models.hand import Hand
+from src.models.tile import Tile, TILE_BY_ID
 from src.models.bag import Bag
-from src.engine.game import GameState, apply_move, apply_swap
+from src.engine.game import GameState, apply_swap, commit_move
+from src.engine.scoring import END_GAME_BONUS, QWIRKLE_BONUS, QWIRKLE_SIZE
 from src.ai.solver import GreedySolver, RandomSolver, Solver
 
+# Outcome index for a tied game (players win as 0 and 1)
+TIE = 2
+
+# Most points one placed tile can add: it completes a Qwirkle in both
+# its row and its column. A move of k tiles scores at most 12 + 12k.
+_MAX_POINTS_PER_TILE = 2 * (QWIRKLE_SIZE + QWIRKLE_BONUS)
+
+# Copies of each tile in a full set, indexed by Tile.index()
+_ALL_TILE_COUNTS = bytes([Bag.COPIES_PER_TILE]) * len(TILE_BY_ID)
+
 
 @dataclass
 class WinProbability:
@@ -25,18 +40,22 @@ class WinProbability:
         tie_prob: Probability of tie.
         n_simulations: Number of simulations run.
         confidence: Rough confidence estimate (based on sample size).
+        effective_samples: Effective sample size of weighted
+            simulations, or 0.0 when every simulation counts once.
     """
     p0_prob: float
     p1_prob: float
     tie_prob: float
     n_simulations: int
     confidence: float = 0.0
+    effective_samples: float = 0.0
 
     def __post_init__(self):
         # Confidence based on standard error of proportion
         # For p close to 0.5, SE = sqrt(0.25/n)
-        if self.n_simulations > 0:
-            self.confidence = min(0.99, 1.0 - (0.5 / (self.n_simulations ** 0.5)))
+        n = self.effective_samples or self.n_simulations
+        if n > 0:
+            self.confidence = min(0.99, 1.0 - (0.5 / (n ** 0.5)))
 
 
 def get_unseen_tiles(state: GameState, viewer: int) -> List[Tile]:
@@ -55,98 +74,333 @@ def get_unseen_tiles(state: GameState, viewer: int) -> List[Tile]:
         viewer: Index of the viewing player (0 or 1).
 
     Returns:
-        List of tiles the viewer cannot see (opponent's hand + bag).
+        List of tiles the viewer cannot see (opponent's hand + bag),
+        ordered by Tile.index().
+    """
+    return [TILE_BY_ID[tile_id] for tile_id in _unseen_ids(state, viewer)]
+
+
+def _unseen_ids(state: GameState, viewer: int) -> bytes:
+    """Tile.index() ids of the tiles get_unseen_tiles would return."""
+    # Count down from the full set: board tiles, then the viewer's hand
+    counts = bytearray(_ALL_TILE_COUNTS)
+    for tile_id in state.board.tile_ids():
+        counts[tile_id] -= 1
+    for tile_id in state.hands[viewer].tile_ids():
+        counts[tile_id] -= 1
+
+    return bytes(tile_id for tile_id, n in enumerate(counts) for _ in range(n))
+
+
+def _rarity_weights(unseen_ids: bytes) -> List[float]:
+    """Proposal weight per Tile.index(): the inverse of its unseen count.
+
+    Each tile type then has the same total weight, so rare tiles are
+    dealt more often than under a uniform shuffle.
+    """
+    counts = [0] * len(TILE_BY_ID)
+    for tile_id in unseen_ids:
+        counts[tile_id] += 1
+    return [1.0 / n if n else 0.0 for n in counts]
+
+
+def _deal_weighted(
+    scratch: bytearray,
+    k: int,
+    weights: Sequence[float],
+    rng: random.Random
+) -> float:
+    """Move k weighted draws to the front of scratch.
+
+    Tiles are drawn one at a time without replacement, with probability
+    proportional to weights[tile_id]. The rest of scratch is left in
+    no particular order.
+
+    Args:
+        scratch: Tile ids to deal from, reordered in place.
+        k: Number of tiles to draw to the front.
+        weights: Proposal weight per tile id.
+        rng: Random number generator.
+
+    Returns:
+        Likelihood ratio of the drawn sequence under a uniform shuffle
+        versus this proposal.
+    """
+    n = len(scratch)
+    ratio = 1.0
+    for j in range(k):
+        total = sum(weights[tile_id] for tile_id in scratch[j:])
+        target = rng.random() * total
+        pick = n - 1
+        for i in range(j, n):
+            target -= weights[scratch[i]]
+            if target < 0:
+                pick = i
+                break
+        scratch[j], scratch[pick] = scratch[pick], scratch[j]
+        # Uniform picks each remaining tile with 1/(n-j); the proposal
+        # with w/total
+        ratio *= total / ((n - j) * weights[scratch[j]])
+
+    return ratio
+
+
+def _deal_hidden(
+    state: GameState,
+    unseen_ids: bytes,
+    viewer: int,
+    rng: random.Random,
+    scratch: bytearray,
+    weights: Optional[Sequence[float]] = None
+) -> float:
+    """Re-deal the tiles the viewer cannot see.
+
+    Args:
+        state: Scratch game state (modified in place).
+        unseen_ids: Tile.index() ids of the unseen tiles to distribute.
+        viewer: Player whose hand is known.
+        rng: Random number generator; the bag keeps it for its draws.
+        scratch: Reusable shuffle buffer, overwritten with unseen_ids.
+        weights: Proposal weight per tile id for dealing the opponent's
+            hand (importance sampling); None deals uniformly.
+
+    Returns:
+        Likelihood ratio to weight a simulation from this deal by.
     """
-    # Start with all 108 tiles
-    all_tiles: List[Tile] = []
-    for shape in Shape:
-        for color in Color:
-            for _ in range(3):  # 3 copies of each
-                all_tiles.append(Tile(shape, color))
+    opponent = 1 - viewer
+    opponent_hand_size = len(state.hands[opponent])
+
+    scratch[:] = unseen_ids
+    if weights is None:
+        # Partial Fisher-Yates: only the opponent's hand needs dealing now.
+        # Deals and bag draws take one index at a time, where a stdlib
+        # randrange call is several times cheaper than a numpy Generator's
+        randrange = rng.randrange
+        n = len(scratch)
+        for j in range(opponent_hand_size):
+            i = randrange(j, n)
+            scratch[j], scratch[i] = scratch[i], scratch[j]
+        ratio = 1.0
+    else:
+        ratio = _deal_weighted(scratch, opponent_hand_size, weights, rng)
 
-    # Remove tiles on board
-    for _, tile in state.board.all_tiles():
-        all_tiles.remove(tile)
+    # Re-deal the opponent's hand; the bag keeps the rest unordered and
+    # picks at random as tiles are drawn
+    state.hands[opponent].replace_ids(scratch[:opponent_hand_size])
+    state.bag.replace_ids(scratch[opponent_hand_size:], rng, shuffled=False)
+    return ratio
 
-    # Remove viewer's hand
-    for tile in state.hands[viewer].tiles():
-        all_tiles.remove(tile)
 
-    return all_tiles
+def _play_out(state: GameState, solver: Solver, max_turns: int) -> None:
+    """Play a state forward until the game ends or max_turns is reached.
+
+    Also stops once the trailing player could not catch up even by
+    scoring the maximum with every tile left to them (their hand and
+    the bag) plus the end-game bonus, since the winner is then decided.
+    The outcome of this rollout is unaffected. A solver with its own RNG
+    (RandomSolver) draws less for the skipped turns, though, so later
+    rollouts sharing that solver follow a different random stream. Only
+    deterministic (greedy) playouts give the same estimates either way.
+
+    Args:
+        state: Scratch game state (modified in place).
+        solver: Solver to use for both players.
+        max_turns: Maximum turns to play.
+    """
+    # Solver moves were validated and scored against this state when
+    # generated, so they are committed without a second validation
+    # pass; bound methods are hoisted out of the loop.
+    get_move = solver.get_move
+    play = commit_move
+    hands = state.hands
+    bag = state.bag
+    scores = state.scores
+    for _ in range(max_turns):
+        if state.game_over:
+            break
+        move = get_move(state)
+
+        if move is not None:
+            play(state, move.placements, move.score, move.qwirkles)
+            lead = scores[0] - scores[1]
+            trailer = 1 if lead > 0 else 0
+            reachable = _MAX_POINTS_PER_TILE * (bag.remaining() + len(hands[trailer]))
+            if abs(lead) > reachable + END_GAME_BONUS:
+                break
+        else:
+            # No valid moves
+            hand = hands[state.current_player]
+            if not bag.is_empty() and len(hand) > 0:
+                apply_swap(state, [hand.first_tile()])
+            else:
+                state.game_over = True
+                break
+
+
+def _outcome(state: GameState) -> int:
+    """Return the winning player (0 or 1), or TIE.
+
+    Computed from the score comparison without branching, and usable
+    directly as an index into per-outcome totals.
+    """
+    s0, s1 = state.scores
+    return (s0 < s1) + TIE * (s0 == s1)
 
 
 def _simulate_game(
     state: GameState,
-    unseen: List[Tile],
+    unseen_ids: bytes,
     current_player: int,
     solver: Solver,
     rng: random.Random,
-    max_turns: int = 100
-) -> Optional[int]:
+    scratch: bytearray,
+    max_turns: int = 100,
+    weights: Optional[Sequence[float]] = None
+) -> Tuple[int, float]:
     """Simulate a game to completion from current state.
 
     Args:
-        state: Cloned game state to simulate from.
-        unseen: Unseen tiles to distribute.
+        state: Scratch game state to simulate from (modified in place).
+        unseen_ids: Tile.index() ids of the unseen tiles to distribute.
         current_player: Who is simulating (knows their hand).
         solver: Solver to use for both players.
         rng: Random number generator.
+        scratch: Reusable shuffle buffer, overwritten with unseen_ids.
         max_turns: Maximum additional turns.
+        weights: Proposal weight per tile id for dealing the opponent's
+            hand (importance sampling); None deals uniformly.
 
     Returns:
-        Winner index (0 or 1), or None for tie.
+        Tuple of (winner index (0 or 1) or TIE, likelihood ratio to
+        weight this simulation by).
     """
-    # Shuffle unseen tiles
-    shuffled = unseen.copy()
-    rng.shuffle(shuffled)
+    ratio = _deal_hidden(state, unseen_ids, current_player, rng, scratch, weights)
+    _play_out(state, solver, max_turns)
+    return _outcome(state), ratio
 
-    # Deal opponent's hand from unseen
-    opponent = 1 - current_player
-    opponent_hand_size = len(state.hands[opponent])
 
-    # Replace opponent's hand with random unseen tiles
-    new_opponent_hand = shuffled[:opponent_hand_size]
-    shuffled = shuffled[opponent_hand_size:]
+def _make_solver(solver_type: str, seed: int) -> Solver:
+    """Build the playout solver inside a worker.
+
+    Args:
+        solver_type: "greedy" or "random".
+        seed: Seed for the random solver.
+
+    Returns:
+        A new Solver.
+    """
+    if solver_type == "greedy":
+        return GreedySolver()
+    return RandomSolver(seed)
 
-    # Replace bag with remaining unseen tiles
-    state.hands[opponent] = Hand(new_opponent_hand)
 
-    # Create new bag with remaining tiles
-    new_bag = Bag.__new__(Bag)
-    new_bag._tiles = shuffled
-    new_bag._rng = rng
-    state.bag = new_bag
+def simulate_batch(
+    state_pickle: bytes,
+    viewer: int,
+    solver_type: str,
+    seed: int,
+    n: Optional[int],
+    time_budget: Optional[float] = None,
+    importance_sampling: bool = False
+) -> Tuple[float, float, float, float, int]:
+    """Run simulations from a pickled root position.
 
-    # Play out the game
-    turns = 0
-    while not state.game_over and turns < max_turns:
-        turns += 1
-        move = solver.get_move(state)
+    Args:
+        state_pickle: Pickled (GameState, unseen tile ids) tuple.
+        viewer: Index of the viewing player.
+        solver_type: "greedy" or "random" for simulation.
+        seed: Seed for this worker's RNG.
+        n: Number of simulations to run, or None for no limit.
+        time_budget: If given, stop starting new simulations once this
+            many seconds have passed (at least one is always run).
+        importance_sampling: Deal the opponent rare tiles more often and
+            weight each simulation by its likelihood ratio.
 
-        if move is not None:
-            success, _, _ = apply_move(state, move.placements)
-            if not success:
-                # Fallback: swap if possible
-                hand = state.hands[state.current_player]
-                if not state.bag.is_empty() and len(hand) > 0:
-                    apply_swap(state, [hand.tiles()[0]])
-                else:
-                    break
-        else:
-            # No valid moves
-            hand = state.hands[state.current_player]
-            if not state.bag.is_empty() and len(hand) > 0:
-                apply_swap(state, [hand.tiles()[0]])
-            else:
-                state.game_over = True
-                break
+    Returns:
+        Tuple of (player 0 wins, player 1 wins, ties, sum of squared
+        weights, simulations run). Wins and ties are summed weights,
+        which are all 1 without importance sampling.
+    """
+    state, unseen_ids = pickle.loads(state_pickle)
+    rng = random.Random(seed)
+    scratch = bytearray(len(unseen_ids))
+    weights = _rarity_weights(unseen_ids) if importance_sampling else None
+
+    # Built here rather than pickled along with the state
+    solver = _make_solver(solver_type, seed)
+
+    # Summed weights per outcome: player 0, player 1, tie
+    totals = [0.0, 0.0, 0.0]
+    weight_sq = 0.0
+
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    done = 0
+
+    # One scratch state, reset to the root before each simulation
+    sim_state = state.clone()
+    while n is None or done < n:
+        if deadline is not None and done and time.monotonic() >= deadline:
+            break
+        done += 1
+        sim_state.reset_from(state)
+        sim_rng = random.Random(rng.randint(0, 2**31))
+
+        outcome, weight = _simulate_game(
+            sim_state, unseen_ids, viewer, solver, sim_rng, scratch, weights=weights
+        )
+
+        totals[outcome] += weight
+        weight_sq += weight * weight
+
+    return totals[0], totals[1], totals[2], weight_sq, done
+
+
+# Pickled root position for this worker process, set by _init_worker
+_worker_payload: Optional[bytes] = None
+
+
+def _init_worker(payload: bytes) -> None:
+    """Pool initializer: keep the root position for every task in this process.
+
+    Args:
+        payload: Pickled (GameState, unseen tile ids) tuple.
+    """
+    global _worker_payload
+    _worker_payload = payload
 
-    # Determine winner
-    if state.scores[0] > state.scores[1]:
-        return 0
-    elif state.scores[1] > state.scores[0]:
-        return 1
-    return None
+
+def _run_batch(payload: bytes, args: Tuple) -> Tuple[float, float, float, float, int]:
+    """Run one batch of simulations from a pickled root.
+
+    Args:
+        payload: Pickled (GameState, unseen tile ids) tuple.
+        args: Tuple of (viewer, solver_type, seed, n, time_budget,
+            importance_sampling, tree_search).
+
+    Returns:
+        Weighted win totals from simulate_batch or mcts.search_batch.
+    """
+    *batch_args, importance_sampling, tree_search = args
+    if tree_search:
+        # Imported here: src.sim.mcts builds on this module's rollout helpers
+        from src.sim.mcts import search_batch
+        return search_batch(payload, *batch_args)
+    return simulate_batch(payload, *batch_args, importance_sampling)
+
+
+def _simulate_worker(args: Tuple) -> Tuple[float, float, float, float, int]:
+    """Worker function for parallel simulation.
+
+    The root position comes from _init_worker, so tasks carry only
+    their own settings.
+
+    Args:
+        args: Batch settings, as for _run_batch.
+
+    Returns:
+        Weighted win totals from _run_batch.
+    """
+    return _run_batch(_worker_payload, args)
 
 
 def estimate_win_probability(
@@ -154,23 +408,50 @@ def estimate_win_probability(
     viewer: int,
     n_simulations: int = 100,
     solver_type: str = "greedy",
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    parallel: bool = True,
+    max_workers: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    importance_sampling: bool = False,
+    tree_search: bool = False
 ) -> WinProbability:
     """Estimate win probability using Monte Carlo simulation.
 
     Runs multiple simulations from the current state, randomizing
     the unknown information (opponent's hand and bag contents).
 
+    Greedy playouts are the default: with top-1 move pruning they are
+    cheaper per rollout than random ones, which enumerate every move.
+
     Args:
         state: Current game state.
         viewer: Index of the viewing player (whose perspective).
-        n_simulations: Number of simulations to run.
+        n_simulations: Number of simulations to run (ignored when
+            time_budget is given).
         solver_type: "greedy" or "random" for simulation.
-        seed: Random seed for reproducibility.
+        seed: Base random seed (worker i uses seed ^ i); results are
+            reproducible for a given seed and worker count.
+        parallel: Whether to fan simulations out to worker processes.
+        max_workers: Max parallel workers (default: CPU count).
+        time_budget: If given, each worker runs simulations for about
+            this many seconds instead of a fixed count.
+        importance_sampling: Deal the opponent's hidden hand biased
+            toward rare tiles and reweight each simulation by its
+            likelihood ratio; confidence then uses the effective sample
+            size.
+        tree_search: Choose the first move of each simulation with UCB1
+            (see src.sim.mcts) instead of the playout solver, so the
+            estimate reflects the mover's best candidate moves.
 
     Returns:
         WinProbability with estimates.
+
+    Raises:
+        ValueError: If both importance_sampling and tree_search are set.
     """
+    if importance_sampling and tree_search:
+        raise ValueError("importance_sampling cannot be combined with tree_search")
+
     if state.game_over:
         # Game already over
         if state.winner == 0:
@@ -180,39 +461,48 @@ def estimate_win_probability(
         else:
             return WinProbability(0.0, 0.0, 1.0, 1)
 
-    rng = random.Random(seed)
-    unseen = get_unseen_tiles(state, viewer)
-
-    # Create solver
-    if solver_type == "greedy":
-        solver = GreedySolver()
+    if seed is None:
+        seed = random.randrange(2**31)
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count() if parallel else 1
+    if time_budget is None:
+        n_workers = max(1, min(max_workers, n_simulations))
     else:
-        solver = RandomSolver(seed)
-
-    # Run simulations
-    p0_wins = 0
-    p1_wins = 0
-    ties = 0
-
-    for i in range(n_simulations):
-        # Clone state for this simulation
-        sim_state = state.clone()
-        sim_rng = random.Random(rng.randint(0, 2**31))
-
-        winner = _simulate_game(sim_state, unseen, viewer, solver, sim_rng)
-
-        if winner == 0:
-            p0_wins += 1
-        elif winner == 1:
-            p1_wins += 1
+        n_workers = max(1, max_workers)
+
+    # Pickle once and hand it to each worker process when it starts, not
+    # with every task. Unseen tiles go as a bytes of ids, so workers skip
+    # decoding Tile objects.
+    payload = pickle.dumps((state, _unseen_ids(state, viewer)))
+    args_list = []
+    for worker_id in range(n_workers):
+        if time_budget is None:
+            n = n_simulations // n_workers + (1 if worker_id < n_simulations % n_workers else 0)
         else:
-            ties += 1
+            n = None
+        args_list.append((
+            viewer, solver_type, seed ^ worker_id, n, time_budget,
+            importance_sampling, tree_search,
+        ))
+
+    if parallel and n_workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_worker, initargs=(payload,)
+        ) as executor:
+            results = list(executor.map(_simulate_worker, args_list))
+    else:
+        results = [_run_batch(payload, args) for args in args_list]
+
+    # Column-wise sums over the per-worker result tuples
+    p0_wins, p1_wins, ties, weight_sq, n_run = map(sum, zip(*results))
+    total = p0_wins + p1_wins + ties
 
     return WinProbability(
-        p0_prob=p0_wins / n_simulations,
-        p1_prob=p1_wins / n_simulations,
-        tie_prob=ties / n_simulations,
-        n_simulations=n_simulations,
+        p0_prob=p0_wins / total,
+        p1_prob=p1_wins / total,
+        tie_prob=ties / total,
+        n_simulations=n_run,
+        effective_samples=total * total / weight_sq if importance_sampling else 0.0,
     )
 
 
@@ -5,15 +5,18 @@ Handles the play-render-input cycle with undo support and AI players.
 
 import sys
 import time
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from src.models.board import Position
 from src.models.tile import Tile
 from src.engine.game import (
     GameState,
     new_game,
-    apply_move,
     apply_swap,
+    check_move,
+    commit_move,
+    check_swap,
 )
 from src.ui.terminal import render_game, render_tile, clear_screen
 from src.ui.input import (
@@ -61,7 +64,8 @@ class GameSession:
             ai_strategy_p2: Strategy for player 2 in AI vs AI mode (defaults to ai_strategy).
         """
         self.state = new_game(seed)
-        self.history: List[GameState] = []
+        # Bounded: the oldest entry drops off once the cap is reached
+        self.history: Deque[GameState] = deque(maxlen=self.MAX_UNDO_HISTORY)
         self.last_move_positions: List[Position] = []
         self.message: str = "Welcome to Qwirkle! Player 1 goes first."
 
@@ -84,8 +88,6 @@ class GameSession:
 
     def _save_state(self) -> None:
         """Save current state to history for undo."""
-        if len(self.history) >= self.MAX_UNDO_HISTORY:
-            self.history.pop(0)
         self.history.append(self.state.clone())
 
     def play_tiles(self, placements: List[Tuple[int, Position]]) -> bool:
@@ -113,26 +115,23 @@ class GameSession:
             self.message = "Invalid tile index"
             return False
 
-        # Save state for undo
-        self._save_state()
+        # Validate before saving, so rejected moves skip the undo snapshot
+        valid, error, points, qwirkles = check_move(self.state, tile_placements)
+        if not valid:
+            self.message = f"Invalid move: {error}"
+            return False
 
-        # Apply the move
-        success, error, points = apply_move(self.state, tile_placements)
+        self._save_state()
+        commit_move(self.state, tile_placements, points, qwirkles)
 
-        if success:
-            self.last_move_positions = [p for p, _ in tile_placements]
-            if points > 0:
-                self.message = f"Scored {points} points!"
-                if self.state.game_over:
-                    self._announce_winner()
-            else:
-                self.message = ""
-            return True
+        self.last_move_positions = [p for p, _ in tile_placements]
+        if points > 0:
+            self.message = f"Scored {points} points!"
+            if self.state.game_over:
+                self._announce_winner()
         else:
-            # Restore state on failure
-            self.history.pop()
-            self.message = f"Invalid move: {error}"
-            return False
+            self.message = ""
+        return True
 
     def swap_tiles(self, tile_indices: List[int]) -> bool:
         """Execute a swap command.
@@ -158,21 +157,19 @@ class GameSession:
             self.message = "Invalid tile index"
             return False
 
-        # Save state for undo
-        self._save_state()
-
-        # Apply the swap
-        success, error = apply_swap(self.state, tiles_to_swap)
-
-        if success:
-            self.last_move_positions = []
-            self.message = f"Swapped {len(tiles_to_swap)} tile(s)"
-            return True
-        else:
-            self.history.pop()
+        # Validate before saving, so rejected swaps skip the undo snapshot
+        valid, error = check_swap(self.state, tiles_to_swap)
+        if not valid:
             self.message = f"Cannot swap: {error}"
             return False
 
+        self._save_state()
+        apply_swap(self.state, tiles_to_swap)
+
+        self.last_move_positions = []
+        self.message = f"Swapped {len(tiles_to_swap)} tile(s)"
+        return True
+
     def undo(self) -> bool:
         """Undo the last move.
 
@@ -219,11 +216,16 @@ class GameSession:
 
         return f"Hint: Play {', '.join(placements_str)} for {move.score} points"
 
-    def get_win_probability_message(self, n_simulations: int = 50) -> str:
+    def get_win_probability_message(
+        self,
+        n_simulations: int = 50,
+        time_budget_s: Optional[float] = None
+    ) -> str:
         """Estimate win probability using Monte Carlo simulation.
 
         Args:
             n_simulations: Number of simulations to run.
+            time_budget_s: If set, simulate for this many seconds instead.
 
         Returns:
             Formatted win probability string.
@@ -235,7 +237,8 @@ class GameSession:
             self.state,
             viewer=self.state.current_player,
             n_simulations=n_simulations,
-            solver_type="greedy"
+            solver_type="greedy",
+            time_budget=time_budget_s
         )
         return format_win_probability(prob, self.state.current_player)
 
@@ -271,30 +274,31 @@ class GameSession:
             hand = self.state.hands[self.state.current_player]
             if not self.state.bag.is_empty() and len(hand) > 0:
                 # Swap first tile
-                self._save_state()
-                success, error = apply_swap(self.state, [hand.tiles()[0]])
-                if success:
+                swap = [hand.first_tile()]
+                if check_swap(self.state, swap)[0]:
+                    self._save_state()
+                    apply_swap(self.state, swap)
                     self.last_move_positions = []
                     self.message = f"AI swapped a tile"
                     return True
             self.message = "AI has no valid moves"
             return False
 
-        # Save state and apply move
-        self._save_state()
-        success, error, points = apply_move(self.state, move.placements)
-
-        if success:
-            self.last_move_positions = [p for p, _ in move.placements]
-            self.message = f"AI scored {points} points!"
-            if self.state.game_over:
-                self._announce_winner()
-            return True
-        else:
-            self.history.pop()
+        # Validate, then save state and apply move
+        valid, error, points, qwirkles = check_move(self.state, move.placements)
+        if not valid:
             self.message = f"AI move failed: {error}"
             return False
 
+        self._save_state()
+        commit_move(self.state, move.placements, points, qwirkles)
+
+        self.last_move_positions = [p for p, _ in move.placements]
+        self.message = f"AI scored {points} points!"
+        if self.state.game_over:
+            self._announce_winner()
+        return True
+
     def render(self) -> str:
         """Render the current game view.
 
@@ -322,7 +326,8 @@ def run_game(
         ai_strategy: "greedy" or "random".
         ai_vs_ai: If True, both players are AI.
         ai_strategy_p2: Strategy for player 2 in AI vs AI mode.
-        delay: Delay between AI moves in seconds (for watching).
+        delay: Minimum time per AI move in seconds (for watching); time
+            spent searching counts toward it.
     """
     session = GameSession(seed, ai_player, ai_strategy, ai_vs_ai, ai_strategy_p2)
 
@@ -344,8 +349,13 @@ def run_game(
                 print(f"\nPlayer {player} (AI) is thinking...")
             else:
                 print("\nAI is thinking...")
-            time.sleep(delay)
+            # The delay is a minimum time per AI turn: the search runs
+            # first and only what is left of the delay is slept
+            started = time.monotonic()
             session.play_ai_turn()
+            remaining = delay - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
             continue
 
         # Get human input
@@ -378,7 +388,9 @@ def run_game(
 
         elif isinstance(cmd, ProbCommand):
             print("\nCalculating win probability...")
-            session.message = session.get_win_probability_message(cmd.n_simulations)
+            session.message = session.get_win_probability_message(
+                cmd.n_simulations, cmd.time_budget_s
+            )
 
         elif isinstance(cmd, PlayCommand):
             session.play_tiles(cmd.placements)
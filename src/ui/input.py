@@ -3,7 +3,6 @@
 Parses user input into structured commands.
 """
 
-import re
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Union
 from src.models.tile import Tile, Color, Shape
@@ -29,6 +28,16 @@ SHAPE_MAP = {
     'X': Shape.CROSS,    # X for cross
 }
 
+# The same maps as tables indexed by character code. Lookups mask the
+# code with 0xDF, which upper-cases ASCII letters and leaves every
+# other code off the letter entries.
+_COLOR_TABLE: List[Optional[Color]] = [None] * 128
+_SHAPE_TABLE: List[Optional[Shape]] = [None] * 128
+for _letter, _color in COLOR_MAP.items():
+    _COLOR_TABLE[ord(_letter)] = _color
+for _letter, _shape in SHAPE_MAP.items():
+    _SHAPE_TABLE[ord(_letter)] = _shape
+
 
 @dataclass
 class PlayCommand:
@@ -81,8 +90,11 @@ class ProbCommand:
 
     Attributes:
         n_simulations: Number of Monte Carlo simulations to run.
+        time_budget_s: If set, simulate for this many seconds instead
+            of a fixed count.
     """
     n_simulations: int = 50
+    time_budget_s: Optional[float] = None
 
 
 Command = Union[PlayCommand, SwapCommand, QuitCommand, UndoCommand, HintCommand, HelpCommand, ProbCommand]
@@ -97,10 +109,15 @@ def parse_position(pos_str: str) -> Optional[Position]:
     Returns:
         Position tuple or None if invalid.
     """
-    match = re.match(r'^(-?\d+),(-?\d+)$', pos_str.strip())
-    if match:
-        return (int(match.group(1)), int(match.group(2)))
-    return None
+    row, sep, col = pos_str.strip().partition(',')
+    # Digits with optional minus signs only: int() alone would also take
+    # '+', inner spaces and underscores. A repeated '-' fails in int().
+    if not (sep and row.lstrip('-').isdecimal() and col.lstrip('-').isdecimal()):
+        return None
+    try:
+        return (int(row), int(col))
+    except ValueError:
+        return None
 
 
 def parse_tile_spec(spec: str) -> Optional[Tile]:
@@ -112,12 +129,15 @@ def parse_tile_spec(spec: str) -> Optional[Tile]:
     Returns:
         Tile or None if invalid.
     """
-    spec = spec.upper().strip()
+    spec = spec.strip()
     if len(spec) != 2:
         return None
 
-    color = COLOR_MAP.get(spec[0])
-    shape = SHAPE_MAP.get(spec[1])
+    color_code, shape_code = ord(spec[0]), ord(spec[1])
+    if color_code > 127 or shape_code > 127:
+        return None
+    color = _COLOR_TABLE[color_code & 0xDF]
+    shape = _SHAPE_TABLE[shape_code & 0xDF]
 
     if color and shape:
         return Tile(shape, color)
@@ -162,6 +182,15 @@ def parse_command(input_str: str) -> Tuple[Optional[Command], str]:
     # Win probability
     if cmd in ('prob', 'winprob', 'probability'):
         n_sims = 50  # default
+        if args and args[0].endswith('s'):
+            # Time budget, e.g. "prob 2s"
+            try:
+                seconds = float(args[0][:-1])
+            except ValueError:
+                return None, f"Invalid time budget: {args[0]}"
+            if not 0 < seconds <= 30:
+                return None, "Time budget must be between 0 and 30 seconds"
+            return ProbCommand(n_sims, time_budget_s=seconds), ""
         if args:
             try:
                 n_sims = int(args[0])
@@ -191,62 +220,33 @@ def _parse_play_command(args: List[str]) -> Tuple[Optional[PlayCommand], str]:
         play 1 0,0              - Play hand tile 1 at position (0,0)
         play 1,2 0,0 0,1        - Play tiles 1,2 at positions (0,0), (0,1)
         play 1 2 0,0 0,1        - Same as above (space-separated indices)
+
+    Tile indices come first and positions last, so "play 1,2 0,0" is
+    two tiles and one position rather than a lone position.
     """
     if not args:
         return None, "Usage: play <tile_indices> <positions>\nExample: play 1 0,0  or  play 1,2 0,0 0,1"
 
-    # Separate tile indices from positions
-    # Strategy: positions always contain negative numbers or are the later args
-    # Tile indices are small positive integers (1-6)
-    tile_indices = []
-    positions = []
+    # The first argument is always tile indices. Positions start at the
+    # first later argument with exactly one comma and run to the end;
+    # anything between is more tile indices.
+    split = next(
+        (i for i in range(1, len(args)) if args[i].count(',') == 1), len(args)
+    )
 
-    for arg in args:
-        if ',' in arg:
-            # Check if it looks like a position (has exactly one comma, could have negative)
-            parts = arg.split(',')
-            if len(parts) == 2:
-                try:
-                    row, col = int(parts[0]), int(parts[1])
-                    # If either is negative or both are valid coords, it's a position
-                    # If all values are 1-6, it could be tile indices
-                    if row < 0 or col < 0 or row > 6 or col > 6:
-                        # Definitely a position (outside tile index range)
-                        positions.append((row, col))
-                    elif len(positions) > 0:
-                        # We've already seen positions, so this must be a position too
-                        positions.append((row, col))
-                    elif all(1 <= int(x) <= 6 for x in parts):
-                        # Could be tile indices if we haven't seen positions yet
-                        # Check if remaining args look like positions
-                        remaining = args[args.index(arg)+1:]
-                        if remaining and any(',' in r for r in remaining):
-                            # More comma args follow, treat this as tile indices
-                            tile_indices.extend([int(x) for x in parts])
-                        else:
-                            # No more comma args, ambiguous - treat as position
-                            positions.append((row, col))
-                    else:
-                        # Values outside 1-6, must be position
-                        positions.append((row, col))
-                except ValueError:
-                    return None, f"Invalid argument: {arg}"
-            else:
-                # More than one comma - must be tile indices
-                try:
-                    indices = [int(x) for x in parts]
-                    tile_indices.extend(indices)
-                except ValueError:
-                    return None, f"Invalid argument: {arg}"
-        else:
-            # No comma - single tile index
-            try:
-                tile_indices.append(int(arg))
-            except ValueError:
-                return None, f"Invalid tile index: {arg}"
+    tile_indices = []
+    for arg in args[:split]:
+        try:
+            tile_indices.extend(int(x) for x in arg.split(','))
+        except ValueError:
+            return None, f"Invalid tile index: {arg}"
 
-    if not tile_indices:
-        return None, "No tile indices specified"
+    positions = []
+    for arg in args[split:]:
+        pos = parse_position(arg)
+        if pos is None:
+            return None, f"Invalid position: {arg}"
+        positions.append(pos)
 
     if not positions:
         return None, "No positions specified"
@@ -328,13 +328,15 @@ undo
 hint
     Get a suggestion for your next move.
 
-prob [n]
+prob [n | <seconds>s]
     Estimate win probability using Monte Carlo simulation.
-    Optional: specify number of simulations (default: 50, max: 1000).
+    Optional: specify number of simulations (default: 50, max: 1000),
+    or a time budget in seconds (max: 30).
 
     Examples:
         prob             Run 50 simulations
         prob 100         Run 100 simulations
+        prob 2s          Simulate for about 2 seconds
 
 quit (or q)
     Exit the game.
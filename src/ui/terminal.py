@@ -4,7 +4,7 @@ Renders tiles, board, hands, and game status using ANSI colors and Unicode symbo
 """
 
 from typing import Dict, List, Optional, Tuple
-from src.models.tile import Tile, Color, Shape
+from src.models.tile import Tile, Color, Shape, TILE_BY_ID
 from src.models.board import Board, Position
 from src.models.hand import Hand
 from src.engine.game import GameState
@@ -34,6 +34,29 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 DIM = "\033[2m"
 
+# Label letters for shapes, avoiding clashes: Star->T, Clover->L, Cross->X
+_SHAPE_LETTERS: Dict[Shape, str] = {
+    Shape.CIRCLE: "O",   # O for circle
+    Shape.SQUARE: "S",
+    Shape.DIAMOND: "D",
+    Shape.STAR: "T",     # T for star
+    Shape.CLOVER: "L",   # L for clover (flower)
+    Shape.CROSS: "X",    # X for cross
+}
+
+# Rendered strings for every tile type, indexed by Tile.index(); frames
+# only ever draw these 36 tiles, so they are formatted once at import
+_TILE_COLORED = tuple(
+    f"{COLOR_CODES[t.color]}{SHAPE_SYMBOLS[t.shape]}{RESET}" for t in TILE_BY_ID
+)
+_TILE_PLAIN = tuple(SHAPE_SYMBOLS[t.shape] for t in TILE_BY_ID)
+
+# Board cells (3 columns wide) by tile id, plain and highlighted
+_EMPTY_CELL = " · "
+_BOARD_CELLS = tuple(f" {tile} " for tile in _TILE_COLORED)
+_HIGHLIGHT_CELLS = tuple(f"{BOLD} {tile} {RESET}" for tile in _TILE_COLORED)
+_TILE_LABELS = tuple(f"{t.color.name[0]}{_SHAPE_LETTERS[t.shape]}" for t in TILE_BY_ID)
+
 
 def render_tile(tile: Tile, with_color: bool = True) -> str:
     """Render a single tile as a colored Unicode symbol.
@@ -45,11 +68,9 @@ def render_tile(tile: Tile, with_color: bool = True) -> str:
     Returns:
         String representation of the tile.
     """
-    symbol = SHAPE_SYMBOLS[tile.shape]
     if with_color:
-        color = COLOR_CODES[tile.color]
-        return f"{color}{symbol}{RESET}"
-    return symbol
+        return _TILE_COLORED[tile.index()]
+    return _TILE_PLAIN[tile.index()]
 
 
 def render_tile_label(tile: Tile) -> str:
@@ -57,18 +78,7 @@ def render_tile_label(tile: Tile) -> str:
 
     Returns a 2-character code: first letter of color + first letter of shape.
     """
-    color_letter = tile.color.name[0]  # R, O, Y, G, B, P
-    shape_letter = tile.shape.name[0]  # C, S, D, T(star), L(clover), R(cross)
-    # Handle conflicts: Star->T, Clover->L, Cross->X
-    shape_map = {
-        Shape.CIRCLE: "O",   # O for circle
-        Shape.SQUARE: "S",
-        Shape.DIAMOND: "D",
-        Shape.STAR: "T",     # T for star
-        Shape.CLOVER: "L",   # L for clover (flower)
-        Shape.CROSS: "X",    # X for cross
-    }
-    return f"{color_letter}{shape_map[tile.shape]}"
+    return _TILE_LABELS[tile.index()]
 
 
 def render_board(
@@ -89,7 +99,8 @@ def render_board(
     if board.is_board_empty():
         return "  (empty board)\n"
 
-    highlight = set(highlight_positions) if highlight_positions else set()
+    # None when nothing is highlighted, so cells skip the lookup entirely
+    highlight = frozenset(highlight_positions) if highlight_positions else None
 
     min_row, max_row, min_col, max_col = board.bounds()
 
@@ -101,28 +112,32 @@ def render_board(
 
     lines = []
 
-    # Column headers
-    header = "    "  # Space for row labels
+    # Column headers, after space for the row labels; rows below are also
+    # built as lists of cells and joined once
+    header = ["    "]
     for col in range(min_col, max_col + 1):
-        header += f"{col:^3}"
-    lines.append(header)
+        header.append(f"{col:^3}")
+    lines.append("".join(header))
 
     # Separator
     lines.append("   " + "─" * ((max_col - min_col + 1) * 3 + 1))
 
-    # Rows
+    # Rows: each cell is one id lookup plus one index into the
+    # precomputed cell tables, with no Tile objects or formatting
+    get_id = board.get_id
+    cols = range(min_col, max_col + 1)
     for row in range(min_row, max_row + 1):
-        row_str = f"{row:>2} │"
-        for col in range(min_col, max_col + 1):
-            tile = board.get((row, col))
-            if tile:
-                cell = f" {render_tile(tile)} "
-                if (row, col) in highlight:
-                    cell = f"{BOLD}{cell}{RESET}"
+        row_cells = [f"{row:>2} │"]
+        for col in cols:
+            tile_id = get_id((row, col))
+            if tile_id is None:
+                cell = _EMPTY_CELL
+            elif highlight is not None and (row, col) in highlight:
+                cell = _HIGHLIGHT_CELLS[tile_id]
             else:
-                cell = " · "
-            row_str += cell
-        lines.append(row_str)
+                cell = _BOARD_CELLS[tile_id]
+            row_cells.append(cell)
+        lines.append("".join(row_cells))
 
     return "\n".join(lines) + "\n"
 
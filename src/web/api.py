@@ -7,7 +7,6 @@ from typing import List, Dict, Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.models.tile import Shape, Color
 from src.models.board import Position
 from src.web.models import (
     NewGameRequest, NewGameResponse,
@@ -39,38 +38,34 @@ app.add_middleware(
 )
 
 
-def _tile_to_model(tile) -> TileModel:
-    """Convert Tile to TileModel."""
-    shapes = list(Shape)
-    colors = list(Color)
-    return TileModel(
-        shape=shapes.index(tile.shape),
-        color=colors.index(tile.color)
-    )
-
-
 def _session_to_state_response(session: GameSession) -> GameStateResponse:
-    """Convert session to GameStateResponse."""
-    state = session.state
+    """Convert session to GameStateResponse.
 
-    # Convert board
-    board: Dict[str, TileModel] = {}
-    for pos, tile in state.board.all_tiles():
-        key = f"{pos[0]},{pos[1]}"
-        board[key] = _tile_to_model(tile)
-
-    # Convert current player's hand
-    hand = [_tile_to_model(t) for t in state.hands[state.current_player].tiles()]
+    Every field comes from engine state rather than the client, so the
+    response is built with model_construct and skips validation.
+    """
+    state = session.state
 
-    # Convert last move positions
-    last_positions = [[p[0], p[1]] for p in session.last_move_positions]
+    # One comprehension per container, building tile models inline from
+    # the enum positions each Tile carries
+    tile_model = TileModel.model_construct
+    board: Dict[str, TileModel] = {
+        f"{row},{col}": tile_model(shape=tile.shape_idx, color=tile.color_idx)
+        for (row, col), tile in state.board.all_tiles()
+    }
+    hand = [
+        tile_model(shape=tile.shape_idx, color=tile.color_idx)
+        for tile in state.hands[state.current_player].tiles()
+    ]
+    last_positions = [[row, col] for row, col in session.last_move_positions]
 
-    return GameStateResponse(
+    return GameStateResponse.model_construct(
         game_id=session.game_id,
         board=board,
         hand=hand,
         current_player=state.current_player,
-        scores=state.scores,
+        # Copied: validation used to copy it, and the live list keeps changing
+        scores=list(state.scores),
         bag_remaining=state.bag.remaining(),
         game_over=state.game_over,
         winner=state.winner,
@@ -220,7 +215,8 @@ async def get_hint(game_id: str):
         # Find tile index in hand
         try:
             idx = hand.index(tile) + 1
-            placements.append(PlacementModel(
+            # Engine-built hint, so validation is skipped
+            placements.append(PlacementModel.model_construct(
                 row=pos[0],
                 col=pos[1],
                 tile_index=idx
@@ -4,12 +4,20 @@ Manages in-memory game sessions with undo support.
 """
 
 import uuid
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 from src.models.board import Position
 from src.models.tile import Tile, Shape, Color
-from src.engine.game import GameState, new_game, apply_move, apply_swap
+from src.engine.game import (
+    GameState,
+    new_game,
+    apply_swap,
+    check_move,
+    commit_move,
+    check_swap,
+)
 from src.ai.solver import GreedySolver, RandomSolver, get_hint
 from src.ai.move_gen import Move
 
@@ -21,7 +29,8 @@ class GameSession:
     Attributes:
         game_id: Unique session identifier.
         state: Current game state.
-        history: Stack of previous states for undo.
+        history: Stack of previous states for undo; the oldest entry
+            drops off once MAX_UNDO_HISTORY is reached.
         last_move_positions: Positions from last move (for highlighting).
         message: Status message.
         vs_ai: Whether playing against AI.
@@ -30,7 +39,9 @@ class GameSession:
     """
     game_id: str
     state: GameState
-    history: List[GameState] = field(default_factory=list)
+    history: Deque[GameState] = field(
+        default_factory=lambda: deque(maxlen=GameSession.MAX_UNDO_HISTORY)
+    )
     last_move_positions: List[Position] = field(default_factory=list)
     message: str = ""
     vs_ai: bool = False
@@ -41,8 +52,6 @@ class GameSession:
 
     def save_state(self) -> None:
         """Save current state for undo."""
-        if len(self.history) >= self.MAX_UNDO_HISTORY:
-            self.history.pop(0)
         self.history.append(self.state.clone())
 
     def can_undo(self) -> bool:
@@ -136,35 +145,27 @@ class SessionManager:
         except (IndexError, TypeError) as e:
             return False, 0, 0, f"Invalid placement: {e}"
 
-        # Save state for undo
+        # Validate before saving, so rejected moves skip the undo snapshot
+        valid, error, points, qwirkles = check_move(session.state, tile_placements)
+        if not valid:
+            return False, 0, 0, error or "Invalid move"
+
         session.save_state()
+        commit_move(session.state, tile_placements, points, qwirkles)
 
-        # Apply move
-        success, error, points = apply_move(session.state, tile_placements)
-
-        if success:
-            session.last_move_positions = [p for p, _ in tile_placements]
-            # Count qwirkles from the move's score (6 = qwirkle bonus per line)
-            qwirkles = 0
-            if points >= 12:
-                # Rough estimate - actual counting would need move analysis
-                qwirkles = points // 12
-            session.message = f"Scored {points} points!"
-
-            if session.state.game_over:
-                if session.state.winner is not None:
-                    session.message = (
-                        f"Game Over! Player {session.state.winner + 1} wins "
-                        f"with {session.state.scores[session.state.winner]} points!"
-                    )
-                else:
-                    session.message = f"Game Over! It's a tie at {session.state.scores[0]} points!"
-
-            return True, points, qwirkles, ""
-        else:
-            # Restore state on failure
-            session.history.pop()
-            return False, 0, 0, error or "Invalid move"
+        session.last_move_positions = [p for p, _ in tile_placements]
+        session.message = f"Scored {points} points!"
+
+        if session.state.game_over:
+            if session.state.winner is not None:
+                session.message = (
+                    f"Game Over! Player {session.state.winner + 1} wins "
+                    f"with {session.state.scores[session.state.winner]} points!"
+                )
+            else:
+                session.message = f"Game Over! It's a tie at {session.state.scores[0]} points!"
+
+        return True, points, qwirkles, ""
 
     def swap_tiles(
         self,
@@ -193,19 +194,17 @@ class SessionManager:
         except (IndexError, TypeError) as e:
             return False, f"Invalid swap: {e}"
 
-        # Save state for undo
-        session.save_state()
+        # Validate before saving, so rejected swaps skip the undo snapshot
+        valid, error = check_swap(session.state, tiles_to_swap)
+        if not valid:
+            return False, error or "Cannot swap"
 
-        # Apply swap
-        success, error = apply_swap(session.state, tiles_to_swap)
+        session.save_state()
+        apply_swap(session.state, tiles_to_swap)
 
-        if success:
-            session.last_move_positions = []
-            session.message = f"Swapped {len(tiles_to_swap)} tile(s)"
-            return True, ""
-        else:
-            session.history.pop()
-            return False, error or "Cannot swap"
+        session.last_move_positions = []
+        session.message = f"Swapped {len(tiles_to_swap)} tile(s)"
+        return True, ""
 
     def undo(self, session: GameSession) -> Tuple[bool, str]:
         """Undo the last move.
@@ -261,37 +260,38 @@ class SessionManager:
             # No valid moves - swap a tile
             hand = session.state.hands[current]
             if not session.state.bag.is_empty() and len(hand) > 0:
-                session.save_state()
-                success, error = apply_swap(session.state, [hand.tiles()[0]])
-                if success:
+                swap = [hand.first_tile()]
+                if check_swap(session.state, swap)[0]:
+                    session.save_state()
+                    apply_swap(session.state, swap)
                     session.last_move_positions = []
                     session.message = f"{player_name} swapped a tile"
                     return True, 0, session.message
             return False, 0, f"{player_name} has no valid moves"
 
-        # Save state and apply move
-        session.save_state()
-        success, error, points = apply_move(session.state, move.placements)
-
-        if success:
-            session.last_move_positions = [p for p, _ in move.placements]
-            session.message = f"{player_name} scored {points} points!"
-
-            if session.state.game_over:
-                if session.state.winner is not None:
-                    winner_name = f"AI {session.state.winner + 1}" if session.ai_vs_ai else f"Player {session.state.winner + 1}"
-                    session.message = (
-                        f"Game Over! {winner_name} wins "
-                        f"with {session.state.scores[session.state.winner]} points!"
-                    )
-                else:
-                    session.message = f"Game Over! It's a tie!"
-
-            return True, points, session.message
-        else:
-            session.history.pop()
+        # Validate, then save state and apply move
+        valid, error, points, qwirkles = check_move(session.state, move.placements)
+        if not valid:
             return False, 0, f"{player_name} move failed: {error}"
 
+        session.save_state()
+        commit_move(session.state, move.placements, points, qwirkles)
+
+        session.last_move_positions = [p for p, _ in move.placements]
+        session.message = f"{player_name} scored {points} points!"
+
+        if session.state.game_over:
+            if session.state.winner is not None:
+                winner_name = f"AI {session.state.winner + 1}" if session.ai_vs_ai else f"Player {session.state.winner + 1}"
+                session.message = (
+                    f"Game Over! {winner_name} wins "
+                    f"with {session.state.scores[session.state.winner]} points!"
+                )
+            else:
+                session.message = f"Game Over! It's a tie!"
+
+        return True, points, session.message
+
 
 # Global session manager instance
 session_manager = SessionManager()
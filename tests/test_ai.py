@@ -1,16 +1,23 @@
 """Tests for AI module."""
 
+import pickle
+
 import pytest
 from src.models.tile import Color, Shape, Tile
 from src.models.board import Board
 from src.models.hand import Hand
 from src.engine.game import GameState, new_game
+from src.engine.rules import validate_move
+from src.engine.scoring import score_move
 from src.ai.move_gen import (
     find_valid_positions,
     generate_single_tile_moves,
     generate_multi_tile_moves,
     generate_all_moves,
     Move,
+    MoveCache,
+    _find_extension_positions,
+    _move_key,
 )
 from src.ai.solver import (
     GreedySolver,
@@ -20,6 +27,12 @@ from src.ai.solver import (
     get_random_move,
     get_hint,
 )
+from src.ai.mcts_parallel import (
+    MonteCarloSolver,
+    move_key,
+    run_rollouts,
+    select_move_parallel,
+)
 
 
 class TestFindValidPositions:
@@ -57,6 +70,50 @@ class TestFindValidPositions:
         assert (-1, 1) in positions  # above second
         assert len(positions) >= 6
 
+    def test_cache_invalidated_by_place(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        first = find_valid_positions(board)
+        assert find_valid_positions(board) is first
+
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+        second = find_valid_positions(board)
+
+        assert (0, 1) not in second
+        assert (0, 2) in second
+
+
+class TestFindExtensionPositions:
+    """Test empty-run lookups along rows and columns."""
+
+    def test_stops_before_tiles(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 3), Tile(Shape.SQUARE, Color.RED))
+        board.place((-2, 1), Tile(Shape.STAR, Color.RED))
+
+        assert _find_extension_positions(board, (0, 1), 'right') == [(0, 2)]
+        assert _find_extension_positions(board, (0, 1), 'left') == []
+        assert _find_extension_positions(board, (0, 1), 'up') == [(-1, 1)]
+        assert _find_extension_positions(board, (0, 1), 'down') == [
+            (1, 1), (2, 1), (3, 1), (4, 1), (5, 1)
+        ]
+
+    def test_respects_max_extend(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        assert _find_extension_positions(board, (0, 1), 'right', max_extend=2) == [
+            (0, 2), (0, 3)
+        ]
+
+    def test_sees_newly_placed_tiles(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        assert len(_find_extension_positions(board, (0, 1), 'right')) == 5
+
+        board.place((0, 4), Tile(Shape.SQUARE, Color.RED))
+        assert _find_extension_positions(board, (0, 1), 'right') == [(0, 2), (0, 3)]
+
 
 class TestGenerateSingleTileMoves:
     """Test single-tile move generation."""
@@ -101,6 +158,33 @@ class TestGenerateSingleTileMoves:
         # Should only generate one move, not two
         assert len(moves) == 1
 
+    def test_matches_validate_and_score(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+        board.place((1, 1), Tile(Shape.SQUARE, Color.BLUE))
+        hand = Hand([
+            Tile(Shape.DIAMOND, Color.RED),
+            Tile(Shape.SQUARE, Color.GREEN),
+            Tile(Shape.CIRCLE, Color.BLUE),
+            Tile(Shape.STAR, Color.BLUE),
+        ])
+
+        moves = generate_single_tile_moves(board, hand)
+
+        expected = set()
+        for tile in set(hand.tiles()):
+            for pos in find_valid_positions(board):
+                if validate_move(board, [(pos, tile)])[0]:
+                    points, qwirkles = score_move(board, [(pos, tile)])
+                    expected.add((pos, tile, points, qwirkles))
+        actual = {(m.placements[0][0], m.placements[0][1], m.score, m.qwirkles) for m in moves}
+        assert actual == expected
+
+    def test_empty_board_requires_first_move(self):
+        hand = Hand([Tile(Shape.CIRCLE, Color.RED)])
+        assert generate_single_tile_moves(Board(), hand, is_first_move=False) == []
+
 
 class TestGenerateMultiTileMoves:
     """Test multi-tile move generation."""
@@ -132,6 +216,87 @@ class TestGenerateMultiTileMoves:
         moves = generate_multi_tile_moves(board, hand, is_first_move=False)
         assert moves == []  # Need 2+ tiles for multi-tile moves
 
+    def test_finds_compatible_pair_late_in_hand(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        # Only the last two tiles share an attribute
+        hand = Hand([
+            Tile(Shape.SQUARE, Color.BLUE),
+            Tile(Shape.DIAMOND, Color.GREEN),
+            Tile(Shape.STAR, Color.YELLOW),
+            Tile(Shape.CLOVER, Color.ORANGE),
+            Tile(Shape.SQUARE, Color.RED),
+            Tile(Shape.DIAMOND, Color.RED),
+        ])
+
+        moves = generate_multi_tile_moves(board, hand, is_first_move=False)
+
+        assert any(m.score == 3 for m in moves)
+
+    def test_color_groups_do_not_starve_shape_groups(self):
+        board = Board()
+        board.place((6, -4), Tile(Shape.CROSS, Color.YELLOW))
+        board.place((6, -3), Tile(Shape.CIRCLE, Color.YELLOW))
+        board.place((7, -3), Tile(Shape.CIRCLE, Color.RED))
+        board.place((8, -3), Tile(Shape.CIRCLE, Color.BLUE))
+        # The red group alone has enough combinations to use up a
+        # shared budget before the cross pair is tried
+        hand = Hand([
+            Tile(Shape.CROSS, Color.RED),
+            Tile(Shape.CROSS, Color.BLUE),
+            Tile(Shape.SQUARE, Color.RED),
+            Tile(Shape.DIAMOND, Color.RED),
+            Tile(Shape.STAR, Color.RED),
+            Tile(Shape.CLOVER, Color.RED),
+        ])
+
+        best = max(generate_all_moves(board, hand), key=lambda m: m.score)
+
+        assert best.score == 7
+        assert sorted(best.placements) == [
+            ((7, -4), Tile(Shape.CROSS, Color.RED)),
+            ((8, -4), Tile(Shape.CROSS, Color.BLUE)),
+        ]
+
+    def test_duplicate_tile_gives_other_order(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.SQUARE, Color.YELLOW))
+        hand = Hand([
+            Tile(Shape.CIRCLE, Color.YELLOW),
+            Tile(Shape.CLOVER, Color.YELLOW),
+            Tile(Shape.CIRCLE, Color.YELLOW),
+        ])
+
+        moves = generate_multi_tile_moves(board, hand, is_first_move=False)
+
+        assert any(
+            m.placements == [
+                ((0, 1), Tile(Shape.CLOVER, Color.YELLOW)),
+                ((0, 2), Tile(Shape.CIRCLE, Color.YELLOW)),
+            ]
+            for m in moves
+        )
+
+    def test_moves_agree_with_rules_engine(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+        board.place((1, 0), Tile(Shape.CIRCLE, Color.BLUE))
+        hand = Hand([
+            Tile(Shape.DIAMOND, Color.RED),
+            Tile(Shape.STAR, Color.RED),
+            Tile(Shape.CIRCLE, Color.GREEN),
+            Tile(Shape.CIRCLE, Color.YELLOW),
+            Tile(Shape.CROSS, Color.BLUE),
+        ])
+
+        moves = generate_multi_tile_moves(board, hand, is_first_move=False)
+
+        assert moves
+        for move in moves:
+            assert validate_move(board, move.placements)[0]
+            assert score_move(board, move.placements) == (move.score, move.qwirkles)
+
 
 class TestGenerateAllMoves:
     """Test combined move generation."""
@@ -166,6 +331,67 @@ class TestGenerateAllMoves:
         for i in range(len(moves) - 1):
             assert moves[i].score >= moves[i + 1].score
 
+    def test_top_k_matches_full_list(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+        board.place((1, 0), Tile(Shape.CIRCLE, Color.BLUE))
+        hand = Hand([
+            Tile(Shape.DIAMOND, Color.RED),
+            Tile(Shape.STAR, Color.RED),
+            Tile(Shape.CIRCLE, Color.GREEN),
+            Tile(Shape.CIRCLE, Color.YELLOW),
+            Tile(Shape.CROSS, Color.BLUE),
+        ])
+
+        full = generate_all_moves(board, hand)
+        best = generate_all_moves(board, hand, top_k=1)
+        top3 = generate_all_moves(board, hand, top_k=3)
+
+        assert best == full[:1]
+        assert [m.score for m in top3] == [m.score for m in full[:3]]
+
+    def test_greedy_solver_uses_top_k(self):
+        state = new_game(seed=42)
+        hand = state.hands[0]
+
+        move = GreedySolver().get_move(state)
+
+        assert move == generate_all_moves(state.board, hand, is_first_move=True)[0]
+
+
+class TestDeduplicateMoves:
+    """Test that generated moves are free of reordered duplicates."""
+
+    def test_drops_reordered_placements(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.DIAMOND, Color.RED))
+        board.place((0, 1), Tile(Shape.STAR, Color.RED))
+        hand = Hand([Tile(Shape.CIRCLE, Color.RED), Tile(Shape.SQUARE, Color.RED)])
+
+        moves = generate_multi_tile_moves(board, hand, is_first_move=False)
+        keys = [_move_key(m) for m in moves]
+
+        # Both cells below the row touch the board, so the line under it
+        # is reached from two start positions but kept once
+        below = Move(
+            [((1, 0), Tile(Shape.CIRCLE, Color.RED)), ((1, 1), Tile(Shape.SQUARE, Color.RED))],
+            score=0, qwirkles=0,
+        )
+        assert keys.count(_move_key(below)) == 1
+        assert len(keys) == len(set(keys))
+
+    def test_keeps_distinct_tiles_at_same_positions(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.PURPLE))
+        red = Tile(Shape.CIRCLE, Color.RED)
+        blue = Tile(Shape.CIRCLE, Color.BLUE)
+
+        moves = generate_all_moves(board, Hand([red, blue]))
+
+        assert any(m.placements == [((0, 1), red)] for m in moves)
+        assert any(m.placements == [((0, 1), blue)] for m in moves)
+
 
 class TestGreedySolver:
     """Test greedy solver."""
@@ -223,6 +449,22 @@ class TestRandomSolver:
 
         assert move is None
 
+    def test_reuses_cached_moves_for_repeated_state(self):
+        state = new_game(seed=42)
+        solver = RandomSolver(seed=123)
+
+        solver.get_move(state)
+        solver.get_move(state.clone())
+
+        assert solver._move_cache.misses == 1
+        assert solver._move_cache.hits == 1
+
+    def test_cache_can_be_disabled(self):
+        solver = RandomSolver(seed=123, cache_size=0)
+
+        assert solver._move_cache is None
+        assert solver.get_move(new_game(seed=42)) is not None
+
 
 class TestWeightedRandomSolver:
     """Test weighted random solver."""
@@ -243,6 +485,90 @@ class TestWeightedRandomSolver:
 
         assert move is None
 
+    def test_favors_higher_scores(self):
+        tile = Tile(Shape.CIRCLE, Color.RED)
+        low = Move([((0, 0), tile)], score=0, qwirkles=0)
+        high = Move([((0, 1), tile)], score=9, qwirkles=0)
+
+        solver = WeightedRandomSolver(seed=7)
+        picks = [solver.select_move(None, [low, high]) for _ in range(500)]
+
+        # Expected share of the high move is 10/11
+        assert picks.count(high) > 400
+
+    def test_low_temperature_is_nearly_greedy(self):
+        tile = Tile(Shape.CIRCLE, Color.RED)
+        low = Move([((0, 0), tile)], score=1, qwirkles=0)
+        high = Move([((0, 1), tile)], score=9, qwirkles=0)
+
+        solver = WeightedRandomSolver(seed=7, temperature=0.1)
+        picks = [solver.select_move(None, [low, high]) for _ in range(200)]
+
+        assert all(p is high for p in picks)
+
+    def test_select_moves_batch(self):
+        tile = Tile(Shape.CIRCLE, Color.RED)
+        low = Move([((0, 0), tile)], score=0, qwirkles=0)
+        high = Move([((0, 1), tile)], score=9, qwirkles=0)
+
+        picks = WeightedRandomSolver(seed=7).select_moves_batch(None, [low, high], 500)
+        again = WeightedRandomSolver(seed=7).select_moves_batch(None, [low, high], 500)
+
+        assert len(picks) == 500
+        assert picks.count(high) > 400
+        assert picks == again
+
+    def test_select_moves_batch_without_moves(self):
+        assert WeightedRandomSolver(seed=7).select_moves_batch(None, [], 10) == []
+
+    def test_top_k_limits_candidates(self):
+        state = new_game(seed=42)
+        top = generate_all_moves(state.board, state.hands[0], is_first_move=True)[:3]
+
+        solver = WeightedRandomSolver(seed=7, top_k=3, cache_size=0)
+        picks = [solver.get_move(state) for _ in range(50)]
+
+        assert all(p in top for p in picks)
+
+
+class TestMonteCarloRollouts:
+    """Test root-parallel rollout move selection."""
+
+    def test_run_rollouts_visits_moves_round_robin(self):
+        state = new_game(seed=42)
+        moves = generate_all_moves(state.board, state.hands[0], is_first_move=True)[:3]
+
+        stats = run_rollouts(pickle.dumps((state, moves)), n=6, seed=1, max_turns=2)
+
+        assert set(stats) == {move_key(m) for m in moves}
+        assert all(visits == 2 for visits, _ in stats.values())
+
+    def test_select_move_sequential_is_deterministic(self):
+        state = new_game(seed=42)
+        moves = generate_all_moves(state.board, state.hands[0], is_first_move=True)[:4]
+
+        kwargs = dict(n_rollouts=8, seed=7, parallel=False, max_workers=2, max_turns=2)
+        first = select_move_parallel(state, moves, **kwargs)
+        second = select_move_parallel(state, moves, **kwargs)
+
+        assert first in moves
+        assert first == second
+
+    def test_parallel_matches_sequential(self):
+        state = new_game(seed=42)
+        moves = generate_all_moves(state.board, state.hands[0], is_first_move=True)[:4]
+
+        kwargs = dict(n_rollouts=8, seed=7, max_workers=2, max_turns=2)
+        sequential = select_move_parallel(state, moves, parallel=False, **kwargs)
+        parallel = select_move_parallel(state, moves, parallel=True, **kwargs)
+
+        assert parallel == sequential
+
+    def test_solver_returns_none_without_moves(self):
+        solver = MonteCarloSolver(n_rollouts=4, seed=1, parallel=False)
+
+        assert solver.select_move(new_game(seed=42), []) is None
+
 
 class TestConvenienceFunctions:
     """Test convenience functions with simple states."""
@@ -276,6 +602,51 @@ class TestConvenienceFunctions:
         assert move is not None
 
 
+class TestMoveCache:
+    """Test the move transposition table."""
+
+    def test_reuses_moves_for_same_position(self):
+        state = new_game(seed=42)
+        cache = MoveCache()
+        hand = state.hands[0]
+
+        first = cache.get_moves(state.board, hand, is_first_move=True)
+        second = cache.get_moves(state.board, hand.copy(), is_first_move=True)
+
+        assert second is first
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_matches_generate_all_moves(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        hand = Hand([Tile(Shape.SQUARE, Color.RED), Tile(Shape.CIRCLE, Color.BLUE)])
+
+        cached = MoveCache().get_moves(board, hand)
+
+        assert cached == generate_all_moves(board, hand)
+
+    def test_board_change_misses(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        hand = Hand([Tile(Shape.SQUARE, Color.RED)])
+        cache = MoveCache()
+
+        cache.get_moves(board, hand)
+        board.place((0, 1), Tile(Shape.DIAMOND, Color.RED))
+        moves = cache.get_moves(board, hand)
+
+        assert cache.misses == 2
+        assert all(m.placements[0][0] != (0, 1) for m in moves)
+
+    def test_evicts_least_recently_used(self):
+        cache = MoveCache(maxsize=1)
+        board = Board()
+        cache.get_moves(board, Hand([Tile(Shape.CIRCLE, Color.RED)]), True)
+        cache.get_moves(board, Hand([Tile(Shape.SQUARE, Color.RED)]), True)
+        assert len(cache) == 1
+
+
 class TestMoveDataclass:
     """Test Move dataclass."""
 
@@ -295,3 +666,33 @@ class TestMoveDataclass:
         repr_str = repr(move)
         assert "Move" in repr_str
         assert "score=5" in repr_str
+
+    def test_move_is_immutable(self):
+        placements = [((0, 0), Tile(Shape.CIRCLE, Color.RED))]
+        move = Move(placements, score=5, qwirkles=0)
+
+        with pytest.raises(AttributeError):
+            move.score = 10
+
+    def test_move_has_no_instance_dict(self):
+        move = Move([((0, 0), Tile(Shape.CIRCLE, Color.RED))], score=1, qwirkles=0)
+        assert not hasattr(move, "__dict__")
+
+    def test_move_stores_parallel_arrays(self):
+        placements = [
+            ((-3, 2), Tile(Shape.CIRCLE, Color.RED)),
+            ((-3, 3), Tile(Shape.SQUARE, Color.RED)),
+        ]
+        move = Move(placements, score=2, qwirkles=0)
+
+        assert list(move.rows) == [-3, -3]
+        assert list(move.cols) == [2, 3]
+        assert list(move.tile_ids) == [t.index() for _, t in placements]
+        assert move.placements == placements
+
+    def test_move_equality_and_pickle(self):
+        placements = [((0, 0), Tile(Shape.CIRCLE, Color.RED))]
+        move = Move(placements, score=1, qwirkles=0)
+
+        assert move == Move(list(placements), score=1, qwirkles=0)
+        assert pickle.loads(pickle.dumps(move)) == move
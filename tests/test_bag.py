@@ -1,5 +1,7 @@
 """Tests for Bag."""
 
+import random
+
 import pytest
 from src.models.tile import Color, Shape, Tile
 from src.models.bag import Bag
@@ -34,6 +36,13 @@ class TestBagCreation:
         bag2 = Bag(seed=42)
         assert bag1.peek() == bag2.peek()
 
+    def test_seeded_order_matches_shuffled_tile_list(self):
+        # Shuffling ids must consume the RNG exactly like shuffling Tiles
+        tiles = [Tile(shape, color) for shape in Shape for color in Color for _ in range(3)]
+        random.Random(99).shuffle(tiles)
+
+        assert Bag(seed=99).peek() == tiles
+
 
 class TestBagDraw:
     """Test drawing tiles from bag."""
@@ -98,6 +107,17 @@ class TestBagReturn:
         new_order = bag.peek()
         assert new_order != original_order
 
+    def test_return_after_draw_only_holds_undrawn_tiles(self):
+        bag = Bag(seed=42)
+        bag.draw(6)
+        kept = bag.draw(6)
+        rest = bag.peek()
+
+        bag.return_tiles(kept)
+        assert sorted(t.index() for t in bag.peek()) == sorted(
+            t.index() for t in rest + kept
+        )
+
 
 class TestBagState:
     """Test bag state queries."""
@@ -116,3 +136,75 @@ class TestBagState:
         peeked = bag.peek()
         peeked.clear()  # Modify the peeked list
         assert bag.remaining() == 108  # Bag unchanged
+
+
+class TestBagCopy:
+    """Test bag copying."""
+
+    def test_copy_has_same_order(self):
+        bag = Bag(seed=42)
+        copy = bag.copy()
+        assert copy.peek() == bag.peek()
+
+    def test_copy_rng_is_synced_but_independent(self):
+        bag = Bag(seed=42)
+        copy = bag.copy()
+
+        tiles = bag.draw(2)
+        bag.return_tiles(tiles)
+        copy_tiles = copy.draw(2)
+        copy.return_tiles(copy_tiles)
+
+        # Same RNG state before the reshuffle gives the same order after it
+        assert copy.peek() == bag.peek()
+
+
+class TestBagFromTiles:
+    """Test building a bag from explicit tiles."""
+
+    def test_draws_in_given_order(self):
+        tiles = [Tile(Shape.STAR, Color.RED), Tile(Shape.CIRCLE, Color.BLUE)]
+        bag = Bag.from_tiles(tiles, random.Random(1))
+
+        assert bag.remaining() == 2
+        assert bag.draw(2) == tiles
+
+    def test_replace_ids_reuses_bag(self):
+        tiles = [Tile(Shape.STAR, Color.RED), Tile(Shape.CIRCLE, Color.BLUE)]
+        bag = Bag(seed=42)
+        bag.draw(5)
+
+        bag.replace_ids([t.index() for t in tiles], random.Random(1))
+
+        assert bag.remaining() == 2
+        assert bag.draw(2) == tiles
+
+    def test_copies_share_rng_state_until_shuffle(self):
+        bag = Bag(seed=42)
+        first = bag.copy()
+        second = first.copy()
+
+        for b in (bag, first, second):
+            b.return_tiles(b.draw(3))
+
+        assert first.peek() == bag.peek()
+        assert second.peek() == bag.peek()
+
+    def test_copy_leaves_caller_rng_attached(self):
+        rng = random.Random(7)
+        bag = Bag.from_tiles([Tile(Shape.STAR, Color.RED)] * 4, rng)
+        bag.copy()
+        rng.random()
+
+        # The bag still draws from the caller's RNG, not a stale snapshot
+        assert bag._get_rng() is rng
+
+    def test_unshuffled_replace_draws_every_tile_once(self):
+        ids = [t.index() for t in Bag(seed=3).peek()[:10]]
+        bag = Bag(seed=42)
+
+        bag.replace_ids(ids, random.Random(1), shuffled=False)
+        drawn = bag.draw(4) + bag.draw(10)
+
+        assert sorted(t.index() for t in drawn) == sorted(ids)
+        assert bag.is_empty()
@@ -154,6 +154,25 @@ class TestBoardNeighbors:
 
         assert not board.has_neighbor((5, 5))
 
+    def test_touches_other_tiles(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((1, 1), Tile(Shape.SQUARE, Color.BLUE))
+        board.place((1, 2), Tile(Shape.SQUARE, Color.RED))
+
+        # The group's own tiles don't count as a connection
+        assert not board.touches_other_tiles([(1, 1), (1, 2)])
+        board.place((0, 1), Tile(Shape.CIRCLE, Color.BLUE))
+        assert board.touches_other_tiles([(1, 1), (1, 2)])
+
+    def test_touches_other_tiles_at_bias_edge(self):
+        board = Board()
+        board.place((-64, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((-64, 1), Tile(Shape.SQUARE, Color.RED))
+
+        assert board.touches_other_tiles([(-64, 0)])
+        assert not board.touches_other_tiles([(-64, 0), (-64, 1)])
+
 
 class TestBoardBounds:
     """Test bounding box calculation."""
@@ -242,6 +261,236 @@ class TestBoardQueries:
         assert set(all_tiles) == {((0, 0), t1), ((1, 2), t2)}
 
 
+class TestBoardFrontier:
+    """Test tracking of empty cells adjacent to tiles."""
+
+    def test_empty_board_has_no_frontier(self):
+        assert Board().frontier() == frozenset()
+
+    def test_place_updates_frontier(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        assert board.frontier() == {(-1, 0), (1, 0), (0, -1), (0, 1)}
+
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+        assert (0, 1) not in board.frontier()
+        assert (0, 2) in board.frontier()
+        assert len(board.frontier()) == 6
+
+    def test_remove_updates_frontier(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+
+        board.remove((0, 1))
+
+        assert board.frontier() == {(-1, 0), (1, 0), (0, -1), (0, 1)}
+
+    def test_has_neighbor_uses_frontier(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        assert board.has_neighbor((0, 1))
+        assert not board.has_neighbor((0, 2))
+        assert not board.has_neighbor((0, 0))
+
+    def test_copy_has_independent_frontier(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        copy = board.copy()
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+        assert (0, 1) in copy.frontier()
+
+
+class TestBoardVersion:
+    """Test the mutation counter."""
+
+    def test_place_bumps_version(self):
+        board = Board()
+        before = board.version()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        assert board.version() != before
+
+    def test_remove_bumps_version(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        before = board.version()
+        board.remove((0, 0))
+        assert board.version() != before
+
+    def test_remove_empty_keeps_version(self):
+        board = Board()
+        before = board.version()
+        board.remove((0, 0))
+        assert board.version() == before
+
+
+class TestBoardPlaceMany:
+    """Test temporary placement and undo."""
+
+    def test_undo_restores_board(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        before = (board.all_tiles(), board.frontier(), board.zobrist(), board.version())
+
+        token = board.place_many([
+            ((0, 1), Tile(Shape.SQUARE, Color.RED)),
+            ((0, 2), Tile(Shape.STAR, Color.RED)),
+        ])
+        assert board.tile_count() == 3
+        board.undo_many(token)
+
+        assert (board.all_tiles(), board.frontier(), board.zobrist(), board.version()) == before
+
+    def test_failed_place_many_rolls_back(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+
+        with pytest.raises(ValueError):
+            board.place_many([
+                ((0, 1), Tile(Shape.SQUARE, Color.RED)),
+                ((0, 0), Tile(Shape.STAR, Color.RED)),
+            ])
+
+        assert board.tile_count() == 1
+        assert board.is_empty((0, 1))
+
+    def test_temporarily_placed_undoes_on_error(self):
+        board = Board()
+
+        with pytest.raises(RuntimeError):
+            with board.temporarily_placed([((0, 0), Tile(Shape.CIRCLE, Color.RED))]):
+                assert board.tile_count() == 1
+                raise RuntimeError("boom")
+
+        assert board.is_board_empty()
+
+    def test_versions_not_reused_after_undo(self):
+        board = Board()
+        token = board.place_many([((0, 0), Tile(Shape.CIRCLE, Color.RED))])
+        temporary = board.version()
+        board.undo_many(token)
+
+        board.place((5, 5), Tile(Shape.SQUARE, Color.BLUE))
+        assert board.version() != temporary
+
+
+class TestBoardTileIds:
+    """Test compact tile id storage."""
+
+    def test_get_id_matches_tile_index(self):
+        board = Board()
+        tile = Tile(Shape.STAR, Color.PURPLE)
+        board.place((1, 2), tile)
+
+        assert board.get_id((1, 2)) == tile.index()
+        assert board.get_id((0, 0)) is None
+
+    def test_round_trips_tiles(self):
+        board = Board()
+        tile = Tile(Shape.CLOVER, Color.GREEN)
+        board.place((0, 0), tile)
+
+        assert board.get((0, 0)) == tile
+        assert board.all_tiles() == [((0, 0), tile)]
+        assert board.remove((0, 0)) == tile
+
+    def test_tile_ids_lists_placed_ids(self):
+        board = Board()
+        tiles = [Tile(Shape.STAR, Color.RED), Tile(Shape.STAR, Color.BLUE)]
+        board.place((0, 0), tiles[0])
+        board.place((0, 1), tiles[1])
+
+        assert sorted(board.tile_ids()) == sorted(t.index() for t in tiles)
+
+
+class TestBoardLineExtent:
+    """Test run lookups from the occupancy bitmasks."""
+
+    def test_run_through_occupied_cell(self):
+        board = Board()
+        for col in range(-2, 2):
+            board.place((0, col), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 3), Tile(Shape.SQUARE, Color.RED))
+
+        assert board.line_extent((0, 0), horizontal=True) == (-2, 1)
+        assert board.line_extent((0, 3), horizontal=True) == (3, 3)
+        assert board.line_extent((0, 0), horizontal=False) == (0, 0)
+
+    def test_empty_cell_gives_run_ending_before_it(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((1, 0), Tile(Shape.CIRCLE, Color.BLUE))
+
+        assert board.line_extent((2, 0), horizontal=False) == (0, 1)
+        assert board.line_extent((5, 5), horizontal=True) == (5, 4)
+
+    def test_line_tiles(self):
+        board = Board()
+        red = Tile(Shape.CIRCLE, Color.RED)
+        blue = Tile(Shape.CIRCLE, Color.BLUE)
+        board.place((0, 0), red)
+        board.place((1, 0), blue)
+
+        assert board.line_tiles((1, 0), horizontal=False) == [((0, 0), red), ((1, 0), blue)]
+        assert board.line_tiles((0, 0), horizontal=True) == [((0, 0), red)]
+        assert board.line_tiles((5, 5), horizontal=True) == []
+
+    def test_far_negative_positions(self):
+        board = Board()
+        board.place((-500, -500), Tile(Shape.CIRCLE, Color.RED))
+        board.place((-500, -499), Tile(Shape.SQUARE, Color.RED))
+        board.place((3, 4), Tile(Shape.STAR, Color.RED))
+
+        assert board.line_extent((-500, -499), horizontal=True) == (-500, -499)
+        assert board.line_extent((3, 4), horizontal=True) == (4, 4)
+
+    def test_remove_splits_run(self):
+        board = Board()
+        for col in range(3):
+            board.place((0, col), Tile(Shape.CIRCLE, Color.RED))
+        board.remove((0, 1))
+
+        assert board.line_extent((0, 2), horizontal=True) == (2, 2)
+        assert board.copy().line_extent((0, 0), horizontal=True) == (0, 0)
+
+
+class TestBoardZobrist:
+    """Test incremental board hashing."""
+
+    def test_empty_board_hash_is_zero(self):
+        assert Board().zobrist() == 0
+
+    def test_hash_independent_of_placement_order(self):
+        a, b = Board(), Board()
+        red_circle = Tile(Shape.CIRCLE, Color.RED)
+        red_square = Tile(Shape.SQUARE, Color.RED)
+        a.place((0, 0), red_circle)
+        a.place((0, 1), red_square)
+        b.place((0, 1), red_square)
+        b.place((0, 0), red_circle)
+        assert a.zobrist() == b.zobrist()
+
+    def test_hash_depends_on_tile_and_position(self):
+        a, b, c = Board(), Board(), Board()
+        a.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        b.place((0, 0), Tile(Shape.CIRCLE, Color.BLUE))
+        c.place((0, 1), Tile(Shape.CIRCLE, Color.RED))
+        assert len({a.zobrist(), b.zobrist(), c.zobrist()}) == 3
+
+    def test_remove_restores_hash(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        before = board.zobrist()
+        board.place((-3, 5), Tile(Shape.STAR, Color.GREEN))
+        board.remove((-3, 5))
+        assert board.zobrist() == before
+
+    def test_copy_keeps_hash(self):
+        board = Board()
+        board.place((2, -1), Tile(Shape.CROSS, Color.PURPLE))
+        assert board.copy().zobrist() == board.zobrist()
+
+
 class TestBoardCopy:
     """Test board copying."""
 
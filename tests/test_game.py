@@ -10,6 +10,9 @@ from src.engine.game import (
     new_game,
     apply_move,
     apply_swap,
+    check_move,
+    commit_move,
+    check_swap,
     get_current_hand,
     get_current_score,
     can_play,
@@ -82,6 +85,24 @@ class TestGameStateClone:
         assert clone.scores[0] == 0
         assert clone.current_player == 0
 
+    def test_clone_hands_are_independent(self):
+        state = new_game(seed=42)
+        clone = state.clone()
+
+        state.hands[0].remove([state.hands[0].tiles()[0]])
+
+        assert len(clone.hands[0]) == 6
+
+    def test_zobrist_includes_player_to_move(self):
+        state = new_game(seed=42)
+        before = state.zobrist()
+        state.current_player = 1
+        assert state.zobrist() != before
+        assert state.clone().zobrist() == state.zobrist()
+
+    def test_state_has_no_instance_dict(self):
+        assert not hasattr(new_game(seed=42), "__dict__")
+
     def test_clone_board_is_independent(self):
         state = new_game(seed=42)
         tile = Tile(Shape.CIRCLE, Color.RED)
@@ -110,6 +131,39 @@ class TestGameStateClone:
         assert clone.hands[0].tiles() == original_tiles
 
 
+class TestGameStateResetFrom:
+    """Test resetting a scratch state in place."""
+
+    def test_reset_restores_source(self):
+        state = new_game(seed=42)
+        scratch = state.clone()
+
+        tile = scratch.hands[0].tiles()[0]
+        apply_move(scratch, [((0, 0), tile)])
+        scratch.reset_from(state)
+
+        assert scratch.board.is_board_empty()
+        assert scratch.board.zobrist() == state.board.zobrist()
+        assert [h.tiles() for h in scratch.hands] == [h.tiles() for h in state.hands]
+        assert scratch.bag.peek() == state.bag.peek()
+        assert scratch.scores == state.scores
+        assert scratch.current_player == state.current_player
+        assert scratch.turn_number == state.turn_number
+
+    def test_reset_reuses_containers_and_stays_independent(self):
+        state = new_game(seed=42)
+        scratch = state.clone()
+        board, hands, scores = scratch.board, scratch.hands, scratch.scores
+
+        scratch.reset_from(state)
+        scratch.scores[0] = 100
+        scratch.board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+
+        assert scratch.board is board and scratch.hands is hands and scratch.scores is scores
+        assert state.scores[0] == 0
+        assert state.board.is_board_empty()
+
+
 class TestApplyMove:
     """Test move application."""
 
@@ -214,6 +268,45 @@ class TestApplyMove:
         assert "connect" in error.lower()
 
 
+class TestCheckAndCommit:
+    """Test validating a move or swap before applying it."""
+
+    def test_check_move_leaves_state_unchanged(self):
+        state = new_game(seed=42)
+        tile = state.hands[0].tiles()[0]
+
+        valid, error, points, qwirkles = check_move(state, [((0, 0), tile)])
+
+        assert valid and error == ""
+        assert (points, qwirkles) == (1, 0)
+        assert state.board.is_board_empty()
+        assert len(state.hands[0]) == 6
+
+    def test_check_then_commit_matches_apply_move(self):
+        state = new_game(seed=42)
+        other = state.clone()
+        placements = [((0, 0), state.hands[0].tiles()[0])]
+
+        _, _, points, qwirkles = check_move(state, placements)
+        commit_move(state, placements, points, qwirkles)
+        apply_move(other, placements)
+
+        assert state.board.all_tiles() == other.board.all_tiles()
+        assert state.scores == other.scores
+        assert state.current_player == other.current_player
+        assert state.hands[0].tiles() == other.hands[0].tiles()
+
+    def test_check_rejects_tile_not_in_hand(self):
+        state = new_game(seed=42)
+        missing = next(
+            Tile(shape, color) for shape in Shape for color in Color
+            if Tile(shape, color) not in state.hands[0]
+        )
+
+        assert not check_move(state, [((0, 0), missing)])[0]
+        assert not check_swap(state, [missing])[0]
+
+
 class TestApplySwap:
     """Test tile swapping."""
 
@@ -102,6 +102,14 @@ class TestHandRemove:
 
         assert tile_a in hand  # A should still be there
 
+    def test_remove_more_copies_than_held_raises(self):
+        tile = Tile(Shape.CIRCLE, Color.RED)
+        hand = Hand([tile, Tile(Shape.SQUARE, Color.BLUE)])
+
+        with pytest.raises(ValueError, match="not in hand"):
+            hand.remove([tile, tile])
+        assert hand.count(tile) == 1
+
 
 class TestHandRefill:
     """Test refilling hand from bag."""
@@ -152,6 +160,15 @@ class TestHandQueries:
         tiles.clear()
         assert hand.size() == 1
 
+    def test_first_tile(self):
+        tiles = [Tile(Shape.STAR, Color.BLUE), Tile(Shape.CIRCLE, Color.RED)]
+        hand = Hand(tiles)
+        assert hand.first_tile() == tiles[0]
+
+    def test_first_tile_empty_raises(self):
+        with pytest.raises(IndexError):
+            Hand().first_tile()
+
     def test_contains(self):
         tile = Tile(Shape.CIRCLE, Color.RED)
         other = Tile(Shape.SQUARE, Color.BLUE)
@@ -184,3 +201,38 @@ class TestHandQueries:
         hand = Hand(tiles)
         iterated = list(hand)
         assert iterated == tiles
+
+    def test_tile_ids(self):
+        tiles = [
+            Tile(Shape.CIRCLE, Color.RED),
+            Tile(Shape.SQUARE, Color.BLUE),
+        ]
+        hand = Hand(tiles)
+        assert list(hand.tile_ids()) == [t.index() for t in tiles]
+
+    def test_counts_ignore_order(self):
+        red = Tile(Shape.CIRCLE, Color.RED)
+        blue = Tile(Shape.SQUARE, Color.BLUE)
+        hand = Hand([red, blue, red])
+
+        counts = hand.counts()
+        assert len(counts) == 36
+        assert counts[red.index()] == 2
+        assert counts[blue.index()] == 1
+        assert counts == Hand([blue, red, red]).counts()
+
+    def test_replace_ids_resets_counts(self):
+        red = Tile(Shape.CIRCLE, Color.RED)
+        blue = Tile(Shape.SQUARE, Color.BLUE)
+        hand = Hand([red, red])
+
+        hand.replace_ids([blue.index()])
+
+        assert hand.tiles() == [blue]
+        assert hand.counts() == Hand([blue]).counts()
+        with pytest.raises(ValueError):
+            hand.replace_ids([blue.index()] * 7)
+
+        # A rejected replacement leaves the hand as it was
+        assert hand.tiles() == [blue]
+        assert hand.counts() == Hand([blue]).counts()
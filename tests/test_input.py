@@ -12,6 +12,7 @@ from src.ui.input import (
     UndoCommand,
     HintCommand,
     HelpCommand,
+    ProbCommand,
 )
 
 
@@ -39,6 +40,12 @@ class TestParsePosition:
         assert parse_position("1,2,3") is None
         assert parse_position("") is None
 
+    def test_parse_rejects_loose_int_forms(self):
+        assert parse_position("+1,2") is None
+        assert parse_position("1, 2") is None
+        assert parse_position("1_0,2") is None
+        assert parse_position("--1,2") is None
+
 
 class TestParseTileSpec:
     """Test tile specification parsing."""
@@ -174,6 +181,16 @@ class TestParsePlayCommand:
         assert cmd is None
         assert "Mismatch" in error
 
+    def test_index_pair_before_positions(self):
+        cmd, error = parse_command("play 1,2 3,4 0,0")
+        assert isinstance(cmd, PlayCommand)
+        assert cmd.placements == [(1, (3, 4)), (2, (0, 0))]
+
+    def test_index_after_positions_error(self):
+        cmd, error = parse_command("play 1 0,0 2")
+        assert cmd is None
+        assert "Invalid position" in error
+
     def test_invalid_index_error(self):
         cmd, error = parse_command("play 0 0,0")
         assert cmd is None
@@ -220,6 +237,25 @@ class TestParseSwapCommand:
         assert "1-6" in error
 
 
+class TestParseProbCommand:
+    """Test win probability command parsing."""
+
+    def test_simulation_count(self):
+        cmd, error = parse_command("prob 100")
+        assert cmd == ProbCommand(100)
+        assert error == ""
+
+    def test_time_budget(self):
+        cmd, error = parse_command("prob 2.5s")
+        assert cmd == ProbCommand(50, time_budget_s=2.5)
+        assert error == ""
+
+    def test_time_budget_out_of_range(self):
+        cmd, error = parse_command("prob 60s")
+        assert cmd is None
+        assert "time budget" in error.lower()
+
+
 class TestParseInvalidCommand:
     """Test invalid command handling."""
 
@@ -0,0 +1,153 @@
+"""Tests for the game recorder."""
+
+import pickle
+
+import pytest
+from src.models.tile import Color, Shape, Tile
+from src.models.board import Board
+from src.sim.recorder import (
+    ActionRecord,
+    GameTrajectory,
+    StateSnapshot,
+    Transition,
+    iter_trajectories,
+    load_trajectories,
+    record_batch,
+    record_game,
+    save_trajectories,
+    trajectories_to_numpy,
+    _board_to_grid,
+    _pack_hand,
+    _unpack_hand,
+)
+
+
+def _trajectory_with_board(board: Board, hand: int = 0) -> GameTrajectory:
+    """Wrap a one-transition trajectory around a board snapshot."""
+    grid, overflow = _board_to_grid(board)
+    state = StateSnapshot(
+        turn=1,
+        player=0,
+        board=grid,
+        hand=hand,
+        scores=(0, 0),
+        bag_remaining=0,
+        overflow=overflow,
+    )
+    return GameTrajectory(
+        seed=0,
+        transitions=[Transition(state, ActionRecord(action_type="pass"), 0.0)],
+        winner=None,
+        final_scores=(0, 0),
+        p0_strategy="greedy",
+        p1_strategy="greedy",
+    )
+
+
+class TestSnapshotBoard:
+    """Test board storage in snapshots."""
+
+    @pytest.mark.parametrize("format", ["pickle", "json"])
+    def test_off_window_tile_round_trips(self, tmp_path, format):
+        board = Board()
+        board.place((0, 10), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 11), Tile(Shape.CROSS, Color.PURPLE))
+        path = tmp_path / "trajectories"
+
+        save_trajectories([_trajectory_with_board(board)], str(path), format)
+        [loaded] = load_trajectories(str(path), format)
+
+        state = loaded.transitions[0].state
+        assert state.overflow == ((0, 11, Tile(Shape.CROSS, Color.PURPLE).index()),)
+        assert state.board == _board_to_grid(board)[0]
+
+    def test_numpy_crops_off_window_tiles(self):
+        pytest.importorskip("numpy")
+        board = Board()
+        board.place((0, 10), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 11), Tile(Shape.CIRCLE, Color.BLUE))
+
+        boards = trajectories_to_numpy([_trajectory_with_board(board)])['boards']
+
+        assert (boards[0] != 0).any(axis=-1).sum() == 1
+        assert tuple(boards[0, 10, 20]) == (1, 1)
+
+
+class TestPackedHand:
+    """Test the 6-bit packed hand encoding."""
+
+    @pytest.mark.parametrize("ids", [[], [0], [35], [7, 35, 0], [35] * 6, list(range(30, 36))])
+    def test_round_trip(self, ids):
+        assert _unpack_hand(_pack_hand(ids)) == [divmod(i, 6) for i in ids]
+
+    def test_numpy_hands_after_json_round_trip(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        trajectories = [
+            _trajectory_with_board(Board(), _pack_hand(ids))
+            for ids in ([35, 0, 17], [35] * 6, [])
+        ]
+        path = tmp_path / "trajectories.json"
+
+        save_trajectories(trajectories, str(path), "json")
+        loaded = trajectories_to_numpy(load_trajectories(str(path), "json"))['hands']
+        direct = trajectories_to_numpy(trajectories)['hands']
+
+        np.testing.assert_array_equal(loaded, direct)
+        assert tuple(direct[0, 0]) == (6, 6)  # id 35: shape 5, color 5, stored +1
+        assert not direct[0, 3:].any()
+        assert not direct[2].any()
+
+
+class TestSnapshotEvery:
+    """Test recording a thinned trajectory."""
+
+    def test_rejects_values_below_one(self):
+        with pytest.raises(ValueError):
+            record_game(0, snapshot_every=0)
+
+    def test_keeps_only_multiples(self):
+        full = record_game(1)
+        thinned = record_game(1, snapshot_every=3)
+
+        assert [t.state.turn for t in thinned.transitions] == [
+            t.state.turn for t in full.transitions if t.state.turn % 3 == 0
+        ]
+        assert thinned.final_scores == full.final_scores
+
+    def test_outcome_bonus_goes_to_last_ten_recorded(self):
+        full = record_game(1)
+        thinned = record_game(1, snapshot_every=3)
+        assert thinned.winner is not None
+
+        def bonus(player):
+            return 1.0 if player == thinned.winner else -0.5
+
+        # Per-turn rewards before the outcome adjustment
+        base = {
+            t.state.turn: t.reward - (i >= len(full.transitions) - 10) * bonus(t.state.player)
+            for i, t in enumerate(full.transitions)
+        }
+        cutoff = len(thinned.transitions) - 10
+        for i, t in enumerate(thinned.transitions):
+            expected = base[t.state.turn] + (i >= cutoff) * bonus(t.state.player)
+            assert t.reward == pytest.approx(expected)
+
+
+class TestRecordBatchSink:
+    """Test streaming recorded games to a sink."""
+
+    def test_pickle_sink_streams_in_game_order(self, tmp_path):
+        path = tmp_path / "games.pkl"
+
+        with open(path, "wb") as f:
+            result = record_batch(
+                3, base_seed=5, parallel=False,
+                sink=lambda t: pickle.dump(t, f, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+
+        streamed = list(iter_trajectories(str(path)))
+        collected = record_batch(3, base_seed=5, parallel=False)
+
+        assert result == []
+        assert [t.seed for t in streamed] == [5, 6, 7]
+        assert [t.final_scores for t in streamed] == [t.final_scores for t in collected]
@@ -194,6 +194,21 @@ class TestIsValidLine:
         ]
         assert is_valid_line(tiles) is False  # Fails duplicate check
 
+    def test_all_pairs_match_definition(self):
+        tiles = [Tile(shape, color) for shape in Shape for color in Color]
+        for a in tiles:
+            for b in tiles:
+                expected = (a.color == b.color) != (a.shape == b.shape)
+                assert is_valid_line([a, b]) is expected
+
+    def test_mixed_after_shared_prefix_invalid(self):
+        tiles = [
+            Tile(Shape.CIRCLE, Color.RED),
+            Tile(Shape.SQUARE, Color.RED),
+            Tile(Shape.SQUARE, Color.BLUE),
+        ]
+        assert is_valid_line(tiles) is False
+
 
 class TestArePositionsCollinear:
     """Test collinearity checking."""
@@ -251,6 +266,11 @@ class TestArePositionsContiguous:
         positions = [(0, 2), (0, 0), (0, 1)]
         assert are_positions_contiguous(positions, 'row') is True
 
+    def test_duplicate_spanning_gap_not_contiguous(self):
+        # Span matches the count, but column 1 is missing
+        positions = [(0, 0), (0, 0), (0, 2)]
+        assert are_positions_contiguous(positions, 'row') is False
+
 
 class TestGetAffectedLines:
     """Test finding all lines affected by a move."""
@@ -8,10 +8,12 @@ from src.engine.scoring import (
     calculate_move_score,
     calculate_end_game_bonus,
     score_move,
+    validate_and_score,
     QWIRKLE_SIZE,
     QWIRKLE_BONUS,
     END_GAME_BONUS,
 )
+from src.engine._kernels import score_lines
 
 
 class TestCalculateLineScore:
@@ -43,6 +45,18 @@ class TestCalculateLineScore:
         assert END_GAME_BONUS == 6
 
 
+class TestScoreLines:
+    """Test scoring a move from its line lengths."""
+
+    def test_no_lines(self):
+        assert score_lines([]) == (0, 0)
+
+    def test_matches_line_scores(self):
+        lengths = [2, 6, 3, 6]
+        expected = sum(calculate_line_score(n) for n in lengths)
+        assert score_lines(lengths) == (expected, 2)
+
+
 class TestCalculateMoveScore:
     """Test scoring after tiles are placed on board."""
 
@@ -192,6 +206,48 @@ class TestScoreMove:
         assert board.get((0, 1)) is None
         assert board.tile_count() == 1
 
+    def test_original_board_state_restored(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        frontier = board.frontier()
+        zobrist = board.zobrist()
+        version = board.version()
+
+        score_move(board, [((0, 1), Tile(Shape.SQUARE, Color.RED))])
+
+        assert board.frontier() == frontier
+        assert board.zobrist() == zobrist
+        assert board.version() == version
+        assert board.line_extent((0, 0), horizontal=True) == (0, 0)
+
+
+class TestValidateAndScore:
+    """Test combined validation and scoring."""
+
+    def test_valid_move_scored(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+        board.place((0, 1), Tile(Shape.SQUARE, Color.RED))
+
+        placements = [((0, 2), Tile(Shape.DIAMOND, Color.RED))]
+        assert validate_and_score(board, placements) == (True, "", 3, 0)
+        assert board.tile_count() == 2
+
+    def test_single_tile_first_move(self):
+        board = Board()
+        placements = [((0, 0), Tile(Shape.CIRCLE, Color.RED))]
+        assert validate_and_score(board, placements, is_first_move=True) == (True, "", 1, 0)
+
+    def test_invalid_move_scores_zero(self):
+        board = Board()
+        board.place((0, 0), Tile(Shape.CIRCLE, Color.RED))
+
+        placements = [((0, 1), Tile(Shape.SQUARE, Color.BLUE))]
+        valid, error, score, qwirkles = validate_and_score(board, placements)
+        assert not valid
+        assert error
+        assert (score, qwirkles) == (0, 0)
+
 
 class TestEndGameBonus:
     """Test end-game bonus."""
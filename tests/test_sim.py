@@ -11,6 +11,8 @@ from src.sim.runner import (
     run_game,
     run_batch,
 )
+import src.sim.stats as stats_module
+import src.sim.win_prob as win_prob_module
 from src.sim.stats import (
     AggregateStats,
     compute_stats,
@@ -20,7 +22,12 @@ from src.sim.win_prob import (
     WinProbability,
     get_unseen_tiles,
     estimate_win_probability,
+    TIE,
+    _outcome,
+    _play_out,
 )
+from src.ai.move_gen import _move_key, generate_all_moves
+from src.sim.mcts import Node, _select
 
 
 class TestRunGame:
@@ -118,6 +125,26 @@ class TestComputeStats:
         assert 0 <= stats.p0_win_rate <= 100
         assert 0 <= stats.p1_win_rate <= 100
 
+    def test_numpy_path_matches_pure_python(self, monkeypatch):
+        pytest.importorskip("numpy")
+        results = [
+            GameResult(
+                winner=(None, 0, 1)[i % 3],
+                scores=(100 + i % 37, 90 + i % 53),
+                turns=40 + i % 11,
+                qwirkles=(i % 3, i % 2),
+                max_turn_score=10 + i % 17,
+            )
+            for i in range(300)
+        ]
+
+        fast = compute_stats(results)
+        monkeypatch.setattr(stats_module, "NUMPY_MIN_RESULTS", len(results) + 1)
+        slow = compute_stats(results)
+
+        for name in AggregateStats.__dataclass_fields__:
+            assert getattr(fast, name) == pytest.approx(getattr(slow, name))
+
 
 class TestFormatStats:
     """Test stats formatting."""
@@ -184,6 +211,55 @@ class TestEstimateWinProbability:
         assert 0.0 <= prob.p1_prob <= 1.0
         assert prob.n_simulations == 10
 
+    def test_parallel_matches_sequential(self):
+        state = new_game(seed=42)
+        kwargs = dict(n_simulations=4, solver_type="random", seed=7, max_workers=2)
+
+        parallel = estimate_win_probability(state, viewer=0, parallel=True, **kwargs)
+        sequential = estimate_win_probability(state, viewer=0, parallel=False, **kwargs)
+
+        assert parallel == sequential
+
+    def test_time_budget_counts_simulations_run(self):
+        state = new_game(seed=42)
+        prob = estimate_win_probability(
+            state, viewer=0, seed=123, parallel=False, time_budget=0.01
+        )
+
+        assert prob.n_simulations >= 1
+        total = prob.p0_prob + prob.p1_prob + prob.tie_prob
+        assert abs(total - 1.0) < 0.01
+
+    def test_importance_sampling_reports_effective_samples(self):
+        state = new_game(seed=42)
+        prob = estimate_win_probability(
+            state, viewer=0, n_simulations=4, solver_type="random",
+            seed=123, parallel=False, importance_sampling=True,
+        )
+
+        total = prob.p0_prob + prob.p1_prob + prob.tie_prob
+        assert abs(total - 1.0) < 0.01
+        assert 0 < prob.effective_samples <= prob.n_simulations + 1e-9
+
+    def test_tree_search_is_reproducible(self):
+        state = new_game(seed=42)
+        kwargs = dict(n_simulations=3, seed=5, parallel=False, tree_search=True)
+
+        first = estimate_win_probability(state, viewer=0, **kwargs)
+        second = estimate_win_probability(state, viewer=0, **kwargs)
+
+        assert first == second
+        assert first.n_simulations == 3
+        assert abs(first.p0_prob + first.p1_prob + first.tie_prob - 1.0) < 0.01
+
+    def test_tree_search_rejects_importance_sampling(self):
+        state = new_game(seed=42)
+        with pytest.raises(ValueError):
+            estimate_win_probability(
+                state, viewer=0, n_simulations=1,
+                importance_sampling=True, tree_search=True,
+            )
+
     def test_probability_confidence(self):
         state = new_game(seed=42)
         prob = estimate_win_probability(state, viewer=0, n_simulations=100, seed=123)
@@ -192,6 +268,72 @@ class TestEstimateWinProbability:
         assert prob.confidence < 1
 
 
+class TestOutcome:
+    """Test rollout outcome indexing."""
+
+    def test_outcome_indexes_winner_or_tie(self):
+        state = new_game(seed=42)
+        expected = {(5, 3): 0, (3, 5): 1, (4, 4): TIE}
+        for scores, outcome in expected.items():
+            state.scores = list(scores)
+            assert _outcome(state) == outcome
+
+
+class TestPlayOut:
+    """Test rollout playouts."""
+
+    def test_stops_once_lead_is_unreachable(self):
+        state = new_game(seed=42)
+        state.scores = [5000, 0]
+
+        _play_out(state, GreedySolver(), max_turns=100)
+
+        # One move is played, then the lead is out of reach
+        assert state.turn_number == 2
+        assert not state.game_over
+        assert _outcome(state) == 0
+
+    @pytest.mark.parametrize("lead", [60, 120, 180])
+    def test_cutoff_keeps_greedy_outcome(self, monkeypatch, lead):
+        state = new_game(seed=7)
+        state.scores = [lead, 0]
+        full = state.clone()
+
+        _play_out(state, GreedySolver(), max_turns=200)
+        # A per-tile maximum no lead can exceed disables the cutoff
+        monkeypatch.setattr(win_prob_module, "_MAX_POINTS_PER_TILE", 10**9)
+        _play_out(full, GreedySolver(), max_turns=200)
+
+        assert full.game_over
+        assert _outcome(state) == _outcome(full)
+
+
+class TestTreeSelect:
+    """Test UCB move selection at the search root."""
+
+    def _moves(self):
+        state = new_game(seed=42)
+        return generate_all_moves(state.board, state.hands[0], True, top_k=2)
+
+    def test_expands_unvisited_moves_in_order(self):
+        root = Node()
+        moves = self._moves()
+
+        assert _select(root, moves, 0) is moves[0]
+        assert all(child.available == 1 for child in root.children.values())
+
+    def test_prefers_higher_win_share(self):
+        root = Node()
+        moves = self._moves()
+        _select(root, moves, 0)
+        for move, wins in zip(moves, (1.0, 9.0)):
+            child = root.children[_move_key(move)]
+            child.visits = 10
+            child.wins = [wins, 10.0 - wins]
+
+        assert _select(root, moves, 0) is moves[1]
+
+
 class TestWinProbabilityDataclass:
     """Test WinProbability dataclass."""
 
@@ -213,12 +355,12 @@ class TestGameResultDataclass:
     def test_creation(self):
         result = GameResult(
             winner=0,
-            scores=[50, 40],
+            scores=(50, 40),
             turns=30,
-            qwirkles=[1, 0],
+            qwirkles=(1, 0),
             max_turn_score=12,
             max_turn_player=0
         )
 
         assert result.winner == 0
-        assert result.scores == [50, 40]
+        assert result.scores == (50, 40)
@@ -1,7 +1,10 @@
 """Tests for Tile, Color, and Shape."""
 
+import copy
+import pickle
+
 import pytest
-from src.models.tile import Color, Shape, Tile
+from src.models.tile import Color, Shape, Tile, TILE_BY_ID
 
 
 class TestEnums:
@@ -70,3 +73,40 @@ class TestTile:
         # 6 shapes x 6 colors = 36 unique tiles
         all_tiles = {Tile(shape, color) for shape in Shape for color in Color}
         assert len(all_tiles) == 36
+
+    def test_index_is_unique_per_tile_type(self):
+        indices = {Tile(shape, color).index() for shape in Shape for color in Color}
+        assert indices == set(range(36))
+
+    def test_index_equal_for_equal_tiles(self):
+        assert Tile(Shape.STAR, Color.BLUE).index() == Tile(Shape.STAR, Color.BLUE).index()
+
+    def test_hash_matches_index(self):
+        tile = Tile(Shape.CLOVER, Color.ORANGE)
+        assert hash(tile) == tile.index()
+
+    def test_not_equal_to_other_types(self):
+        assert Tile(Shape.CIRCLE, Color.RED) != (Shape.CIRCLE, Color.RED)
+
+    def test_from_index_round_trips(self):
+        for shape in Shape:
+            for color in Color:
+                tile = Tile(shape, color)
+                assert Tile.from_index(tile.index()) == tile
+        assert len(TILE_BY_ID) == 36
+
+    def test_attribute_indices(self):
+        tile = Tile(Shape.STAR, Color.BLUE)
+        assert tile.shape_idx == list(Shape).index(Shape.STAR)
+        assert tile.color_idx == list(Color).index(Color.BLUE)
+        assert tile.index() == tile.shape_idx * 6 + tile.color_idx
+
+    def test_tiles_are_interned(self):
+        tile = Tile(Shape.STAR, Color.BLUE)
+        assert Tile(Shape.STAR, Color.BLUE) is tile
+        assert TILE_BY_ID[tile.index()] is tile
+
+    def test_pickle_and_copy_keep_shared_instance(self):
+        tile = Tile(Shape.CROSS, Color.YELLOW)
+        assert pickle.loads(pickle.dumps(tile)) is tile
+        assert copy.deepcopy(tile) is tile